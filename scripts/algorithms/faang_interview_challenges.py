@@ -8,7 +8,7 @@ These questions bridge the gap between "Algorithms" and "Systems".
 They test if you can write efficient code for practical Ops problems.
 
 CHALLENGES:
-1. Rate Limiter (Sliding Window Log)
+1. Rate Limiter (Sliding Window Log; Token Bucket, GCRA, Sliding Window Counter)
 2. Merge K Sorted Log Streams (Heap)
 3. Valid Configuration Brackets (Stack)
 4. Top K Frequent IPs (Counter + Heap)
@@ -17,6 +17,7 @@ CHALLENGES:
 
 import heapq
 import collections
+import threading
 import time
 from collections import deque
 
@@ -32,27 +33,150 @@ class RateLimiter:
     - Store timestamps of successful requests in a Queue (Deque).
     - On new request, remove timestamps older than (Now - M).
     - If len(queue) < N, allow. Else, reject.
+
+    Memory: O(N) per key (one deque entry per admitted request). The engines
+    below keep O(1) state per key; all of them are thread-safe.
     """
     def __init__(self, limit, window_seconds):
         self.limit = limit
         self.window_seconds = window_seconds
         self.requests = deque()
+        self._lock = threading.Lock()
 
     def allow_request(self, timestamp=None):
-        if timestamp is None:
-            timestamp = time.time()
-            
-        # 1. Clean up old requests (Slide the window)
-        # While the oldest request is outside the window...
-        while self.requests and self.requests[0] <= timestamp - self.window_seconds:
-            self.requests.popleft()
-            
-        # 2. Check Capacity
-        if len(self.requests) < self.limit:
-            self.requests.append(timestamp)
+        with self._lock:
+            if timestamp is None:
+                timestamp = time.time()
+
+            # 1. Clean up old requests (Slide the window)
+            # While the oldest request is outside the window...
+            while self.requests and self.requests[0] <= timestamp - self.window_seconds:
+                self.requests.popleft()
+
+            # 2. Check Capacity
+            if len(self.requests) < self.limit:
+                self.requests.append(timestamp)
+                return True
+
+            return False
+
+class TokenBucket:
+    """
+    Strategy: Token Bucket.
+    - A bucket holds up to N tokens and refills at N / M tokens per second.
+    - Each request takes one token; no token, reject.
+    - Allows a burst of N, then a steady N per M seconds.
+
+    Like GCRA, the bucket is kept in integers so refills are exact: one token is
+    M (in ns) credits and each elapsed ns adds N credits.
+
+    State: 2 ints per key.
+    """
+    __slots__ = ("limit", "window_seconds", "window_ns", "credits", "last_ns", "_lock")
+
+    def __init__(self, limit, window_seconds):
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.window_ns = round(window_seconds * 1e9)
+        self.credits = limit * self.window_ns
+        self.last_ns = None
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self):
+        return self.credits / self.window_ns
+
+    def allow_request(self, timestamp=None):
+        with self._lock:
+            now_ns = time.time_ns() if timestamp is None else round(timestamp * 1e9)
+            if self.last_ns is None:
+                self.last_ns = now_ns
+            elif now_ns > self.last_ns:
+                # Refill; a late timestamp (thread scheduling) refills nothing.
+                self.credits = min(self.limit * self.window_ns,
+                                   self.credits + (now_ns - self.last_ns) * self.limit)
+                self.last_ns = now_ns
+
+            # GCRA.SLACK_NS of tolerance for the rounding of float timestamps.
+            if self.credits >= self.window_ns - GCRA.SLACK_NS * self.limit:
+                self.credits = max(0, self.credits - self.window_ns)
+                return True
+            return False
+
+class GCRA:
+    """
+    Strategy: Generic Cell Rate Algorithm (a token bucket stored as one timestamp).
+    - Requests are spaced T = M / N seconds apart; `tat` is the theoretical
+      arrival time of the next request if the key had been perfectly paced.
+    - Admit if the new tat stays within M seconds of now (a burst of up to N).
+
+    Times are kept in integer nanoseconds: with float seconds, rounding in
+    tat + T (e.g. M = 0.7, or epoch-sized timestamps) can push tat - now just past
+    M and reject a request that fits, forever for N = 1. A 1 us slack absorbs the
+    rounding of float timestamps passed in by callers.
+
+    State: 1 int per key.
+    """
+    __slots__ = ("limit", "window_seconds", "interval_ns", "window_ns", "tat_ns", "_lock")
+
+    SLACK_NS = 1000
+
+    def __init__(self, limit, window_seconds):
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.window_ns = round(window_seconds * 1e9)
+        self.interval_ns = self.window_ns // limit
+        self.tat_ns = None
+        self._lock = threading.Lock()
+
+    def allow_request(self, timestamp=None):
+        with self._lock:
+            now_ns = time.time_ns() if timestamp is None else round(timestamp * 1e9)
+            tat_ns = now_ns if self.tat_ns is None else max(self.tat_ns, now_ns)
+            new_tat_ns = tat_ns + self.interval_ns
+            if new_tat_ns - now_ns > self.window_ns + self.SLACK_NS:
+                return False
+            self.tat_ns = new_tat_ns
             return True
-        
-        return False
+
+class SlidingWindowCounter:
+    """
+    Strategy: Sliding Window Counter.
+    - Count requests in fixed windows of M seconds (current and previous).
+    - Estimate the sliding count as previous * (share of it still in the
+      sliding window) + current; allow if the estimate is below N.
+    - Approximates the Sliding Window Log assuming requests were evenly
+      spread over the previous window.
+
+    State: 1 int window index + 2 counters per key.
+    """
+    __slots__ = ("limit", "window_seconds", "window", "current", "previous", "_lock")
+
+    def __init__(self, limit, window_seconds):
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.window = None
+        self.current = 0
+        self.previous = 0
+        self._lock = threading.Lock()
+
+    def allow_request(self, timestamp=None):
+        with self._lock:
+            if timestamp is None:
+                timestamp = time.time()
+            window = int(timestamp // self.window_seconds)
+            if self.window is None or window > self.window:
+                # Slide: the old current becomes previous, unless a whole window was skipped.
+                self.previous = self.current if self.window is not None and window == self.window + 1 else 0
+                self.current = 0
+                self.window = window
+            # A late timestamp from an earlier window (thread scheduling) counts as current.
+            elapsed = max(0.0, timestamp - self.window * self.window_seconds)
+            weight = 1 - elapsed / self.window_seconds
+            if self.previous * weight + self.current < self.limit:
+                self.current += 1
+                return True
+            return False
 
 # ==========================================
 # 2. MERGE K SORTED LOG STREAMS (Heap)
@@ -211,6 +335,9 @@ if __name__ == "__main__":
     print(f"Req 2 (0.2s): {limiter.allow_request(0.2)}") # True
     print(f"Req 3 (0.3s): {limiter.allow_request(0.3)}") # False (Max 2 per 1s)
     print(f"Req 4 (1.2s): {limiter.allow_request(1.2)}") # True (0.1 expired)
+    for engine in (TokenBucket, GCRA, SlidingWindowCounter):
+        limiter = engine(limit=2, window_seconds=1)
+        print(f"{engine.__name__}: {[limiter.allow_request(t) for t in (0.1, 0.2, 0.3, 1.2)]}")
     
     print("\n--- 2. Merge K Logs ---")
     log1 = [(1, "A"), (3, "B"), (5, "C")]
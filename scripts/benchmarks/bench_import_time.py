@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Import time of the devops_toolkit modules.
+
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter for each
+module, parses the stderr report and prints the cumulative import cost, plus whether
+the heavy `kubernetes` package was pulled in.
+
+Use --max-ms in CI to catch regressions (e.g. someone re-adding a top-level
+`from kubernetes import client`).
+
+Usage:
+    python scripts/benchmarks/bench_import_time.py
+    python scripts/benchmarks/bench_import_time.py --max-ms 150 --runs 5
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src'))
+
+MODULES: List[str] = [
+    "devops_toolkit.system",
+    "devops_toolkit.k8s.client",
+    "devops_toolkit.k8s.operations",
+    "devops_toolkit.k8s.pager",
+    "devops_toolkit.k8s.fastpath",
+    "devops_toolkit.k8s.informer",
+    "devops_toolkit.k8s.aio",
+]
+
+# "import time:       self [us] |  cumulative | imported package"
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    """Maps every imported module to its cumulative import time in microseconds."""
+    cumulative: Dict[str, int] = {}
+    for line in stderr.splitlines():
+        if match := IMPORTTIME_LINE.match(line):
+            cumulative[match.group(4)] = int(match.group(2))
+    return cumulative
+
+def measure(module: str) -> Tuple[float, bool]:
+    """Returns (cumulative ms, whether kubernetes was imported) for one cold import."""
+    env = dict(os.environ, PYTHONPATH=f"{SRC_PATH}{os.pathsep}{os.environ.get('PYTHONPATH', '')}")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=env, check=True
+    )
+    modules = parse_importtime(result.stderr)
+    return modules.get(module, 0) / 1000, "kubernetes" in modules
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Import-time regression check")
+    parser.add_argument("--runs", type=int, default=3, help="Cold imports per module (median is reported)")
+    parser.add_argument("--max-ms", type=float, default=None, help="Fail if any module exceeds this")
+    parser.add_argument("modules", nargs="*", default=MODULES)
+    args = parser.parse_args()
+
+    failures = 0
+    print(f"{'MODULE':<34} {'MEDIAN ms':>10}  KUBERNETES IMPORTED")
+    for module in args.modules:
+        samples = [measure(module) for _ in range(args.runs)]
+        median_ms = statistics.median(ms for ms, _ in samples)
+        pulled_k8s = any(k8s for _, k8s in samples)
+        flag = ""
+        if args.max_ms is not None and median_ms > args.max_ms:
+            flag = "  <-- over budget"
+            failures += 1
+        print(f"{module:<34} {median_ms:>10.1f}  {'yes' if pulled_k8s else 'no'}{flag}")
+
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark: kubernetes model deserialization vs. the raw-JSON fast path.
+
+Builds a synthetic PodList JSON payload (default 100k pods) and measures the CPU
+cost of turning it into something a checker can iterate:
+1. Model path: json.loads + ApiClient deserialization into V1PodList.
+2. Fast path:  orjson/json loads + project_pod() into __slots__ records.
+
+Usage:
+    python scripts/benchmarks/bench_k8s_fastpath.py --pods 100000
+No cluster required.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+# Add src to path so we can import devops_toolkit without installing it
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src'))
+sys.path.append(SRC_PATH)
+
+from devops_toolkit.k8s.fastpath import ORJSON_AVAILABLE, loads, project_pod
+
+def make_pod(i: int) -> dict:
+    """A realistic-ish pod: metadata, a spec with one container, and full status."""
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {
+            "name": f"web-{i}",
+            "namespace": f"ns-{i % 400}",
+            "uid": f"00000000-0000-0000-0000-{i:012d}",
+            "labels": {"app": "web", "pod-template-hash": "7d9f8c6b5"},
+            "creationTimestamp": "2025-12-21T10:00:00Z",
+        },
+        "spec": {
+            "nodeName": f"node-{i % 5000}",
+            "containers": [{
+                "name": "app",
+                "image": "nginx:1.27",
+                "resources": {"limits": {"memory": "256Mi"}, "requests": {"cpu": "100m"}},
+            }],
+        },
+        "status": {
+            "phase": "Running",
+            "podIP": f"10.{(i >> 16) & 255}.{(i >> 8) & 255}.{i & 255}",
+            "conditions": [
+                {"type": "Ready", "status": "True", "lastTransitionTime": "2025-12-21T10:00:05Z"},
+                {"type": "ContainersReady", "status": "True", "lastTransitionTime": "2025-12-21T10:00:05Z"},
+            ],
+            "containerStatuses": [{
+                "name": "app",
+                "image": "nginx:1.27",
+                "imageID": "docker-pullable://nginx@sha256:abc",
+                "ready": True,
+                "restartCount": i % 7,
+                "state": {"running": {"startedAt": "2025-12-21T10:00:04Z"}},
+            }],
+        },
+    }
+
+def timed(label: str, fn):
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed:8.2f} s")
+    return result, elapsed
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Model vs raw-JSON list decoding")
+    parser.add_argument("--pods", type=int, default=100_000)
+    args = parser.parse_args()
+
+    payload = json.dumps({
+        "apiVersion": "v1", "kind": "PodList", "metadata": {"resourceVersion": "1"},
+        "items": [make_pod(i) for i in range(args.pods)],
+    }).encode()
+    print(f"--- {args.pods} pods, {len(payload) / 1e6:.1f} MB payload, orjson={ORJSON_AVAILABLE} ---")
+
+    fast, fast_s = timed("raw JSON + project_pod", lambda: [project_pod(p) for p in loads(payload)["items"]])
+    restarts = sum(cs.restart_count for pod in fast for cs in pod.container_statuses)
+
+    try:
+        from kubernetes.client import ApiClient
+    except ImportError:
+        print("kubernetes not installed; skipping model path.")
+        return 0
+
+    api_client = ApiClient()
+    # __deserialize is what ApiClient.deserialize() runs after json.loads; calling it
+    # directly keeps the benchmark independent of the client's response wrapper type.
+    model, model_s = timed(
+        "json.loads + V1PodList models",
+        lambda: api_client._ApiClient__deserialize(json.loads(payload), "V1PodList")
+    )
+    model_restarts = sum(cs.restart_count for pod in model.items for cs in pod.status.container_statuses)
+
+    assert restarts == model_restarts, "fast path and model path disagree"
+    print(f"\nSpeedup: {model_s / fast_s:.1f}x")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
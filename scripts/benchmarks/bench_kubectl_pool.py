@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Fresh kubectl process per call vs. a pooled `kubectl proxy` session.
+
+Every `kubectl` call re-reads kubeconfig and rebuilds its discovery cache. This script
+measures per-call latency of the same read (`GET namespace/<name>`) both ways:
+1. run_command(["kubectl", "get", "namespace", ...])  -> one process per call.
+2. KubectlProxy.request("GET", ...)                   -> one process, keep-alive HTTP.
+
+Usage:
+    python scripts/benchmarks/bench_kubectl_pool.py --iterations 20 --namespace default
+Requires kubectl and a reachable cluster (e.g. minikube).
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import Callable, List
+
+# Add src to path so we can import devops_toolkit without installing it
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src'))
+sys.path.append(SRC_PATH)
+
+from devops_toolkit.system import check_binary_exists, run_command
+from devops_toolkit.k8s.proxy import KubectlProxy
+
+def measure(label: str, fn: Callable[[], None], iterations: int) -> List[float]:
+    """Runs fn `iterations` times and prints latency stats in milliseconds."""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    samples.sort()
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    print(f"{label:<22} mean={statistics.mean(samples):8.1f} ms  "
+          f"p50={statistics.median(samples):8.1f} ms  p95={p95:8.1f} ms")
+    return samples
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="kubectl spawn vs pooled proxy latency")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--namespace", default="default")
+    parser.add_argument("--context", default=None)
+    args = parser.parse_args()
+
+    if not check_binary_exists("kubectl"):
+        print("kubectl not found; nothing to benchmark.")
+        return 1
+
+    kubectl_cmd = ["kubectl", "get", "namespace", args.namespace]
+    if args.context:
+        kubectl_cmd.append(f"--context={args.context}")
+
+    print(f"--- {args.iterations} iterations of GET namespace/{args.namespace} ---")
+    spawn = measure("kubectl per call", lambda: run_command(kubectl_cmd, capture_output=True), args.iterations)
+
+    startup = time.perf_counter()
+    with KubectlProxy(context=args.context) as proxy:
+        print(f"{'proxy startup':<22} {(time.perf_counter() - startup) * 1000:8.1f} ms (paid once)")
+        path = f"/api/v1/namespaces/{args.namespace}"
+        pooled = measure("pooled proxy", lambda: proxy.request("GET", path).raise_for_status(), args.iterations)
+
+    print(f"\nSpeedup (mean): {statistics.mean(spawn) / statistics.mean(pooled):.1f}x")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark: answering an ad-hoc question by re-parsing text vs. querying Parquet.
+
+Question: "which paths returned 500 for this IP?"
+1. Re-parse: regex over the raw log (mmap + bytes, the fastest text path we have).
+2. Parquet:  one-off export_logs, then a pyarrow.dataset filter on ip/status.
+
+Usage:
+    python scripts/benchmarks/bench_log_export.py --size-mb 512
+Requires pyarrow.
+"""
+
+import argparse
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter
+
+# Add src to path so we can import devops_toolkit without installing it
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src'))
+sys.path.append(SRC_PATH)
+sys.path.append(os.path.dirname(__file__))
+
+from bench_log_scan import write_synthetic_log
+from devops_toolkit.logs.export import export_logs, ip_to_int
+
+def reparse(path: str, ip: str) -> Counter:
+    pattern = re.compile(rb'(?m)^' + re.escape(ip.encode()) + rb' .*?"\w+ (.*?) HTTP/1.1" 500 ')
+    with open(path, "rb") as f:
+        return Counter(pattern.findall(f.read()))
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Re-parse vs Parquet query")
+    parser.add_argument("--size-mb", type=int, default=512)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    import pyarrow.dataset as ds
+
+    workdir = tempfile.mkdtemp()
+    try:
+        log = os.path.join(workdir, "access.log")
+        print(f"Writing {args.size_mb} MB synthetic log ...")
+        write_synthetic_log(log, args.size_mb)
+        with open(log, "rb") as f:
+            ip = f.readline().split(b" ", 1)[0].decode()
+
+        start = time.perf_counter()
+        expected = reparse(log, ip)
+        reparse_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = export_logs(log, os.path.join(workdir, "parquet"), workers=args.workers)
+        export_s = time.perf_counter() - start
+        parquet_mb = sum(os.path.getsize(p) for p in result["files"]) / 2**20
+
+        start = time.perf_counter()
+        dataset = ds.dataset(os.path.join(workdir, "parquet"), format="parquet")
+        table = dataset.to_table(columns=["path"],
+                                 filter=(ds.field("ip") == ip_to_int(ip)) & (ds.field("status") == 500))
+        query_s = time.perf_counter() - start
+        assert sum(Counter(table.column("path").to_pylist()).values()) == sum(expected.values())
+
+        print(f"rows exported:  {result['rows']:,} -> {parquet_mb:.1f} MB parquet (from {args.size_mb} MB text)")
+        print(f"re-parse query: {reparse_s:8.3f} s")
+        print(f"one-off export: {export_s:8.3f} s")
+        print(f"parquet query:  {query_s:8.3f} s   ({reparse_s / query_s:.0f}x faster than re-parsing)")
+    finally:
+        shutil.rmtree(workdir)
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
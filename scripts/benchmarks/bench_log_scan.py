@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark: access-log scan throughput (MB/s), text path vs. mmap + bytes regex.
+
+Writes a synthetic access log (default 2 GB) and runs devops_toolkit.logs.analyzer
+over it in both modes, single-core and on every core:
+1. text: decode each line to str, strip, regex-search (what parse_logs does).
+2. mmap: bytes regex over the mapped file, decoding only the captured groups.
+
+Usage:
+    python scripts/benchmarks/bench_log_scan.py --size-mb 2048
+    python scripts/benchmarks/bench_log_scan.py --size-mb 256 --keep /tmp/access.log
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add src to path so we can import devops_toolkit without installing it
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src'))
+sys.path.append(SRC_PATH)
+
+from devops_toolkit.logs.analyzer import analyze_logs
+
+PATHS = ["/", "/home", "/app", "/login", "/api/v1/orders", "/static/app.js", "/healthz"]
+STATUSES = ["200"] * 16 + ["201", "301", "404", "500"]
+
+def write_synthetic_log(path: str, size_mb: int, seed: int = 7) -> int:
+    """Writes roughly size_mb of combined-format lines; returns the byte size."""
+    rng = random.Random(seed)
+    # Build a pool of lines once and repeat it: generation must not dominate the run.
+    pool = []
+    for _ in range(20_000):
+        ip = f"10.{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(256)}"
+        pool.append(
+            f'{ip} - - [21/Dec/2025:10:00:01 +0000] "{rng.choice(["GET", "POST"])} '
+            f'{rng.choice(PATHS)} HTTP/1.1" {rng.choice(STATUSES)} {rng.randrange(100, 20000)} '
+            f'"-" "Mozilla/5.0 (X11; Linux x86_64)"\n'
+        )
+    block = "".join(pool).encode()
+    target = size_mb * 1024 * 1024
+    with open(path, "wb") as f:
+        written = 0
+        while written < target:
+            f.write(block)
+            written += len(block)
+    return written
+
+def run(label: str, path: str, size: int, **kwargs) -> None:
+    start = time.perf_counter()
+    stats = analyze_logs(path, **kwargs)
+    elapsed = time.perf_counter() - start
+    mb_s = size / (1024 * 1024) / elapsed
+    print(f"{label:<24} {elapsed:8.2f} s {mb_s:10.1f} MB/s   ({stats.matched} matched)")
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Text vs mmap access-log scanning")
+    parser.add_argument("--size-mb", type=int, default=2048)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--keep", metavar="PATH", help="Write (or reuse) the synthetic log here")
+    args = parser.parse_args()
+
+    path = args.keep or tempfile.mktemp(suffix=".log")
+    if not (args.keep and os.path.exists(path)):
+        print(f"Writing {args.size_mb} MB synthetic log to {path} ...")
+        write_synthetic_log(path, args.size_mb)
+    size = os.path.getsize(path)
+
+    try:
+        # Warm the page cache so both modes read from memory.
+        analyze_logs(path, workers=args.workers, mode="mmap")
+        run("text, 1 core", path, size, workers=1, mode="text")
+        run("mmap, 1 core", path, size, workers=1, mode="mmap")
+        run(f"text, {args.workers} workers", path, size, workers=args.workers, mode="text")
+        run(f"mmap, {args.workers} workers", path, size, workers=args.workers, mode="mmap")
+    finally:
+        if not args.keep:
+            os.unlink(path)
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark: rate-limiter engines, ops/sec and bytes per key.
+
+Models an API gateway: one limiter per tenant key, requests spread over the keys.
+For each engine in scripts/algorithms/faang_interview_challenges.py:
+1. bytes/key: tracemalloc delta of a dict of --keys limiters, each driven to its
+   limit (the sliding-window log's deque grows with the limit; the others don't).
+2. ops/sec, 1 thread: allow_request over random keys with a synthetic clock.
+3. ops/sec, --threads threads: same work split across threads (shows lock cost
+   under the GIL, not parallel speedup).
+
+Usage:
+    python scripts/benchmarks/bench_rate_limiters.py --keys 100000 --limit 100
+    python scripts/benchmarks/bench_rate_limiters.py --ops 2000000 --threads 8
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+
+# Add scripts/algorithms to path so we can import the challenge module
+ALGORITHMS_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../algorithms'))
+sys.path.append(ALGORITHMS_PATH)
+
+from faang_interview_challenges import GCRA, RateLimiter, SlidingWindowCounter, TokenBucket
+
+ENGINES = [RateLimiter, TokenBucket, GCRA, SlidingWindowCounter]
+
+def bytes_per_key(engine, keys: int, limit: int, window: float) -> float:
+    """Builds `keys` limiters and fills each to its limit; returns traced bytes per key."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    limiters = {f"tenant-{i}": engine(limit, window) for i in range(keys)}
+    for limiter in limiters.values():
+        for n in range(limit):
+            limiter.allow_request(timestamp=n * window / limit / 2)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / keys
+
+def run_ops(limiters, key_ids, timestamps, threads: int) -> float:
+    """Calls allow_request for every (key, timestamp) pair; returns ops/sec."""
+    names = list(limiters)
+
+    def worker(lo: int, hi: int) -> None:
+        for i in range(lo, hi):
+            limiters[names[key_ids[i]]].allow_request(timestamp=timestamps[i])
+
+    n = len(key_ids)
+    step = -(-n // threads)
+    pool = [threading.Thread(target=worker, args=(lo, min(lo + step, n))) for lo in range(0, n, step)]
+    start = time.perf_counter()
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    return n / (time.perf_counter() - start)
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Rate limiter engines: ops/sec and bytes per key")
+    parser.add_argument("--keys", type=int, default=100_000)
+    parser.add_argument("--limit", type=int, default=100, help="Requests per window per key")
+    parser.add_argument("--window", type=float, default=1.0, help="Window in seconds")
+    parser.add_argument("--ops", type=int, default=1_000_000)
+    parser.add_argument("--rate", type=float, default=50_000, help="Offered requests/s (synthetic clock)")
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    key_ids = [rng.randrange(args.keys) for _ in range(args.ops)]
+    timestamps = [i / args.rate for i in range(args.ops)]
+
+    print(f"{args.keys} keys, limit {args.limit}/{args.window:g}s, {args.ops} ops at {args.rate:,.0f} req/s\n")
+    print(f"{'engine':<22} {'bytes/key':>10} {'ops/s (1 thread)':>17} {f'ops/s ({args.threads} threads)':>18}")
+    for engine in ENGINES:
+        per_key = bytes_per_key(engine, args.keys, args.limit, args.window)
+        limiters = {f"tenant-{i}": engine(args.limit, args.window) for i in range(args.keys)}
+        single = run_ops(limiters, key_ids, timestamps, 1)
+        limiters = {f"tenant-{i}": engine(args.limit, args.window) for i in range(args.keys)}
+        threaded = run_ops(limiters, key_ids, timestamps, args.threads)
+        print(f"{engine.__name__:<22} {per_key:>10,.0f} {single:>17,.0f} {threaded:>18,.0f}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,7 +1,9 @@
 #!/usr/bin/env python
+import argparse
 import sys
 import os
-from typing import Iterator
+import time
+from typing import Iterable, Iterator
 
 # Add src to path so we can import devops_toolkit without installing it
 SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../src'))
@@ -9,44 +11,86 @@ sys.path.append(SRC_PATH)
 
 try:
     from devops_toolkit.k8s.client import load_k8s_config, get_core_api
+    from devops_toolkit.k8s.pager import paginate
+    from devops_toolkit.k8s.fastpath import iter_raw, project_node, project_pod, project_pvc
+    from devops_toolkit.k8s.informer import Informer
+    from devops_toolkit.k8s.aio import list_namespaced_across
     from devops_toolkit.utils.logging import setup_logger
-    from kubernetes.client.rest import ApiException
+    # Lazy: kubernetes itself is only imported when an API call (or ApiException) is needed.
+    from devops_toolkit.k8s import client as k8s
 except ImportError as e:
     print(f"Error: Could not import devops_toolkit. {e}")
     sys.exit(1)
 
 # Centralized Logging
-logger = setup_logger(__name__)
+# LOG_FORMAT=json emits one JSON object per line for the log shipper.
+logger = setup_logger(
+    __name__, queued=True, overflow="drop_oldest",
+    json_format=os.environ.get("LOG_FORMAT") == "json", sample_burst=50
+)
 
-def iter_unhealthy_nodes() -> Iterator[str]:
+def is_node_ready(node) -> bool:
+    """True if a V1Node reports condition Ready=True."""
+    for condition in node.status.conditions or []:
+        if condition.type == 'Ready' and condition.status == 'True':
+            return True
+    return False
+
+def log_high_restarts(pod: str, namespace: str, container: str, restart_count: int) -> None:
+    # Lazy %-args: records dropped by sampling/overflow are never formatted.
+    logger.warning(
+        "High Restarts: Pod %s (Container: %s) has restarted %d times.",
+        pod, container, restart_count,
+        extra={"pod": pod, "namespace": namespace, "container": container, "restart_count": restart_count}
+    )
+
+def report_pod_restarts(pods: Iterable, restart_threshold: int) -> None:
+    """Logs every container (of V1Pod objects) above the restart threshold."""
+    for pod in pods:
+        if not pod.status.container_statuses:
+            continue
+            
+        for container in pod.status.container_statuses:
+            if container.restart_count > restart_threshold:
+                log_high_restarts(pod.metadata.name, pod.metadata.namespace, container.name, container.restart_count)
+
+def report_pending_pvcs(pvcs: Iterable) -> None:
+    """Logs every V1PersistentVolumeClaim that is not Bound."""
+    for pvc in pvcs:
+        if pvc.status.phase != 'Bound':
+            logger.warning(f"PVC Issue: {pvc.metadata.name} in {pvc.metadata.namespace} is {pvc.status.phase}")
+
+def iter_unhealthy_nodes(fast: bool = False) -> Iterator[str]:
     """
     Generator that yields nodes NOT in 'Ready' state.
     
     Why Generators?
     - Memory Efficiency: We don't build a massive list of 5000 nodes in RAM.
     - Latency: We can process the first bad node before the API has finished sending the last one.
+
+    fast=True skips kubernetes model deserialization (raw JSON + projection).
     """
     v1 = get_core_api()
     if not v1: return
 
     try:
-        # Paging could be added here for true large-scale support (limit=500, continue_token)
-        nodes = v1.list_node()
-        for node in nodes.items:
-            is_ready = False
-            for condition in node.status.conditions:
-                if condition.type == 'Ready' and condition.status == 'True':
-                    is_ready = True
-                    break
-            
-            if not is_ready:
+        if fast:
+            for node in iter_raw(v1.list_node, project=project_node):
+                if not node.is_ready:
+                    logger.warning(f"Node {node.name} is NOT Ready.")
+                    yield node.name
+            return
+
+        # Paged (limit/continue) so a 5k-node cluster never lands in RAM at once.
+        for node in paginate(v1.list_node):
+            if not is_node_ready(node):
                 logger.warning(f"Node {node.metadata.name} is NOT Ready.")
                 yield node.metadata.name
 
-    except ApiException as e:
+    except k8s.ApiException as e:
         logger.error(f"API Error listing nodes: {e}")
 
-def check_pod_restarts(namespace: str = "default", restart_threshold: int = 5):
+def check_pod_restarts(namespace: str = "default", restart_threshold: int = 5, fast: bool = False):
     """
     Identifies unstable pods.
     """
@@ -54,24 +98,34 @@ def check_pod_restarts(namespace: str = "default", restart_threshold: int = 5):
     if not v1: return
 
     try:
-        # Optimization: In a real large cluster, you'd use `limit` and `continue` pagination here.
-        pods = v1.list_namespaced_pod(namespace)
-        for pod in pods.items:
-            if not pod.status.container_statuses:
-                continue
-                
-            for container in pod.status.container_statuses:
-                if container.restart_count > restart_threshold:
-                    logger.warning(
-                        f"High Restarts: Pod {pod.metadata.name} "
-                        f"(Container: {container.name}) "
-                        f"has restarted {container.restart_count} times."
-                    )
-
-    except ApiException as e:
+        if fast:
+            for pod in iter_raw(v1.list_namespaced_pod, namespace, project=project_pod):
+                for container in pod.container_statuses:
+                    if container.restart_count > restart_threshold:
+                        log_high_restarts(pod.name, pod.namespace, container.name, container.restart_count)
+            return
+
+        report_pod_restarts(paginate(v1.list_namespaced_pod, namespace), restart_threshold)
+
+    except k8s.ApiException as e:
         logger.error(f"API Error in namespace {namespace}: {e}")
 
-def check_pending_pvc():
+def check_pod_restarts_across(namespaces=None, contexts=(None,), restart_threshold: int = 5, concurrency: int = 32):
+    """
+    check_pod_restarts for many namespaces and clusters at once.
+
+    The per-namespace lists run concurrently (global cap + per-cluster rate limit);
+    the results then go through the same reporting as the single-namespace check.
+    """
+    results = list_namespaced_across(
+        "list_namespaced_pod", namespaces=namespaces, contexts=contexts, concurrency=concurrency
+    )
+    for (context, namespace), pods in sorted(results.items(), key=lambda kv: (kv[0][0] or "", kv[0][1])):
+        if context:
+            logger.info(f"[{context}] namespace {namespace}: {len(pods)} pods")
+        report_pod_restarts(pods, restart_threshold)
+
+def check_pending_pvc(fast: bool = False):
     """
     Checks for Stuck PVCs.
     """
@@ -79,16 +133,68 @@ def check_pending_pvc():
     if not v1: return
 
     try:
+        if fast:
+            for pvc in iter_raw(v1.list_persistent_volume_claim_for_all_namespaces, project=project_pvc):
+                if pvc.phase != 'Bound':
+                    logger.warning(f"PVC Issue: {pvc.name} in {pvc.namespace} is {pvc.phase}")
+            return
+
         # Server-Side Filtering: Only fetch Bound/Pending PVCs if needed, 
         # but here we want non-Bound. K8s doesn't support '!=' selectors easily.
-        pvcs = v1.list_persistent_volume_claim_for_all_namespaces()
-        for pvc in pvcs.items:
-            if pvc.status.phase != 'Bound':
-                logger.warning(f"PVC Issue: {pvc.metadata.name} in {pvc.metadata.namespace} is {pvc.status.phase}")
-    except ApiException as e:
+        report_pending_pvcs(paginate(v1.list_persistent_volume_claim_for_all_namespaces))
+    except k8s.ApiException as e:
         logger.error(f"API Error listing PVCs: {e}")
 
+def monitor(interval: int = 30, namespace: str = "default", restart_threshold: int = 1):
+    """
+    Continuous monitoring loop backed by informers.
+
+    Why Informers?
+    - The cluster is listed once, then kept current through WATCH events.
+    - Each round of checks reads the local cache instead of re-downloading every
+      node, pod and PVC from the API server.
+    """
+    v1 = get_core_api()
+    if not v1: return
+
+    nodes = Informer(v1.list_node).start()
+    pods = Informer(v1.list_namespaced_pod, namespace).start()
+    pvcs = Informer(v1.list_persistent_volume_claim_for_all_namespaces).start()
+    for informer in (nodes, pods, pvcs):
+        if not informer.wait_for_sync(timeout=120):
+            logger.error("Timed out waiting for the initial cluster sync.")
+            return
+
+    try:
+        while True:
+            logger.info(f"Checking cached state ({len(nodes)} nodes, {len(pods)} pods, {len(pvcs)} PVCs)...")
+            for node in nodes.list():
+                if not is_node_ready(node):
+                    logger.warning(f"Node {node.metadata.name} is NOT Ready.")
+            report_pod_restarts(pods.list(), restart_threshold)
+            report_pending_pvcs(pvcs.list())
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        logger.info("Stopping monitor.")
+    finally:
+        for informer in (nodes, pods, pvcs):
+            informer.stop()
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="K8s cluster health check")
+    parser.add_argument("--fast", action="store_true",
+                        help="Use the raw-JSON fast path instead of kubernetes model objects")
+    parser.add_argument("--watch", type=int, metavar="SECONDS",
+                        help="Keep running, re-checking an informer cache every SECONDS")
+    parser.add_argument("--namespaces", help="Comma-separated namespaces for the restart check, or 'all'")
+    parser.add_argument("--contexts", help="Comma-separated kubeconfig contexts to scan concurrently")
+    args = parser.parse_args()
+
+    if args.watch:
+        if load_k8s_config():
+            monitor(interval=args.watch)
+        raise SystemExit(0)
+
     logger.info("--- Starting On-Prem AKS/K8s Health Check (Optimized) ---")
     
     if load_k8s_config():
@@ -96,17 +202,24 @@ if __name__ == "__main__":
         logger.info("Checking Nodes (Lazy Evaluation)...")
         # Consuming the generator
         bad_nodes_count = 0
-        for node_name in iter_unhealthy_nodes():
+        for node_name in iter_unhealthy_nodes(fast=args.fast):
             bad_nodes_count += 1
         
         if bad_nodes_count == 0:
             logger.info("All nodes look healthy.")
 
         logger.info("Checking Application Stability...")
-        check_pod_restarts(namespace="default", restart_threshold=1)
+        if args.namespaces or args.contexts:
+            namespaces = None if args.namespaces in (None, "all") else args.namespaces.split(",")
+            if namespaces is None and not args.namespaces:
+                namespaces = ["default"]
+            contexts = args.contexts.split(",") if args.contexts else (None,)
+            check_pod_restarts_across(namespaces, contexts, restart_threshold=1)
+        else:
+            check_pod_restarts(namespace="default", restart_threshold=1, fast=args.fast)
 
         logger.info("Checking Storage...")
-        check_pending_pvc()
+        check_pending_pvc(fast=args.fast)
 
     else:
         logger.warning("Skipping checks due to configuration failure.")
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 import sys
 import os
+import argparse
 import random
 import time
 
@@ -10,8 +11,10 @@ sys.path.append(SRC_PATH)
 
 try:
     from devops_toolkit.k8s.client import load_k8s_config, get_core_api
+    from devops_toolkit.k8s.pager import paginate
     from devops_toolkit.utils.logging import setup_logger
-    from kubernetes.client.rest import ApiException
+    # Lazy: kubernetes itself is only imported when an API call (or ApiException) is needed.
+    from devops_toolkit.k8s import client as k8s
 except ImportError as e:
     print(f"Error: Could not import devops_toolkit. {e}")
     sys.exit(1)
@@ -92,7 +95,7 @@ def inject_stuck_pvc(namespace="default"):
         if not v1: return
         v1.create_namespaced_persistent_volume_claim(namespace, manifest)
         logger.info(f"✅ Created Stuck PVC: {name} (Will remain Pending)")
-    except ApiException as e:
+    except k8s.ApiException as e:
         if e.status == 409:
             logger.info(f"⚠️  Stuck PVC '{name}' already exists. Skipping.")
         else:
@@ -115,7 +118,7 @@ def inject_broken_service(namespace="default"):
         if not v1: return
         v1.create_namespaced_service(namespace, manifest)
         logger.info(f"✅ Created Broken Service: {name} (Has no Endpoints)")
-    except ApiException as e:
+    except k8s.ApiException as e:
         if e.status == 409:
             logger.info(f"⚠️  Broken Service '{name}' already exists. Skipping.")
         else:
@@ -127,7 +130,7 @@ def _apply_manifest(namespace, manifest, description):
     try:
         v1.create_namespaced_pod(namespace, manifest)
         logger.info(f"✅ Created {description}: {manifest['metadata']['name']}")
-    except ApiException as e:
+    except k8s.ApiException as e:
         if e.status == 409:
             logger.info(f"⚠️  {description} already exists. Skipping.")
         else:
@@ -140,20 +143,18 @@ def cleanup_chaos(namespace="default"):
     if not v1: return
     
     # Delete Pods
-    pods = v1.list_namespaced_pod(namespace, label_selector="app=chaos")
-    for pod in pods.items:
+    # Collect matches first so we never delete while a paged list is still open.
+    for pod in list(paginate(v1.list_namespaced_pod, namespace, label_selector="app=chaos")):
         v1.delete_namespaced_pod(pod.metadata.name, namespace)
         logger.info(f"   Deleted Pod: {pod.metadata.name}")
 
     # Delete PVCs
-    pvcs = v1.list_namespaced_persistent_volume_claim(namespace, label_selector="app=chaos")
-    for pvc in pvcs.items:
+    for pvc in list(paginate(v1.list_namespaced_persistent_volume_claim, namespace, label_selector="app=chaos")):
         v1.delete_namespaced_persistent_volume_claim(pvc.metadata.name, namespace)
         logger.info(f"   Deleted PVC: {pvc.metadata.name}")
         
     # Delete Services
-    svcs = v1.list_namespaced_service(namespace, label_selector="app=chaos")
-    for svc in svcs.items:
+    for svc in list(paginate(v1.list_namespaced_service, namespace, label_selector="app=chaos")):
         v1.delete_namespaced_service(svc.metadata.name, namespace)
         logger.info(f"   Deleted Service: {svc.metadata.name}")
 
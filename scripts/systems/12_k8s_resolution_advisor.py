@@ -1,6 +1,8 @@
 #!/usr/bin/env python
+import argparse
 import sys
 import os
+from typing import List
 
 # Add src to path so we can import devops_toolkit without installing it
 SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../src'))
@@ -8,8 +10,11 @@ sys.path.append(SRC_PATH)
 
 try:
     from devops_toolkit.k8s.client import load_k8s_config, get_core_api
+    from devops_toolkit.k8s.pager import paginate
+    from devops_toolkit.k8s.fastpath import iter_raw, project_pod
     from devops_toolkit.utils.logging import setup_logger
-    from kubernetes.client.rest import ApiException
+    # Lazy: kubernetes itself is only imported when an API call (or ApiException) is needed.
+    from devops_toolkit.k8s import client as k8s
 except ImportError as e:
     print(f"Error: Could not import devops_toolkit. {e}")
     sys.exit(1)
@@ -27,64 +32,78 @@ def print_solution(title: str, description: str, commands: List[str]):
         print(f"     $ {cmd}")
     print("-" * 60)
 
-def analyze_pods(namespace="default"):
-    """Analyzes pods for common failure states and suggests fixes."""
+def iter_container_states(namespace: str, fast: bool = False):
+    """
+    Yields (pod_name, container_name, image, waiting_reason, terminated_reason) for every container.
+
+    fast=True reads raw JSON and projects only these fields (no kubernetes model objects).
+    """
     v1 = get_core_api()
     if not v1: return
 
+    if fast:
+        for pod in iter_raw(v1.list_namespaced_pod, namespace, project=project_pod):
+            for cs in pod.container_statuses:
+                yield pod.name, cs.name, cs.image, cs.waiting_reason, cs.terminated_reason
+        return
+
+    for pod in paginate(v1.list_namespaced_pod, namespace):
+        # 1. Check for Container Statuses
+        if not pod.status.container_statuses:
+            continue
+        for container in pod.status.container_statuses:
+            state = container.state
+            yield (
+                pod.metadata.name, container.name, container.image,
+                state.waiting.reason if state.waiting else None,
+                state.terminated.reason if state.terminated else None,
+            )
+
+def analyze_pods(namespace="default", fast: bool = False):
+    """Analyzes pods for common failure states and suggests fixes."""
     try:
-        pods = v1.list_namespaced_pod(namespace)
-        for pod in pods.items:
-            name = pod.metadata.name
-            
-            # 1. Check for Container Statuses
-            if not pod.status.container_statuses:
-                continue
-                
-            for container in pod.status.container_statuses:
-                state = container.state
-                
-                # CASE A: OOMKilled (Out of Memory)
-                if state.terminated and state.terminated.reason == "OOMKilled":
-                    print_solution(
-                        f"Pod '{name}' was OOMKilled",
-                        f"The container '{container.name}' consumed more memory than its limit allowed.",
-                        [
-                            f"kubectl describe pod {name} -n {namespace}  # Check 'Last State'",
-                            f"kubectl edit pod {name} -n {namespace}      # Increase 'resources.limits.memory'",
-                            f"# Check current usage (requires metrics-server):",
-                            f"kubectl top pod {name} -n {namespace}"
-                        ]
-                    )
+        for name, container_name, image, waiting_reason, terminated_reason in iter_container_states(namespace, fast):
+            # CASE A: OOMKilled (Out of Memory)
+            if terminated_reason == "OOMKilled":
+                print_solution(
+                    f"Pod '{name}' was OOMKilled",
+                    f"The container '{container_name}' consumed more memory than its limit allowed.",
+                    [
+                        f"kubectl describe pod {name} -n {namespace}  # Check 'Last State'",
+                        f"kubectl edit pod {name} -n {namespace}      # Increase 'resources.limits.memory'",
+                        f"# Check current usage (requires metrics-server):",
+                        f"kubectl top pod {name} -n {namespace}"
+                    ]
+                )
 
-                # CASE B: CrashLoopBackOff (App crashing)
-                elif state.waiting and state.waiting.reason == "CrashLoopBackOff":
-                    print_solution(
-                        f"Pod '{name}' is in CrashLoopBackOff",
-                        f"The application in container '{container.name}' is starting but crashing immediately.",
-                        [
-                            f"kubectl logs {name} -c {container.name} -n {namespace} --previous  # View crash logs",
-                            f"kubectl get events -n {namespace} --field-selector involvedObject.name={name} --sort-by='.lastTimestamp'",
-                            f"# Debug interactively if logs are empty:",
-                            f"kubectl run debug-{name} -it --rm --image={container.image} -- /bin/sh"
-                        ]
-                    )
+            # CASE B: CrashLoopBackOff (App crashing)
+            elif waiting_reason == "CrashLoopBackOff":
+                print_solution(
+                    f"Pod '{name}' is in CrashLoopBackOff",
+                    f"The application in container '{container_name}' is starting but crashing immediately.",
+                    [
+                        f"kubectl logs {name} -c {container_name} -n {namespace} --previous  # View crash logs",
+                        f"kubectl get events -n {namespace} --field-selector involvedObject.name={name} --sort-by='.lastTimestamp'",
+                        f"# Debug interactively if logs are empty:",
+                        f"kubectl run debug-{name} -it --rm --image={image} -- /bin/sh"
+                    ]
+                )
 
-                # CASE C: ImagePullBackOff (Registry/Image issues)
-                elif state.waiting and state.waiting.reason in ["ImagePullBackOff", "ErrImagePull"]:
-                    print_solution(
-                        f"Pod '{name}' cannot pull image",
-                        f"Failed to pull image '{container.image}'. Could be a typo, auth issue, or network.",
-                        [
-                            f"kubectl describe pod {name} -n {namespace}  # Look at 'Events' at the bottom",
-                            f"# Verify the image exists manually:",
-                            f"docker pull {container.image}",
-                            f"# Check if an ImagePullSecret is needed:",
-                            f"kubectl get secrets -n {namespace}"
-                        ]
-                    )
+            # CASE C: ImagePullBackOff (Registry/Image issues)
+            elif waiting_reason in ["ImagePullBackOff", "ErrImagePull"]:
+                print_solution(
+                    f"Pod '{name}' cannot pull image",
+                    f"Failed to pull image '{image}'. Could be a typo, auth issue, or network.",
+                    [
+                        f"kubectl describe pod {name} -n {namespace}  # Look at 'Events' at the bottom",
+                        f"# Verify the image exists manually:",
+                        f"docker pull {image}",
+                        f"# Check if an ImagePullSecret is needed:",
+                        f"kubectl get secrets -n {namespace}"
+                    ]
+                )
 
-    except ApiException as e:
+    except k8s.ApiException as e:
         logger.error(f"Error scanning pods: {e}")
 
 def analyze_pvcs(namespace="default"):
@@ -93,8 +112,7 @@ def analyze_pvcs(namespace="default"):
     if not v1: return
 
     try:
-        pvcs = v1.list_namespaced_persistent_volume_claim(namespace)
-        for pvc in pvcs.items:
+        for pvc in paginate(v1.list_namespaced_persistent_volume_claim, namespace):
             if pvc.status.phase == "Pending":
                 sc = pvc.spec.storage_class_name
                 print_solution(
@@ -106,7 +124,7 @@ def analyze_pvcs(namespace="default"):
                         f"kubectl get pv  # Check if a matching PV exists (if manual binding)",
                     ]
                 )
-    except ApiException as e:
+    except k8s.ApiException as e:
         logger.error(f"Error scanning PVCs: {e}")
 
 def analyze_services(namespace="default"):
@@ -115,16 +133,16 @@ def analyze_services(namespace="default"):
     if not v1: return
 
     try:
-        services = v1.list_namespaced_service(namespace)
-        pods = v1.list_namespaced_pod(namespace)
+        # Every service is matched against every pod, so keep only the labels in memory.
+        pod_labels = [pod.metadata.labels for pod in paginate(v1.list_namespaced_pod, namespace)]
         
-        for svc in services.items:
+        for svc in paginate(v1.list_namespaced_service, namespace):
             if svc.spec.selector:
                 # Match service selector labels to pods
                 selector = svc.spec.selector
                 matching_pods = 0
-                for pod in pods.items:
-                    if pod.metadata.labels and all(item in pod.metadata.labels.items() for item in selector.items()):
+                for labels in pod_labels:
+                    if labels and all(item in labels.items() for item in selector.items()):
                         matching_pods += 1
                 
                 if matching_pods == 0:
@@ -139,10 +157,15 @@ def analyze_services(namespace="default"):
                         ]
                     )
 
-    except ApiException as e:
+    except k8s.ApiException as e:
         logger.error(f"Error scanning Services: {e}")
 
 def main() -> int:
+    parser = argparse.ArgumentParser(description="K8s Resolution Advisor")
+    parser.add_argument("--fast", action="store_true",
+                        help="Use the raw-JSON fast path instead of kubernetes model objects")
+    args = parser.parse_args()
+
     if not load_k8s_config():
         print("❌ Failed to load kubeconfig.")
         return 1
@@ -150,7 +173,7 @@ def main() -> int:
     print("🤖 \033[1mK8s Resolution Advisor: Scanning Cluster...\033[0m")
     print("-" * 60)
     
-    analyze_pods()
+    analyze_pods(fast=args.fast)
     analyze_pvcs()
     analyze_services()
     
@@ -13,7 +13,7 @@ sys.path.append(SRC_PATH)
 try:
     from devops_toolkit.utils.logging import setup_logger
     from devops_toolkit.system import run_command, check_binary_exists
-    from devops_toolkit.k8s.operations import ensure_namespace, wait_for_deployment
+    from devops_toolkit.k8s.operations import ensure_namespace, wait_for_deployments
 except ImportError as e:
     print(f"Error: Could not import devops_toolkit. {e}")
     sys.exit(1)
@@ -33,9 +33,10 @@ def install_argocd():
 
     # 3. Wait for Components
     logger.info("⏳ Waiting for ArgoCD Server to be Ready (this may take 2-3 mins)...")
-    # We wait for the repo-server first as a health indicator
-    wait_for_deployment("argocd-repo-server", "argocd")
-    wait_for_deployment("argocd-server", "argocd")
+    # One watch tracks both components, so the wait is the slowest one, not the sum.
+    missed = wait_for_deployments(["argocd-repo-server", "argocd-server"], "argocd", timeout=300)
+    if missed:
+        raise TimeoutError(f"ArgoCD components not ready: {', '.join(missed)}")
     
     logger.info("✅ ArgoCD Core Services are Ready.")
 
@@ -114,7 +115,8 @@ def main() -> int:
     try:
         install_argocd()
         deploy_gitops_app()
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, TimeoutError, RuntimeError) as e:
+        logger.error(f"Installation failed: {e}")
         return 1
     
     password = get_admin_password()
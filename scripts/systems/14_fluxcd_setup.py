@@ -12,7 +12,7 @@ sys.path.append(SRC_PATH)
 try:
     from devops_toolkit.utils.logging import setup_logger
     from devops_toolkit.system import run_command, check_binary_exists
-    from devops_toolkit.k8s.operations import wait_for_deployment
+    from devops_toolkit.k8s.operations import wait_for_deployments
 except ImportError as e:
     print(f"Error: Could not import devops_toolkit. {e}")
     sys.exit(1)
@@ -39,8 +39,10 @@ def install_flux():
         "notification-controller"
     ]
 
-    for comp in components:
-        wait_for_deployment(comp, "flux-system")
+    # One watch tracks every controller, so the wait is the slowest one, not the sum.
+    missed = wait_for_deployments(components, "flux-system", timeout=300)
+    if missed:
+        raise TimeoutError(f"Flux controllers not ready: {', '.join(missed)}")
     
     logger.info("✅ Flux CD Core Services are Ready.")
 
@@ -104,7 +106,8 @@ def main() -> int:
     try:
         install_flux()
         deploy_flux_app()
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, TimeoutError, RuntimeError) as e:
+        logger.error(f"Installation failed: {e}")
         return 1
     
     print("\n🎉 \033[1mINSTALLATION COMPLETE!\033[0m")
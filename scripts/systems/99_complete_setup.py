@@ -10,6 +10,9 @@ It orchestrates:
 
 Engineering Principle: "Idempotency". You can run this script 10 times, 
 and it will only do the work that is missing.
+
+The steps form a DAG (minikube -> ArgoCD, minikube -> FluxCD), so ArgoCD and
+FluxCD are installed concurrently once the cluster is up.
 """
 
 import subprocess
@@ -24,6 +27,7 @@ try:
     from devops_toolkit.utils.logging import setup_logger
     from devops_toolkit.system import check_binary_exists, run_command
     from devops_toolkit.k8s.operations import start_minikube
+    from devops_toolkit.dag import Task, run_dag
 except ImportError as e:
     print(f"Error: Could not import devops_toolkit. {e}")
     sys.exit(1)
@@ -46,7 +50,8 @@ def run_setup_script(script_name: str):
         subprocess.run([sys.executable, script_path], check=True, env=env)
     except subprocess.CalledProcessError:
         logger.error(f"❌ {script_name} failed.")
-        sys.exit(1)
+        # Raise instead of sys.exit(): this runs inside a DAG worker thread.
+        raise
 
 if __name__ == "__main__":
     print("\n--- 🛠  INTERVIEW ENVIRONMENT BOOTSTRAPPER 🛠  ---\n")
@@ -57,15 +62,18 @@ if __name__ == "__main__":
             logger.error(f"❌ Critical Error: '{cmd}' is not installed.")
             sys.exit(1)
 
-    # 2. Infrastructure Layer
-    start_minikube()
-
-    # 3. Application Layer (GitOps)
-    print("\n[ Installing ArgoCD ]")
-    run_setup_script("13_gitops_setup.py")
-
-    print("\n[ Installing FluxCD ]")
-    run_setup_script("14_fluxcd_setup.py")
+    # 2. Infrastructure Layer -> 3. Application Layer (GitOps)
+    # ArgoCD and FluxCD only depend on the cluster, so they install in parallel.
+    print("\n[ Minikube -> ArgoCD + FluxCD ]")
+    result = run_dag([
+        Task("minikube", start_minikube),
+        Task("argocd", lambda: run_setup_script("13_gitops_setup.py"), deps=["minikube"]),
+        Task("fluxcd", lambda: run_setup_script("14_fluxcd_setup.py"), deps=["minikube"]),
+    ])
+    print("\n" + result.summary())
+    if not result.ok:
+        logger.error("❌ Environment setup failed.")
+        sys.exit(1)
 
     print("\n" + "="*60)
     print("✅✅✅  COMPLETE ENVIRONMENT READY  ✅✅✅")
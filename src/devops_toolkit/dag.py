@@ -0,0 +1,254 @@
+import logging
+import time
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SUCCESS = "success"
+FAILED = "failed"
+TIMEOUT = "timeout"
+SKIPPED = "skipped"
+
+# How often run_dag re-checks for queued tasks with a timeout that have started.
+_START_POLL = 0.05
+
+class Task:
+    """
+    A unit of work in a DAG.
+
+    Args:
+        name: Unique task name.
+        func: Zero-argument callable to run.
+        deps: Names of tasks that must succeed before this one starts.
+        timeout: Seconds to wait for the task before marking it as timed out.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        deps: Optional[Iterable[str]] = None,
+        timeout: Optional[float] = None
+    ):
+        self.name = name
+        self.func = func
+        self.deps = list(deps or [])
+        self.timeout = timeout
+
+    def __repr__(self) -> str:
+        return f"Task({self.name!r}, deps={self.deps})"
+
+class TaskResult:
+    """Outcome of a single task: status, timings, return value or error."""
+
+    def __init__(self, name: str, status: str, start: float = 0.0, end: float = 0.0,
+                 result: Any = None, error: Optional[BaseException] = None):
+        self.name = name
+        self.status = status
+        self.start = start
+        self.end = end
+        self.result = result
+        self.error = error
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    def __repr__(self) -> str:
+        return f"TaskResult({self.name!r}, {self.status}, {self.duration:.2f}s)"
+
+class DagResult:
+    """Aggregate outcome of run_dag, including the critical path."""
+
+    def __init__(self, results: Dict[str, TaskResult], critical_path: List[str],
+                 critical_path_seconds: float, wall_seconds: float):
+        self.results = results
+        self.critical_path = critical_path
+        self.critical_path_seconds = critical_path_seconds
+        self.wall_seconds = wall_seconds
+
+    @property
+    def ok(self) -> bool:
+        return all(r.status == SUCCESS for r in self.results.values())
+
+    def summary(self) -> str:
+        """Human-readable table of task timings plus the critical path."""
+        lines = [f"{'TASK':<30} {'STATUS':<8} {'SECONDS':>8}"]
+        for r in sorted(self.results.values(), key=lambda r: (r.start or float("inf"), r.name)):
+            lines.append(f"{r.name:<30} {r.status:<8} {r.duration:>8.2f}")
+        lines.append(f"Critical path: {' -> '.join(self.critical_path) or '<none>'} "
+                     f"({self.critical_path_seconds:.2f}s of {self.wall_seconds:.2f}s wall)")
+        return "\n".join(lines)
+
+def _topological_order(tasks: Dict[str, Task]) -> List[str]:
+    """Kahn's algorithm (same as install_order in advanced_devops_algos.py)."""
+    in_degree = {name: len(task.deps) for name, task in tasks.items()}
+    dependents = defaultdict(list)
+    for name, task in tasks.items():
+        for dep in task.deps:
+            if dep not in tasks:
+                raise ValueError(f"Task '{name}' depends on unknown task '{dep}'")
+            dependents[dep].append(name)
+
+    queue = deque(name for name, degree in in_degree.items() if degree == 0)
+    order = []
+    while queue:
+        node = queue.popleft()
+        order.append(node)
+        for child in dependents[node]:
+            in_degree[child] -= 1
+            if in_degree[child] == 0:
+                queue.append(child)
+
+    if len(order) != len(tasks):
+        raise ValueError("Cyclic Dependency Detected! Cannot build.")
+    return order
+
+def _critical_path(tasks: Dict[str, Task], order: List[str],
+                   results: Dict[str, TaskResult]) -> Tuple[List[str], float]:
+    """Longest duration-weighted chain through the tasks that actually ran."""
+    best: Dict[str, float] = {}
+    prev: Dict[str, Optional[str]] = {}
+    for name in order:
+        result = results[name]
+        if result.status == SKIPPED:
+            continue
+        parent = max((d for d in tasks[name].deps if d in best), key=best.get, default=None)
+        best[name] = result.duration + (best[parent] if parent else 0.0)
+        prev[name] = parent
+
+    if not best:
+        return [], 0.0
+    node = max(best, key=best.get)
+    total = best[node]
+    path = []
+    while node:
+        path.append(node)
+        node = prev[node]
+    return path[::-1], total
+
+def run_dag(tasks: Iterable[Task], max_workers: int = 4) -> DagResult:
+    """
+    Runs tasks concurrently while respecting their dependencies.
+
+    A task is dispatched to the thread pool as soon as all of its dependencies have
+    succeeded (in-degree zero), rather than in a flat serial order. If a task fails or
+    exceeds its timeout, every task that depends on it (directly or transitively) is
+    skipped; independent branches keep running.
+
+    Timeouts and durations are measured from when a task starts running on a
+    worker, not from when it was queued, so waiting for a free worker never counts
+    against a task.
+
+    Note: Python threads cannot be killed, so a timed-out task keeps running in the
+    background; the DAG just stops waiting for it.
+
+    Returns:
+        DagResult with per-task results and the critical path.
+
+    Raises:
+        ValueError: On unknown dependencies or cycles.
+    """
+    task_map: Dict[str, Task] = {}
+    for task in tasks:
+        if task.name in task_map:
+            raise ValueError(f"Duplicate task name '{task.name}'")
+        task_map[task.name] = task
+    order = _topological_order(task_map)
+
+    dependents = defaultdict(list)
+    remaining = {}
+    for name, task in task_map.items():
+        remaining[name] = len(task.deps)
+        for dep in task.deps:
+            dependents[dep].append(name)
+
+    results: Dict[str, TaskResult] = {}
+    running: Dict[Future, str] = {}
+    ready = deque(name for name in order if remaining[name] == 0)
+
+    def skip_dependents(root: str) -> None:
+        stack = list(dependents[root])
+        while stack:
+            name = stack.pop()
+            if name in results:
+                continue
+            logger.warning(f"Skipping '{name}' because '{root}' did not succeed.")
+            results[name] = TaskResult(name, SKIPPED)
+            stack.extend(dependents[name])
+
+    def finish(name: str, result: TaskResult) -> None:
+        results[name] = result
+        if result.status == SUCCESS:
+            for child in dependents[name]:
+                remaining[child] -= 1
+                if remaining[child] == 0 and child not in results:
+                    ready.append(child)
+        else:
+            skip_dependents(name)
+
+    wall_start = time.monotonic()
+    # Set by the worker thread when a task actually starts (dict writes are atomic).
+    starts: Dict[str, float] = {}
+
+    def start(name: str) -> Any:
+        starts[name] = time.monotonic()
+        logger.info(f"▶ Starting task '{name}'")
+        return task_map[name].func()
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        while ready or running:
+            while ready:
+                name = ready.popleft()
+                running[executor.submit(start, name)] = name
+
+            deadlines: Dict[Future, float] = {}
+            queued_with_timeout = False
+            for future, name in running.items():
+                timeout = task_map[name].timeout
+                if timeout is None:
+                    continue
+                if name in starts:
+                    deadlines[future] = starts[name] + timeout
+                else:
+                    queued_with_timeout = True
+
+            wait_timeout = None
+            if deadlines:
+                wait_timeout = max(0.0, min(deadlines.values()) - time.monotonic())
+            if queued_with_timeout:
+                # Nothing wakes us when a queued task starts; poll to pick up its deadline.
+                wait_timeout = min(wait_timeout if wait_timeout is not None else _START_POLL, _START_POLL)
+            done, _ = wait(list(running), timeout=wait_timeout, return_when=FIRST_COMPLETED)
+
+            now = time.monotonic()
+            for future in done:
+                name = running.pop(future)
+                deadlines.pop(future, None)
+                error = future.exception()
+                if error is None:
+                    logger.info(f"✅ Task '{name}' finished in {now - starts[name]:.2f}s")
+                    finish(name, TaskResult(name, SUCCESS, starts[name], now, result=future.result()))
+                else:
+                    logger.error(f"❌ Task '{name}' failed: {error}")
+                    finish(name, TaskResult(name, FAILED, starts[name], now, error=error))
+
+            for future, deadline in list(deadlines.items()):
+                if now >= deadline and future in running:
+                    name = running.pop(future)
+                    deadlines.pop(future)
+                    logger.error(f"⏰ Task '{name}' timed out after {task_map[name].timeout}s")
+                    finish(name, TaskResult(
+                        name, TIMEOUT, starts[name], now,
+                        error=TimeoutError(f"Task '{name}' exceeded {task_map[name].timeout}s")
+                    ))
+    finally:
+        # Don't block on timed-out tasks that are still running.
+        executor.shutdown(wait=False)
+
+    wall_seconds = time.monotonic() - wall_start
+    critical_path, critical_seconds = _critical_path(task_map, order, results)
+    return DagResult(results, critical_path, critical_seconds, wall_seconds)
@@ -0,0 +1,143 @@
+"""
+Asyncio layer for fanning out list calls across namespaces and clusters.
+
+The official client is synchronous, so each request runs on a worker thread (a pool
+sized to the concurrency cap), on the shared per-cluster ApiClient from
+ClientRegistry (one connection pool per cluster; raise client_registry.pool_maxsize
+to match high concurrency). asyncio supplies the scheduling: a global concurrency
+cap plus a token-bucket rate limit per cluster so one check can't flood an API server.
+"""
+
+import asyncio
+import functools
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from devops_toolkit.k8s.client import get_api_client
+from devops_toolkit.k8s.pager import DEFAULT_PAGE_SIZE, _continue_token
+
+logger = logging.getLogger(__name__)
+
+ResultKey = Tuple[Optional[str], str]
+
+class AsyncRateLimiter:
+    """Token bucket for asyncio: `rate` requests/second with bursts up to `burst`."""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = rate
+        self.capacity = float(burst if burst is not None else max(1, int(rate)))
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+def _core_api(context: Optional[str], kubeconfig_path: Optional[str]):
+    from kubernetes import client
+
+    api_client = get_api_client(kubeconfig_path, context)
+    if api_client is None:
+        raise RuntimeError(f"Could not load cluster config for context {context!r}")
+    return client.CoreV1Api(api_client)
+
+async def _in_thread(executor: ThreadPoolExecutor, func, *args, **kwargs) -> Any:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+async def _list_all_pages(
+    executor: ThreadPoolExecutor, list_func, args: tuple, kwargs: Dict[str, Any], page_size: int,
+    semaphore: asyncio.Semaphore, limiter: AsyncRateLimiter
+) -> List[Any]:
+    """Follows continue tokens; every page counts against the concurrency cap and rate limit."""
+    items: List[Any] = []
+    token = None
+    while True:
+        page_kwargs = dict(kwargs, limit=page_size)
+        if token:
+            page_kwargs["_continue"] = token
+        async with semaphore:
+            await limiter.acquire()
+            page = await _in_thread(executor, list_func, *args, **page_kwargs)
+        items.extend(page.items or [])
+        token = _continue_token(page)
+        if not token:
+            return items
+
+async def gather_namespaced(
+    method: str,
+    namespaces: Optional[Sequence[str]] = None,
+    contexts: Sequence[Optional[str]] = (None,),
+    kubeconfig_path: Optional[str] = None,
+    concurrency: int = 32,
+    rate_per_cluster: float = 20.0,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    **list_kwargs
+) -> Dict[ResultKey, List[Any]]:
+    """
+    Runs a namespaced CoreV1Api list method concurrently for every (context, namespace).
+
+    Args:
+        method: CoreV1Api method name, e.g. "list_namespaced_pod".
+        namespaces: Namespaces to scan; None = every namespace in each cluster.
+        contexts: kubeconfig contexts to scan (None = current context / in-cluster).
+        concurrency: Max in-flight requests across all clusters.
+        rate_per_cluster: Max requests per second against each API server.
+        **list_kwargs: Forwarded to the list call (label_selector, field_selector...).
+
+    Returns:
+        {(context, namespace): [objects]}. Failed targets are logged and omitted.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    limiters = {ctx: AsyncRateLimiter(rate_per_cluster) for ctx in contexts}
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="k8s-aio")
+
+    async def targets_for(ctx: Optional[str]) -> List[ResultKey]:
+        if namespaces is not None:
+            return [(ctx, ns) for ns in namespaces]
+        v1 = await _in_thread(executor, _core_api, ctx, kubeconfig_path)
+        found = await _list_all_pages(executor, v1.list_namespace, (), {}, page_size, semaphore, limiters[ctx])
+        return [(ctx, ns.metadata.name) for ns in found]
+
+    async def run_one(key: ResultKey) -> Tuple[ResultKey, Optional[List[Any]]]:
+        ctx, ns = key
+        try:
+            v1 = await _in_thread(executor, _core_api, ctx, kubeconfig_path)
+            items = await _list_all_pages(
+                executor, getattr(v1, method), (ns,), list_kwargs, page_size, semaphore, limiters[ctx]
+            )
+            return key, items
+        except Exception as e:
+            logger.error(f"{method} failed for context={ctx} namespace={ns}: {e}")
+            return key, None
+
+    try:
+        target_lists = await asyncio.gather(*(targets_for(ctx) for ctx in contexts), return_exceptions=True)
+        targets: List[ResultKey] = []
+        for ctx, result in zip(contexts, target_lists):
+            if isinstance(result, BaseException):
+                logger.error(f"Could not enumerate namespaces for context={ctx}: {result}")
+            else:
+                targets.extend(result)
+
+        start = time.monotonic()
+        results = await asyncio.gather(*(run_one(key) for key in targets))
+    finally:
+        executor.shutdown(wait=False)
+    logger.info(f"{method}: {len(targets)} targets across {len(contexts)} cluster(s) "
+                f"in {time.monotonic() - start:.2f}s")
+    return {key: items for key, items in results if items is not None}
+
+def list_namespaced_across(method: str, **kwargs) -> Dict[ResultKey, List[Any]]:
+    """Blocking wrapper around gather_namespaced for synchronous scripts."""
+    return asyncio.run(gather_namespaced(method, **kwargs))
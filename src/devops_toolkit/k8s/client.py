@@ -1,15 +1,37 @@
+import importlib.util
 import logging
-from typing import Optional
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
 
-try:
-    from kubernetes import client, config
-    from kubernetes.client.rest import ApiException
-    KUBERNETES_AVAILABLE = True
-except ImportError:
-    KUBERNETES_AVAILABLE = False
+# Importing kubernetes pulls in hundreds of generated model modules (~0.5-1s), so we
+# only check that it is installed here and import it the first time an API is needed.
+KUBERNETES_AVAILABLE = importlib.util.find_spec("kubernetes") is not None
+
+_LAZY_NAMES = ("client", "config", "ApiException")
+_import_lock = threading.Lock()
 
 logger = logging.getLogger(__name__)
 
+def _ensure_kubernetes() -> None:
+    """Imports kubernetes.client/config on first use and publishes them as module globals."""
+    if all(name in globals() for name in _LAZY_NAMES):
+        return
+    with _import_lock:
+        from kubernetes import client, config
+        from kubernetes.client.rest import ApiException
+        for name, value in (("client", client), ("config", config), ("ApiException", ApiException)):
+            globals().setdefault(name, value)
+
+def __getattr__(name: str) -> Any:
+    """PEP 562 hook: `devops_toolkit.k8s.client.ApiException` etc. trigger the lazy import."""
+    if name in _LAZY_NAMES:
+        if not KUBERNETES_AVAILABLE:
+            raise AttributeError(f"'kubernetes' is not installed; {name} is unavailable")
+        _ensure_kubernetes()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 def load_k8s_config(kubeconfig_path: Optional[str] = None) -> bool:
     """
     Loads authentication for the K8s cluster.
@@ -22,6 +44,7 @@ def load_k8s_config(kubeconfig_path: Optional[str] = None) -> bool:
         logger.error("The 'kubernetes' library is not installed. Run: pip install kubernetes")
         return False
 
+    _ensure_kubernetes()
     try:
         if kubeconfig_path:
             config.load_kube_config(config_file=kubeconfig_path)
@@ -39,14 +62,144 @@ def load_k8s_config(kubeconfig_path: Optional[str] = None) -> bool:
         logger.error(f"Failed to load cluster config: {e}")
         return False
 
-def get_core_api() -> Optional['client.CoreV1Api']:
-    """Returns an authenticated CoreV1Api client or None."""
-    if load_k8s_config():
-        return client.CoreV1Api()
+# In-cluster service account token; kubelet rotates it in place.
+SERVICE_ACCOUNT_TOKEN = "/var/run/secrets/kubernetes.io/serviceaccount/token"
+
+def _mtime(path: str) -> Optional[int]:
+    try:
+        return os.stat(os.path.expanduser(path)).st_mtime_ns
+    except OSError:
+        return None
+
+def _credentials_fingerprint(kubeconfig_path: Optional[str]) -> Tuple[Optional[int], ...]:
+    """mtimes of every credential source; any change means credentials were rotated."""
+    if kubeconfig_path:
+        paths = [kubeconfig_path]
+    else:
+        paths = (os.environ.get("KUBECONFIG") or "~/.kube/config").split(os.pathsep)
+    return tuple(_mtime(p) for p in [*paths, SERVICE_ACCOUNT_TOKEN])
+
+class ClientRegistry:
+    """
+    Thread-safe, lazily initialized cache of ApiClient objects keyed by (kubeconfig, context).
+
+    Why:
+    - load_k8s_config() re-reads and re-parses kubeconfig (or the in-cluster token) on
+      every call, and each new ApiClient opens its own urllib3 connection pool.
+    - Sharing one client per cluster means every CoreV1Api/CustomObjectsApi/... built on
+      top of it reuses the same keep-alive connections.
+    - The client is rebuilt when the kubeconfig or service account token changes on disk.
+
+    Building a client (parsing kubeconfig, exec credential plugins...) happens under a
+    per-(kubeconfig, context) lock, so a slow cluster never delays first use of another.
+    """
+
+    def __init__(self, pool_maxsize: int = 10):
+        self.pool_maxsize = pool_maxsize
+        self._clients: Dict[Tuple[Optional[str], Optional[str]], Tuple['client.ApiClient', tuple]] = {}
+        self._lock = threading.Lock()
+        self._build_locks: Dict[Tuple[Optional[str], Optional[str]], threading.Lock] = {}
+        self.hits = 0
+        self.builds = 0
+        self.reloads = 0
+
+    def _build(self, kubeconfig_path: Optional[str], context: Optional[str]) -> 'client.ApiClient':
+        _ensure_kubernetes()
+        configuration = client.Configuration()
+        if kubeconfig_path or context:
+            config.load_kube_config(
+                config_file=kubeconfig_path, context=context, client_configuration=configuration
+            )
+        else:
+            # Same precedence as load_k8s_config: in-cluster first, then ~/.kube/config.
+            try:
+                config.load_incluster_config(client_configuration=configuration)
+            except config.ConfigException:
+                config.load_kube_config(client_configuration=configuration)
+        configuration.connection_pool_maxsize = self.pool_maxsize
+        return client.ApiClient(configuration=configuration)
+
+    def get(self, kubeconfig_path: Optional[str] = None, context: Optional[str] = None) -> 'client.ApiClient':
+        """Returns the shared ApiClient for a cluster, building or reloading it if needed."""
+        key = (kubeconfig_path, context)
+        fingerprint = _credentials_fingerprint(kubeconfig_path)
+        with self._lock:
+            cached = self._clients.get(key)
+            if cached and cached[1] == fingerprint:
+                self.hits += 1
+                return cached[0]
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+
+        with build_lock:
+            # Another thread may have built this client while we waited.
+            with self._lock:
+                cached = self._clients.get(key)
+                if cached and cached[1] == fingerprint:
+                    self.hits += 1
+                    return cached[0]
+            if cached:
+                logger.info(f"Credentials changed for {key}; reloading API client.")
+            api_client = self._build(kubeconfig_path, context)
+            with self._lock:
+                if cached:
+                    self.reloads += 1
+                self.builds += 1
+                self._clients[key] = (api_client, fingerprint)
+            return api_client
+
+    def clear(self) -> None:
+        """Drops every cached client (their pools are closed when garbage collected)."""
+        with self._lock:
+            self._clients.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Cache counters plus urllib3 pool usage (requests served vs. connections opened)."""
+        connections = requests = 0
+        with self._lock:
+            for api_client, _ in self._clients.values():
+                for pool in api_client.rest_client.pool_manager.pools.values():
+                    connections += pool.num_connections
+                    requests += pool.num_requests
+            return {
+                "clients": len(self._clients),
+                "hits": self.hits,
+                "builds": self.builds,
+                "reloads": self.reloads,
+                "connections_opened": connections,
+                "requests_sent": requests,
+                "connections_reused": max(0, requests - connections),
+            }
+
+client_registry = ClientRegistry()
+
+def get_api_client(kubeconfig_path: Optional[str] = None, context: Optional[str] = None) -> Optional['client.ApiClient']:
+    """Returns the process-wide shared ApiClient for a cluster, or None if config cannot be loaded."""
+    if not KUBERNETES_AVAILABLE:
+        logger.error("The 'kubernetes' library is not installed. Run: pip install kubernetes")
+        return None
+    try:
+        return client_registry.get(kubeconfig_path, context)
+    except Exception as e:
+        logger.error(f"Failed to load cluster config: {e}")
+        return None
+
+def get_core_api(kubeconfig_path: Optional[str] = None, context: Optional[str] = None) -> Optional['client.CoreV1Api']:
+    """Returns an authenticated CoreV1Api client (on the shared connection pool) or None."""
+    api_client = get_api_client(kubeconfig_path, context)
+    if api_client:
+        return client.CoreV1Api(api_client)
+    return None
+
+def get_custom_objects_api(kubeconfig_path: Optional[str] = None, context: Optional[str] = None) -> Optional['client.CustomObjectsApi']:
+    """Returns an authenticated CustomObjectsApi client (on the shared connection pool) or None."""
+    api_client = get_api_client(kubeconfig_path, context)
+    if api_client:
+        return client.CustomObjectsApi(api_client)
     return None
 
-def get_custom_objects_api() -> Optional['client.CustomObjectsApi']:
-    """Returns an authenticated CustomObjectsApi client or None."""
-    if load_k8s_config():
-        return client.CustomObjectsApi()
+def get_apps_api(kubeconfig_path: Optional[str] = None, context: Optional[str] = None) -> Optional['client.AppsV1Api']:
+    """Returns an authenticated AppsV1Api client (on the shared connection pool) or None."""
+    api_client = get_api_client(kubeconfig_path, context)
+    if api_client:
+        return client.AppsV1Api(api_client)
     return None
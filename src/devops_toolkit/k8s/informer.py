@@ -0,0 +1,215 @@
+import logging
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from devops_toolkit.k8s.pager import DEFAULT_PAGE_SIZE, iter_pages
+
+logger = logging.getLogger(__name__)
+
+Key = Tuple[Optional[str], str]
+
+class Informer:
+    """
+    Keeps an in-memory, indexed copy of one resource type in sync with the API server.
+
+    Strategy (same as client-go informers):
+    1. LIST (paged) to build the store and get a resourceVersion.
+    2. WATCH from that resourceVersion with bookmarks, applying ADDED/MODIFIED/DELETED.
+    3. If the resourceVersion is too old (410 Gone), go back to step 1.
+
+    Checks then read the local store instead of re-downloading the cluster.
+
+    Usage:
+        pods = Informer(v1.list_pod_for_all_namespaces).start()
+        pods.wait_for_sync(timeout=60)
+        for pod in pods.by_namespace("default"): ...
+    """
+
+    def __init__(
+        self,
+        list_func: Callable[..., Any],
+        *args,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        watch_timeout: int = 300,
+        retry_delay: float = 5.0,
+        **kwargs
+    ):
+        self.list_func = list_func
+        self.args = args
+        self.kwargs = kwargs
+        self.page_size = page_size
+        self.watch_timeout = watch_timeout
+        self.retry_delay = retry_delay
+        self.resource_version: Optional[str] = None
+        self.relists = 0
+
+        self._objects: Dict[Key, Any] = {}
+        self._by_namespace: Dict[Optional[str], Set[Key]] = defaultdict(set)
+        self._by_label: Dict[Tuple[str, str], Set[Key]] = defaultdict(set)
+        self._by_owner: Dict[str, Set[Key]] = defaultdict(set)
+        self._lock = threading.RLock()
+        self._synced = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._watch = None
+
+    # ---------- store ----------
+
+    @staticmethod
+    def _key(obj: Any) -> Key:
+        return (obj.metadata.namespace, obj.metadata.name)
+
+    def _index(self, key: Key, obj: Any) -> None:
+        metadata = obj.metadata
+        self._by_namespace[metadata.namespace].add(key)
+        for label in (metadata.labels or {}).items():
+            self._by_label[label].add(key)
+        for owner in metadata.owner_references or []:
+            self._by_owner[owner.uid].add(key)
+
+    def _unindex(self, key: Key, obj: Any) -> None:
+        metadata = obj.metadata
+        self._by_namespace[metadata.namespace].discard(key)
+        for label in (metadata.labels or {}).items():
+            self._by_label[label].discard(key)
+        for owner in metadata.owner_references or []:
+            self._by_owner[owner.uid].discard(key)
+
+    def _upsert(self, obj: Any) -> None:
+        key = self._key(obj)
+        old = self._objects.get(key)
+        if old is not None:
+            self._unindex(key, old)
+        self._objects[key] = obj
+        self._index(key, obj)
+
+    def _delete(self, obj: Any) -> None:
+        key = self._key(obj)
+        old = self._objects.pop(key, None)
+        if old is not None:
+            self._unindex(key, old)
+
+    def _lookup(self, keys: Set[Key]) -> List[Any]:
+        return [self._objects[k] for k in keys]
+
+    # ---------- sync loop ----------
+
+    def _relist(self) -> None:
+        """Replaces the store with a fresh (paged) LIST."""
+        objects = []
+        resource_version = None
+        for page in iter_pages(self.list_func, *self.args, page_size=self.page_size, **self.kwargs):
+            # Every page of a paginated list is served from the same snapshot.
+            resource_version = resource_version or page.metadata.resource_version
+            objects.extend(page.items)
+
+        with self._lock:
+            self._objects.clear()
+            self._by_namespace.clear()
+            self._by_label.clear()
+            self._by_owner.clear()
+            for obj in objects:
+                self._upsert(obj)
+            self.resource_version = resource_version
+            self.relists += 1
+        self._synced.set()
+        logger.debug(f"Informer listed {len(objects)} objects at resourceVersion {resource_version}")
+
+    def _apply_event(self, event: Dict[str, Any]) -> None:
+        """Applies one watch event to the store."""
+        event_type = event["type"]
+        obj = event["object"]
+        with self._lock:
+            if event_type in ("ADDED", "MODIFIED"):
+                self._upsert(obj)
+            elif event_type == "DELETED":
+                self._delete(obj)
+            # BOOKMARK events only carry a newer resourceVersion.
+            self.resource_version = obj.metadata.resource_version
+
+    def _watch_once(self) -> None:
+        """Runs one watch call until the server-side timeout or stop()."""
+        from kubernetes import watch
+
+        self._watch = watch.Watch()
+        for event in self._watch.stream(
+            self.list_func, *self.args,
+            resource_version=self.resource_version,
+            allow_watch_bookmarks=True,
+            timeout_seconds=self.watch_timeout,
+            **self.kwargs
+        ):
+            self._apply_event(event)
+            if self._stop.is_set():
+                break
+
+    def _run(self) -> None:
+        from kubernetes.client.rest import ApiException
+
+        needs_list = True
+        while not self._stop.is_set():
+            try:
+                if needs_list:
+                    self._relist()
+                    needs_list = False
+                self._watch_once()
+            except ApiException as e:
+                if e.status == 410:
+                    logger.info("Informer resourceVersion expired (410 Gone); re-listing.")
+                else:
+                    logger.error(f"Informer API error: {e}")
+                    self._stop.wait(self.retry_delay)
+                needs_list = True
+            except Exception as e:
+                logger.error(f"Informer error: {e}")
+                needs_list = True
+                self._stop.wait(self.retry_delay)
+
+    def start(self) -> "Informer":
+        """Starts syncing on a daemon thread."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="k8s-informer", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops the watch loop; the store keeps its last contents."""
+        self._stop.set()
+        if self._watch is not None:
+            self._watch.stop()
+
+    def wait_for_sync(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until the initial LIST has populated the store."""
+        return self._synced.wait(timeout)
+
+    @property
+    def has_synced(self) -> bool:
+        return self._synced.is_set()
+
+    # ---------- queries ----------
+
+    def list(self) -> List[Any]:
+        with self._lock:
+            return list(self._objects.values())
+
+    def get(self, namespace: Optional[str], name: str) -> Optional[Any]:
+        with self._lock:
+            return self._objects.get((namespace, name))
+
+    def by_namespace(self, namespace: Optional[str]) -> List[Any]:
+        with self._lock:
+            return self._lookup(self._by_namespace.get(namespace, set()))
+
+    def by_label(self, key: str, value: str) -> List[Any]:
+        with self._lock:
+            return self._lookup(self._by_label.get((key, value), set()))
+
+    def by_owner(self, owner_uid: str) -> List[Any]:
+        with self._lock:
+            return self._lookup(self._by_owner.get(owner_uid, set()))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._objects)
@@ -1,20 +1,128 @@
+import json
 import logging
+import math
 import subprocess
+import threading
 import time
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
 from devops_toolkit.system import run_command, check_binary_exists
+from devops_toolkit.k8s import client as k8s
+
+if TYPE_CHECKING:
+    from devops_toolkit.k8s.proxy import KubectlProxy
 
 logger = logging.getLogger(__name__)
 
+class MinikubeStatus:
+    """Parsed `minikube status -o json` (control-plane node)."""
+
+    def __init__(self, host: str = "Unknown", kubelet: str = "Unknown", apiserver: str = "Unknown",
+                 kubeconfig: str = "Unknown", running: bool = False, checked_at: float = 0.0):
+        self.host = host
+        self.kubelet = kubelet
+        self.apiserver = apiserver
+        self.kubeconfig = kubeconfig
+        self.running = running
+        self.checked_at = checked_at
+
+    @classmethod
+    def from_result(cls, result: subprocess.CompletedProcess) -> "MinikubeStatus":
+        """Builds a status from the command result; falls back to the exit code if output isn't JSON."""
+        now = time.monotonic()
+        try:
+            data = json.loads(result.stdout)
+        except (TypeError, ValueError):
+            return cls(running=result.returncode == 0, checked_at=now)
+        if isinstance(data, list):  # multi-node clusters report one entry per node
+            data = data[0] if data else {}
+        status = cls(
+            host=data.get("Host", "Unknown"),
+            kubelet=data.get("Kubelet", "Unknown"),
+            apiserver=data.get("APIServer", "Unknown"),
+            kubeconfig=data.get("Kubeconfig", "Unknown"),
+            checked_at=now,
+        )
+        status.running = status.host == status.kubelet == status.apiserver == "Running"
+        return status
+
+    def __repr__(self) -> str:
+        return (f"MinikubeStatus(host={self.host}, kubelet={self.kubelet}, "
+                f"apiserver={self.apiserver}, kubeconfig={self.kubeconfig})")
+
+class MinikubeStatusProbe:
+    """
+    Cached `minikube status` with an optional background refresher.
+
+    Why: `minikube status` queries the VM/container driver and takes seconds. Readiness
+    checks within one session are served from the cache for `ttl` seconds, and a
+    background thread can keep the cache warm so callers never wait.
+    """
+
+    def __init__(self, ttl: float = 10.0):
+        self.ttl = ttl
+        self._status: Optional[MinikubeStatus] = None
+        self._probe_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _probe(self) -> MinikubeStatus:
+        if not check_binary_exists("minikube"):
+            return MinikubeStatus(checked_at=time.monotonic())
+        try:
+            result = run_command(["minikube", "status", "-o", "json"], check=False, capture_output=True)
+        except subprocess.CalledProcessError as e:
+            result = e
+        return MinikubeStatus.from_result(result)
+
+    def get(self, refresh: bool = False) -> MinikubeStatus:
+        """Returns the cached status, re-probing if it is older than `ttl` (or refresh=True)."""
+        status = self._status
+        if not refresh and status is not None and time.monotonic() - status.checked_at < self.ttl:
+            return status
+        return self._refresh()
+
+    def _refresh(self) -> MinikubeStatus:
+        # Serialize probes so concurrent callers don't each spawn `minikube status`.
+        with self._probe_lock:
+            status = self._probe()
+            self._status = status
+            return status
+
+    def invalidate(self) -> None:
+        """Forgets the cached status (e.g. after starting or stopping the cluster)."""
+        self._status = None
+
+    def start_background_refresh(self, interval: Optional[float] = None) -> None:
+        """Re-probes every `interval` seconds (default: ttl / 2) on a daemon thread, so get() never waits."""
+        if self._thread and self._thread.is_alive():
+            return
+        interval = interval or self.ttl / 2
+        self._stop.clear()
+
+        def _loop():
+            while not self._stop.is_set():
+                try:
+                    self._refresh()
+                except Exception as e:
+                    logger.debug(f"Background minikube probe failed: {e}")
+                self._stop.wait(interval)
+
+        self._thread = threading.Thread(target=_loop, name="minikube-status", daemon=True)
+        self._thread.start()
+
+    def stop_background_refresh(self) -> None:
+        self._stop.set()
+
+minikube_probe = MinikubeStatusProbe()
+
+def get_minikube_status(refresh: bool = False) -> MinikubeStatus:
+    """Structured Minikube status (host/kubelet/apiserver), served from the shared cache."""
+    return minikube_probe.get(refresh=refresh)
+
 def check_minikube_running() -> bool:
-    """Checks if Minikube is currently running."""
-    if not check_binary_exists("minikube"):
-        return False
-    try:
-        run_command(["minikube", "status"], check=True, capture_output=True)
-        return True
-    except subprocess.CalledProcessError:
-        return False
+    """Checks if Minikube is currently running (cached; see MinikubeStatusProbe)."""
+    return get_minikube_status().running
 
 def start_minikube(memory: int = 4096, cpus: int = 2, driver: str = "docker"):
     """Starts Minikube if it's not already running."""
@@ -25,11 +133,33 @@ def start_minikube(memory: int = 4096, cpus: int = 2, driver: str = "docker"):
     logger.info("🚀 Minikube is NOT running. Starting it now...")
     cmd = f"minikube start --memory={memory} --cpus={cpus} --driver={driver}"
     run_command(cmd, shell=True)
+    minikube_probe.invalidate()
     logger.info("✅ Minikube started successfully.")
 
-def ensure_namespace(namespace: str):
-    """Idempotently creates a Kubernetes namespace."""
+def ensure_namespace(namespace: str, proxy: Optional["KubectlProxy"] = None):
+    """
+    Idempotently creates a Kubernetes namespace.
+
+    Pass a KubectlProxy (see devops_toolkit.k8s.proxy.get_kubectl_proxy) to go through
+    a long-lived proxy session instead of spawning two kubectl processes.
+    """
     logger.info(f"Ensuring namespace '{namespace}' exists...")
+    if proxy is not None:
+        response = proxy.request("GET", f"/api/v1/namespaces/{namespace}")
+        if response.status_code == 404:
+            logger.info(f"Creating namespace '{namespace}'...")
+            created = proxy.request(
+                "POST", "/api/v1/namespaces",
+                json={"apiVersion": "v1", "kind": "Namespace", "metadata": {"name": namespace}}
+            )
+            # 409: somebody else created it between our GET and POST.
+            if created.status_code != 409:
+                created.raise_for_status()
+        else:
+            response.raise_for_status()
+            logger.debug(f"Namespace '{namespace}' already exists.")
+        return
+
     # Check if exists first to avoid noisy 'already exists' errors if we were just to create
     try:
         run_command(["kubectl", "get", "namespace", namespace], check=True, capture_output=True)
@@ -38,10 +168,184 @@ def ensure_namespace(namespace: str):
         logger.info(f"Creating namespace '{namespace}'...")
         run_command(f"kubectl create namespace {namespace}", shell=True)
 
-def wait_for_deployment(deployment_name: str, namespace: str, timeout: int = 300):
-    """Waits for a deployment to be available."""
+def _deployment_available(deployment: dict) -> bool:
+    """True if the Deployment JSON reports condition Available=True."""
+    for condition in deployment.get("status", {}).get("conditions") or []:
+        if condition.get("type") == "Available" and condition.get("status") == "True":
+            return True
+    return False
+
+def wait_for_deployment(
+    deployment_name: str,
+    namespace: str,
+    timeout: int = 300,
+    proxy: Optional["KubectlProxy"] = None,
+    poll_interval: float = 2.0
+):
+    """
+    Waits for a deployment to be available.
+
+    With a KubectlProxy the status is polled over the proxy's pooled connection and a
+    TimeoutError is raised if the deadline passes; otherwise `kubectl wait` is used.
+    """
     logger.info(f"⏳ Waiting for deployment/{deployment_name} in '{namespace}'...")
+    if proxy is not None:
+        path = f"/apis/apps/v1/namespaces/{namespace}/deployments/{deployment_name}"
+        deadline = time.monotonic() + timeout
+        while True:
+            response = proxy.request("GET", path)
+            if response.status_code != 404:
+                response.raise_for_status()
+                if _deployment_available(response.json()):
+                    return
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"deployment/{deployment_name} in '{namespace}' not available after {timeout}s")
+            time.sleep(poll_interval)
+
     run_command(
         f"kubectl wait --for=condition=available deployment/{deployment_name} -n {namespace} --timeout={timeout}s",
         shell=True
     )
+
+# ==========================================
+# API-native operations (no kubectl processes)
+# ==========================================
+# These run on the shared, cached ApiClient (devops_toolkit.k8s.client), so bulk
+# calls reuse one connection pool. Fan-out defaults to k8s.client_registry.pool_maxsize
+# workers so no request has to open (and then discard) an extra connection; raise
+# both together for wider fan-out.
+
+def _require(api, what: str):
+    if api is None:
+        raise RuntimeError(f"Could not create {what}; check cluster configuration.")
+    return api
+
+def ensure_namespace_api(namespace: str, core_api=None) -> bool:
+    """
+    Idempotently creates a namespace with a single POST.
+
+    Instead of GET-then-create, we just create and treat 409 Conflict as "already exists",
+    which is one round trip and free of check-then-act races.
+
+    Returns:
+        True if the namespace was created, False if it already existed.
+    """
+    v1 = core_api or _require(k8s.get_core_api(), "CoreV1Api")
+    try:
+        v1.create_namespace({"apiVersion": "v1", "kind": "Namespace", "metadata": {"name": namespace}})
+        logger.info(f"Created namespace '{namespace}'.")
+        return True
+    except k8s.ApiException as e:
+        if e.status == 409:
+            logger.debug(f"Namespace '{namespace}' already exists.")
+            return False
+        raise
+
+def ensure_namespaces(namespaces: Iterable[str], max_workers: Optional[int] = None, core_api=None) -> Dict[str, bool]:
+    """
+    ensure_namespace_api for many namespaces concurrently over one connection pool.
+
+    Args:
+        max_workers: Concurrent requests (default: the shared client's pool size,
+            k8s.client_registry.pool_maxsize).
+
+    Returns:
+        {namespace: created?}
+    """
+    v1 = core_api or _require(k8s.get_core_api(), "CoreV1Api")
+    names = list(dict.fromkeys(namespaces))
+    max_workers = max_workers or k8s.client_registry.pool_maxsize
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ensure-ns") as executor:
+        created = executor.map(lambda ns: ensure_namespace_api(ns, core_api=v1), names)
+        return dict(zip(names, created))
+
+def _model_deployment_available(deployment) -> bool:
+    """True if a V1Deployment reports condition Available=True."""
+    for condition in (deployment.status and deployment.status.conditions) or []:
+        if condition.type == "Available" and condition.status == "True":
+            return True
+    return False
+
+def _watch_errors() -> tuple:
+    """API and transport errors a watch can raise (urllib3 ships with kubernetes, imported lazily)."""
+    from urllib3.exceptions import HTTPError
+    return (k8s.ApiException, HTTPError, ConnectionError)
+
+def wait_for_deployment_api(deployment_name: str, namespace: str, timeout: int = 300, apps_api=None):
+    """
+    Waits for a deployment to be available using a WATCH on that single Deployment.
+
+    The watch starts with the current state (synthetic ADDED event) and then receives
+    every status update as it happens, so there is no polling interval and no kubectl.
+
+    Raises:
+        TimeoutError: If the deployment is not Available within `timeout` seconds.
+        RuntimeError: If the API rejects the watch (e.g. RBAC) or the cluster is unreachable.
+    """
+    from kubernetes import watch
+
+    apps = apps_api or _require(k8s.get_apps_api(), "AppsV1Api")
+    logger.info(f"⏳ Waiting for deployment/{deployment_name} in '{namespace}'...")
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"deployment/{deployment_name} in '{namespace}' not available after {timeout}s")
+        w = watch.Watch()
+        try:
+            for event in w.stream(
+                apps.list_namespaced_deployment, namespace,
+                field_selector=f"metadata.name={deployment_name}",
+                timeout_seconds=math.ceil(remaining)
+            ):
+                if event["type"] != "DELETED" and _model_deployment_available(event["object"]):
+                    w.stop()
+                    logger.info(f"✅ deployment/{deployment_name} is available.")
+                    return
+        except _watch_errors() as e:
+            raise RuntimeError(f"Watching deployment/{deployment_name} in '{namespace}' failed: {e}") from e
+
+def wait_for_deployments(deployment_names: Iterable[str], namespace: str, timeout: int = 300, apps_api=None) -> List[str]:
+    """
+    Waits for several deployments in one namespace using a single WATCH stream.
+
+    Every named deployment is tracked at once, so the total wait is the slowest
+    deployment rather than the sum of all of them (as with sequential kubectl waits).
+
+    Returns:
+        Names that did NOT become available before the deadline (empty list = all ready).
+
+    Raises:
+        RuntimeError: If the API rejects the watch (e.g. RBAC) or the cluster is unreachable.
+    """
+    from kubernetes import watch
+
+    apps = apps_api or _require(k8s.get_apps_api(), "AppsV1Api")
+    pending = set(deployment_names)
+    logger.info(f"⏳ Waiting for {len(pending)} deployment(s) in '{namespace}': {', '.join(sorted(pending))}")
+    deadline = time.monotonic() + timeout
+    while pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        w = watch.Watch()
+        try:
+            for event in w.stream(apps.list_namespaced_deployment, namespace, timeout_seconds=math.ceil(remaining)):
+                deployment = event["object"]
+                name = deployment.metadata.name
+                if name in pending and event["type"] != "DELETED" and _model_deployment_available(deployment):
+                    pending.discard(name)
+                    logger.info(f"✅ deployment/{name} is available.")
+                    if not pending:
+                        w.stop()
+                        break
+                if time.monotonic() >= deadline:
+                    w.stop()
+                    break
+        except _watch_errors() as e:
+            raise RuntimeError(f"Watching deployments in '{namespace}' failed: {e}") from e
+
+    missed = sorted(pending)
+    if missed:
+        logger.error(f"Deployments not available in '{namespace}' after {timeout}s: {', '.join(missed)}")
+    return missed
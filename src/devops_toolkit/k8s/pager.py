@@ -0,0 +1,88 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 500
+
+def _continue_token(response: Any) -> Optional[str]:
+    """Extracts metadata.continue from a model list or a raw JSON dict."""
+    if isinstance(response, dict):
+        return (response.get("metadata") or {}).get("continue") or None
+    metadata = getattr(response, "metadata", None)
+    return getattr(metadata, "_continue", None) or None
+
+def iter_pages(
+    list_func: Callable[..., Any],
+    *args,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: bool = True,
+    **kwargs
+) -> Iterator[Any]:
+    """
+    Yields list responses page by page using server-side `limit`/`continue` tokens.
+
+    Args:
+        list_func: Any kubernetes list call, e.g. v1.list_namespaced_pod.
+        *args, **kwargs: Forwarded to list_func (namespace, label_selector, ...).
+        page_size: Objects per page (`limit`).
+        prefetch: Request the next page on a background thread while the caller is
+            still processing the current one.
+
+    Note: The API server expires continue tokens after a few minutes (410 Gone);
+    a consumer that stalls that long gets an ApiException and must restart the list.
+    """
+    def fetch(token: Optional[str]) -> Any:
+        if token:
+            return list_func(*args, limit=page_size, _continue=token, **kwargs)
+        return list_func(*args, limit=page_size, **kwargs)
+
+    if not prefetch:
+        token = None
+        while True:
+            page = fetch(token)
+            yield page
+            token = _continue_token(page)
+            if not token:
+                return
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="k8s-pager")
+    pending = None
+    try:
+        page = fetch(None)
+        while True:
+            token = _continue_token(page)
+            pending = executor.submit(fetch, token) if token else None
+            yield page
+            if pending is None:
+                return
+            page = pending.result()
+    finally:
+        if pending is not None:
+            pending.cancel()
+        executor.shutdown(wait=False)
+
+def paginate(
+    list_func: Callable[..., Any],
+    *args,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: bool = True,
+    **kwargs
+) -> Iterator[Any]:
+    """
+    Yields individual objects from a paginated list call.
+
+    Memory is bounded by roughly two pages (current + prefetched) instead of the
+    whole collection.
+
+    Example:
+        for pod in paginate(v1.list_namespaced_pod, "default", page_size=250):
+            ...
+    """
+    pages = 0
+    for page in iter_pages(list_func, *args, page_size=page_size, prefetch=prefetch, **kwargs):
+        pages += 1
+        items = page.get("items") if isinstance(page, dict) else page.items
+        yield from items or []
+    logger.debug(f"{getattr(list_func, '__name__', 'list')}: fetched {pages} page(s)")
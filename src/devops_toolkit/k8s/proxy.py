@@ -0,0 +1,149 @@
+import atexit
+import logging
+import re
+import subprocess
+import threading
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from devops_toolkit.system import check_binary_exists
+
+logger = logging.getLogger(__name__)
+
+# kubectl prints e.g. "Starting to serve on 127.0.0.1:38411" once the listener is up.
+_SERVE_PATTERN = re.compile(r"Starting to serve on ([\d.]+|\[[0-9a-fA-F:]+\]|localhost):(\d+)")
+
+def _discard_output(stream) -> None:
+    with stream:
+        for _ in stream:
+            pass
+
+class KubectlProxy:
+    """
+    A long-lived `kubectl proxy` session with a pooled HTTP client.
+
+    Why:
+    - Every `kubectl` invocation re-parses kubeconfig and rebuilds discovery caches
+      (150-400 ms). The proxy pays that bootstrap cost once.
+    - Requests go over a keep-alive requests.Session, so repeated calls also reuse
+      the same TCP connections.
+
+    Usage:
+        with KubectlProxy() as proxy:
+            proxy.get_json("/api/v1/namespaces/default")
+    """
+
+    def __init__(
+        self,
+        context: Optional[str] = None,
+        kubeconfig: Optional[str] = None,
+        pool_maxsize: int = 10,
+        startup_timeout: float = 15.0
+    ):
+        self.context = context
+        self.kubeconfig = kubeconfig
+        self.pool_maxsize = pool_maxsize
+        self.startup_timeout = startup_timeout
+        self.base_url: Optional[str] = None
+        self._proc: Optional[subprocess.Popen] = None
+        self._session: Optional[requests.Session] = None
+
+    def start(self) -> "KubectlProxy":
+        """Spawns `kubectl proxy` on a random local port and waits until it is serving."""
+        if self._proc and self._proc.poll() is None:
+            return self
+        if not check_binary_exists("kubectl"):
+            raise RuntimeError("kubectl is required for KubectlProxy")
+
+        cmd = ["kubectl", "proxy", "--port=0"]
+        if self.kubeconfig:
+            cmd.append(f"--kubeconfig={self.kubeconfig}")
+        if self.context:
+            cmd.append(f"--context={self.context}")
+
+        logger.debug(f"Starting proxy: {' '.join(cmd)}")
+        self._proc = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+        )
+
+        # readline() blocks, so read the banner on a helper thread and bound the wait.
+        banner: Dict[str, str] = {}
+        reader = threading.Thread(
+            target=lambda: banner.setdefault("line", self._proc.stdout.readline()), daemon=True
+        )
+        reader.start()
+        reader.join(self.startup_timeout)
+
+        match = _SERVE_PATTERN.search(banner.get("line", ""))
+        if not match:
+            self.close()
+            raise RuntimeError(f"kubectl proxy failed to start: {banner.get('line', '<timeout>').strip()}")
+
+        # Keep draining the merged output so a chatty proxy never blocks on a full pipe.
+        threading.Thread(target=_discard_output, args=(self._proc.stdout,), daemon=True).start()
+
+        self.base_url = f"http://{match.group(1)}:{match.group(2)}"
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize)
+        self._session.mount("http://", adapter)
+        logger.info(f"kubectl proxy serving on {self.base_url}")
+        return self
+
+    def request(self, method: str, path: str, timeout: float = 30.0, **kwargs) -> requests.Response:
+        """Sends a raw request to the API server through the proxy."""
+        if not self._session:
+            self.start()
+        return self._session.request(method, f"{self.base_url}{path}", timeout=timeout, **kwargs)
+
+    def get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """GETs a path and returns the decoded JSON body. Raises on HTTP errors."""
+        response = self.request("GET", path, params=params)
+        response.raise_for_status()
+        return response.json()
+
+    def close(self) -> None:
+        """Closes pooled connections and stops the proxy process."""
+        if self._session:
+            self._session.close()
+            self._session = None
+        if self._proc:
+            if self._proc.poll() is None:
+                self._proc.terminate()
+                try:
+                    self._proc.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    self._proc.kill()
+                    self._proc.wait()
+            self._proc = None
+
+    def __enter__(self) -> "KubectlProxy":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+_proxies: Dict[tuple, KubectlProxy] = {}
+_proxies_lock = threading.Lock()
+
+def get_kubectl_proxy(context: Optional[str] = None, kubeconfig: Optional[str] = None) -> KubectlProxy:
+    """
+    Returns a process-wide KubectlProxy for the given context, starting it on first use.
+    All proxies are stopped automatically at interpreter exit.
+    """
+    key = (kubeconfig, context)
+    with _proxies_lock:
+        proxy = _proxies.get(key)
+        if proxy is None:
+            proxy = KubectlProxy(context=context, kubeconfig=kubeconfig).start()
+            _proxies[key] = proxy
+        return proxy
+
+@atexit.register
+def close_all_proxies() -> None:
+    """Stops every proxy started through get_kubectl_proxy."""
+    with _proxies_lock:
+        for proxy in _proxies.values():
+            proxy.close()
+        _proxies.clear()
@@ -0,0 +1,448 @@
+"""
+Multi-core access-log analyzer.
+
+Same extraction as scripts/algorithms/01_log_parsing.py (client IP + status code per
+line), scaled out: each file is split into newline-aligned byte ranges, the ranges
+are parsed in a ProcessPoolExecutor, and the per-chunk counters are merged into a
+single LogStats.
+
+Two scan modes:
+- text: decode every line to str and regex-search it (the parse_logs approach).
+- mmap: map the file and run a bytes regex straight over the mapped range; only
+  the captured IP/status groups are decoded. In this mode `lines` counts raw
+  newline-terminated lines, including blank ones.
+
+Compressed inputs (.gz, .zst; detected by magic bytes) are stream-decompressed in
+bounded blocks and scanned with the bytes regex, whatever the mode. A gzip file is
+one work unit; a multi-frame zstd file is split on frame boundaries and its frame
+groups are decompressed in parallel, with lines that straddle two groups stitched
+back together in the parent.
+
+With log_format (a devops_toolkit.logs.parsers registry name) every line goes
+through that format's LogParser instead, for logs the built-in regex doesn't
+cover (JSON lines, CRI-prefixed container logs, ...). Compressed files are then
+one work unit each.
+"""
+
+import logging
+import mmap
+import os
+import re
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Pattern, Sequence, Tuple, Union
+
+from devops_toolkit.logs.compression import GZIP, ZSTD, detect_compression, open_log, open_zstd_range, zstd_frames
+from devops_toolkit.logs.parsers import get_parser
+from devops_toolkit.logs.sketches import IpSketch
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, "os.PathLike[str]"]
+Chunk = Tuple[str, int, int]
+# (scanner kind, (path, start, end)); kind is a SCAN_MODES entry, GZIP, ZSTD or RECORDS.
+Unit = Tuple[str, Chunk]
+# (head, tail) of a unit that may start/end mid-line; head is None if it had no newline.
+Fragments = Tuple[Optional[bytes], bytes]
+
+# Group 1: IP Address, Group 2: Status Code
+ACCESS_LOG_PATTERN: Pattern[str] = re.compile(r'(\d+\.\d+\.\d+\.\d+).*?"\w+ .*? HTTP/[\d.]+" (\d{3})')
+
+# The same extraction anchored per line (one match per line, like search()), for
+# finditer over a whole mapped range. `.` never crosses a newline.
+ACCESS_LOG_BYTES_PATTERN: Pattern[bytes] = re.compile(
+    rb'(?m)^.*?(\d+\.\d+\.\d+\.\d+).*?"\w+ .*? HTTP/[\d.]+" (\d{3})'
+)
+
+DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024
+SCAN_MODES = ("text", "mmap")
+RECORDS = "records"
+_COUNT_BLOCK = 1024 * 1024
+_WINDOW = 4 * 1024 * 1024
+
+class LogStats:
+    """
+    Counters for one chunk, file or whole run. Mergeable with `merge`.
+
+    In sketch mode (see sketch_ips) per-IP counts live in a bounded-memory IpSketch
+    instead of the exact ip_counts Counter.
+    """
+
+    def __init__(self):
+        self.ip_counts: Counter = Counter()
+        self.ip_sketch: Optional[IpSketch] = None
+        self.status_counts: Counter = Counter()
+        self.lines = 0
+        self.matched = 0
+        self.bytes = 0
+        self.seconds = 0.0
+
+    @property
+    def server_errors(self) -> int:
+        """Number of 500 responses (what parse_logs reports as server errors)."""
+        return self.status_counts["500"]
+
+    @property
+    def unmatched(self) -> int:
+        return self.lines - self.matched
+
+    @property
+    def distinct_ips(self) -> int:
+        if self.ip_sketch is not None:
+            return self.ip_sketch.distinct()
+        return len(self.ip_counts)
+
+    def top_ips(self, n: int = 3) -> List[Tuple[str, int]]:
+        if self.ip_sketch is not None:
+            return self.ip_sketch.top(n)
+        return self.ip_counts.most_common(n)
+
+    def sketch_ips(self, **sketch_options) -> "LogStats":
+        """Moves the exact ip_counts into an IpSketch (created with sketch_options if needed)."""
+        if self.ip_sketch is None:
+            self.ip_sketch = IpSketch(**sketch_options)
+        self.ip_sketch.update(self.ip_counts)
+        self.ip_counts = Counter()
+        return self
+
+    def merge(self, other: "LogStats") -> "LogStats":
+        self.ip_counts.update(other.ip_counts)
+        if other.ip_sketch is not None:
+            if self.ip_sketch is None:
+                self.ip_sketch = other.ip_sketch
+            else:
+                self.ip_sketch.merge(other.ip_sketch)
+        self.status_counts.update(other.status_counts)
+        self.lines += other.lines
+        self.matched += other.matched
+        self.bytes += other.bytes
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "ip_counts": dict(self.ip_counts),
+            "status_counts": dict(self.status_counts),
+            "lines": self.lines,
+            "matched": self.matched,
+            "bytes": self.bytes,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LogStats":
+        stats = cls()
+        stats.ip_counts.update(data.get("ip_counts", {}))
+        stats.status_counts.update(data.get("status_counts", {}))
+        stats.lines = data.get("lines", 0)
+        stats.matched = data.get("matched", 0)
+        stats.bytes = data.get("bytes", 0)
+        return stats
+
+    def __repr__(self) -> str:
+        return (f"LogStats(lines={self.lines}, matched={self.matched}, "
+                f"server_errors={self.server_errors}, ips={self.distinct_ips})")
+
+def chunk_ranges(path: PathLike, chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[Chunk]:
+    """
+    Splits a file into (path, start, end) byte ranges of about chunk_size bytes.
+
+    Every boundary is moved forward to just after a newline, so no line is split
+    between two chunks.
+    """
+    path = os.fspath(path)
+    size = os.path.getsize(path)
+    ranges: List[Chunk] = []
+    with open(path, "rb") as f:
+        start = 0
+        while start < size:
+            end = start + chunk_size
+            if end >= size:
+                end = size
+            else:
+                f.seek(end)
+                f.readline()
+                end = f.tell()
+            ranges.append((path, start, end))
+            start = end
+    return ranges
+
+def parse_range(path: str, start: int, end: int) -> LogStats:
+    """Parses the lines in [start, end) of a file. Runs inside worker processes."""
+    stats = LogStats()
+    ip_counts = stats.ip_counts
+    status_counts = stats.status_counts
+    search = ACCESS_LOG_PATTERN.search
+    remaining = end - start
+    with open(path, "rb") as f:
+        f.seek(start)
+        for raw in f:
+            remaining -= len(raw)
+            line = raw.decode("utf-8", "replace").strip()
+            if line:
+                stats.lines += 1
+                if match := search(line):
+                    ip_counts[match.group(1)] += 1
+                    status_counts[match.group(2)] += 1
+                    stats.matched += 1
+            if remaining <= 0:
+                break
+    stats.bytes = end - start
+    return stats
+
+def scan_range_mmap(path: str, start: int, end: int) -> LogStats:
+    """Like parse_range, but scans the mapped bytes without decoding whole lines."""
+    stats = LogStats()
+    if end <= start:
+        return stats
+    pairs: Counter = Counter()
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        _scan_buffer(mm, start, end, pairs)
+        # mmap.count() only exists on 3.13+; count newlines in bounded slices instead.
+        stats.lines = sum(
+            mm[pos:min(pos + _COUNT_BLOCK, end)].count(b"\n") for pos in range(start, end, _COUNT_BLOCK)
+        )
+        if mm[end - 1:end] != b"\n":
+            stats.lines += 1
+
+    _add_pairs(stats, pairs)
+    stats.bytes = end - start
+    return stats
+
+def _scan_buffer(buf, start: int, end: int, pairs: Counter) -> None:
+    """
+    Counts (ip, status) byte pairs in buf[start:end] (bytes or mmap).
+
+    findall + Counter keep the per-match work in C; newline-aligned windows bound
+    the size of each findall result list.
+    """
+    findall = ACCESS_LOG_BYTES_PATTERN.findall
+    pos = start
+    while pos < end:
+        stop = buf.find(b"\n", min(pos + _WINDOW, end), end) + 1 or end
+        pairs.update(findall(buf, pos, stop))
+        pos = stop
+
+def _add_pairs(stats: LogStats, pairs: Counter) -> None:
+    # Decode once per distinct (ip, status) rather than once per line.
+    for (ip, status), count in pairs.items():
+        stats.ip_counts[ip.decode("ascii")] += count
+        stats.status_counts[status.decode("ascii")] += count
+    stats.matched += sum(pairs.values())
+
+def _scan_stream(stream: BinaryIO, stats: LogStats) -> Fragments:
+    """
+    Scans the complete lines of a stream, _WINDOW bytes at a time.
+
+    The first line (head) and the trailing partial line (tail) are returned
+    unscanned, since they may continue in a neighbouring unit.
+    """
+    pairs: Counter = Counter()
+    head: Optional[bytes] = None
+    carry = b""
+    while block := stream.read(_WINDOW):
+        stats.bytes += len(block)
+        stats.lines += block.count(b"\n")
+        data = carry + block
+        last = data.rfind(b"\n")
+        if last < 0:
+            carry = data
+            continue
+        start = 0
+        if head is None:
+            start = data.find(b"\n") + 1
+            head = data[:start - 1]
+        _scan_buffer(data, start, last + 1, pairs)
+        carry = data[last + 1:]
+    _add_pairs(stats, pairs)
+    return head, carry
+
+def _scan_line(stats: LogStats, line: bytes) -> None:
+    pairs: Counter = Counter()
+    _scan_buffer(line, 0, len(line), pairs)
+    _add_pairs(stats, pairs)
+
+def scan_stream(stream: BinaryIO) -> LogStats:
+    """Scans a whole stream of (decompressed) log bytes, e.g. from open_log()."""
+    stats = LogStats()
+    head, tail = _scan_stream(stream, stats)
+    if head is not None:
+        _scan_line(stats, head)
+    if tail:
+        stats.lines += 1
+        _scan_line(stats, tail)
+    return stats
+
+def _zstd_units(path: str, chunk_size: int) -> List[Unit]:
+    """Groups a zstd file's frames into work units of about chunk_size decompressed bytes."""
+    # Frame sizes are compressed sizes; assume a typical ~8x text compression ratio.
+    target = max(1, chunk_size // 8)
+    units: List[Unit] = []
+    frames = zstd_frames(path)
+    group_start = frames[0][0] if frames else 0
+    for i, (_, end) in enumerate(frames):
+        if end - group_start >= target or i == len(frames) - 1:
+            units.append((ZSTD, (path, group_start, end)))
+            group_start = end
+    return units
+
+def parse_range_records(path: str, start: int, end: int, log_format: str) -> LogStats:
+    """
+    Parses [start, end) of a plain file, or all of a compressed one, with a registered
+    LogParser. Lines whose record has no client IP or status count as unmatched.
+    """
+    stats = LogStats()
+    ip_counts = stats.ip_counts
+    status_counts = stats.status_counts
+    parse = get_parser(log_format).parse
+    compressed = detect_compression(path) is not None
+    remaining = end - start
+    with (open_log(path) if compressed else open(path, "rb")) as f:
+        if not compressed:
+            f.seek(start)
+        # zstd stream readers don't iterate by line; split decompressed blocks instead.
+        for raw in (_iter_lines(f) if compressed else f):
+            stats.bytes += len(raw)
+            line = raw.decode("utf-8", "replace").strip()
+            if line:
+                stats.lines += 1
+                record = parse(line)
+                if record is not None and record.ip and record.status is not None:
+                    ip_counts[record.ip] += 1
+                    status_counts[str(record.status)] += 1
+                    stats.matched += 1
+            if not compressed:
+                remaining -= len(raw)
+                if remaining <= 0:
+                    break
+    return stats
+
+def _iter_lines(stream: BinaryIO) -> Iterator[bytes]:
+    """Newline-terminated lines (the last one possibly unterminated) of a binary stream."""
+    carry = b""
+    while block := stream.read(_WINDOW):
+        lines = (carry + block).split(b"\n")
+        carry = lines.pop()
+        for line in lines:
+            yield line + b"\n"
+    if carry:
+        yield carry
+
+def _plan_units(path: PathLike, chunk_size: int, mode: str, log_format: Optional[str] = None) -> List[Unit]:
+    path = os.fspath(path)
+    kind = detect_compression(path)
+    if log_format is not None:
+        if kind is not None:
+            return [(RECORDS, (path, 0, os.path.getsize(path)))]
+        return [(RECORDS, chunk) for chunk in chunk_ranges(path, chunk_size)]
+    if kind == GZIP:
+        return [(GZIP, (path, 0, os.path.getsize(path)))]
+    if kind == ZSTD:
+        return _zstd_units(path, chunk_size)
+    return [(mode, chunk) for chunk in chunk_ranges(path, chunk_size)]
+
+def _scan_gzip(path: str, start: int, end: int) -> LogStats:
+    with open_log(path) as stream:
+        return scan_stream(stream)
+
+_SCANNERS = {"text": parse_range, "mmap": scan_range_mmap, GZIP: _scan_gzip}
+
+def _run_unit(
+    unit: Unit, sketch_options: Optional[Dict[str, int]] = None, log_format: Optional[str] = None
+) -> Tuple[LogStats, Optional[Fragments]]:
+    """
+    Runs one work unit (in a worker process). Fragments are set for zstd frame groups.
+
+    With sketch_options the unit's exact IP counts are folded into an IpSketch before
+    returning, so only fixed-size sketches travel back to and accumulate in the parent.
+    """
+    kind, chunk = unit
+    fragments = None
+    if kind == ZSTD:
+        stats = LogStats()
+        with open_zstd_range(*chunk) as stream:
+            fragments = _scan_stream(stream, stats)
+    elif kind == RECORDS:
+        stats = parse_range_records(*chunk, log_format)
+    else:
+        stats = _SCANNERS[kind](*chunk)
+    if sketch_options is not None:
+        stats.sketch_ips(**sketch_options)
+    return stats, fragments
+
+def analyze_logs(
+    paths: Union[PathLike, Sequence[PathLike]],
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    mode: str = "text",
+    sketch: bool = False,
+    sketch_options: Optional[Dict[str, int]] = None,
+    log_format: Optional[str] = None
+) -> LogStats:
+    """
+    Parses one or more access logs on all cores and returns the merged LogStats.
+
+    Args:
+        paths: A log file or a list of log files.
+        workers: Worker processes (default: os.cpu_count()). 1 parses in-process.
+        chunk_size: Target (decompressed) bytes per work unit.
+        mode: "text" (decode + str regex) or "mmap" (bytes regex over a mapped file)
+            for plain files. Compressed files always use the bytes scanner.
+        sketch: Track IPs in a bounded-memory IpSketch (HyperLogLog, Count-Min,
+            Space-Saving) instead of an exact Counter. Peak memory is then one
+            chunk's distinct IPs per worker plus the fixed sketch size.
+        sketch_options: IpSketch arguments (precision, cms_width, cms_depth, top_k).
+        log_format: Parse lines with this registered LogParser (e.g. "nginx_combined",
+            "json_lines", "k8s_cri") instead of the built-in regex; overrides mode.
+
+    Raises:
+        FileNotFoundError: If a path does not exist.
+        ValueError: On an unknown mode or log format, or a corrupt zstd file.
+        RuntimeError: For .zst input when zstandard is not installed.
+    """
+    if mode not in SCAN_MODES:
+        raise ValueError(f"mode must be one of {SCAN_MODES}, got {mode!r}")
+    if log_format is not None:
+        get_parser(log_format)
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+    units: List[Unit] = []
+    for path in paths:
+        units.extend(_plan_units(path, chunk_size, mode, log_format))
+
+    workers = workers or os.cpu_count() or 1
+    start = time.monotonic()
+    total = LogStats()
+    # Partial line carried from the previous zstd frame group of each file.
+    carry: Dict[str, bytes] = {}
+    options = dict(sketch_options or {}) if sketch else None
+    if workers == 1 or len(units) <= 1:
+        _merge_results(total, units, (_run_unit(unit, options, log_format) for unit in units), carry)
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(units))) as pool:
+            results = pool.map(_run_unit, units, [options] * len(units), [log_format] * len(units))
+            _merge_results(total, units, results, carry)
+    for tail in carry.values():
+        if tail:
+            total.lines += 1
+            _scan_line(total, tail)
+    if options is not None:
+        # Fold in the few exact counts from lines stitched in the parent.
+        total.sketch_ips(**options)
+    total.seconds = time.monotonic() - start
+
+    logger.debug(f"Parsed {total.bytes} bytes ({log_format or mode}) in {len(units)} units with {workers} workers "
+                 f"in {total.seconds:.2f}s")
+    return total
+
+def _merge_results(total: LogStats, units: List[Unit], results, carry: Dict[str, bytes]) -> None:
+    """Merges unit results in order, stitching lines split across zstd frame groups."""
+    for (_, (path, _, _)), (stats, fragments) in zip(units, results):
+        total.merge(stats)
+        if fragments is None:
+            continue
+        head, tail = fragments
+        if head is None:
+            carry[path] = carry.get(path, b"") + tail
+        else:
+            _scan_line(total, carry.get(path, b"") + head)
+            carry[path] = tail
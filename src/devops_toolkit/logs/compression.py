@@ -0,0 +1,126 @@
+"""
+Transparent access to compressed logs (.gz, .zst).
+
+Compression is detected from magic bytes, not the file extension. zstandard is
+optional; gzip uses the stdlib.
+
+A zstd file made of several frames (pzstd, or logs appended frame by frame) can be
+decompressed in parallel: zstd_frames() walks the frame and block headers without
+decompressing anything, so the frame offsets can be handed out to workers.
+"""
+
+import gzip
+import io
+import os
+import struct
+from typing import BinaryIO, List, Optional, Tuple
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+GZIP = "gzip"
+ZSTD = "zstd"
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+# Skippable frames: 0x184D2A50..0x184D2A5F, little-endian.
+_SKIPPABLE_MAGIC_TAIL = b"\x2a\x4d\x18"
+
+_DICT_ID_SIZES = (0, 1, 2, 4)
+_CONTENT_SIZE_SIZES = (0, 2, 4, 8)
+_RLE_BLOCK = 1
+_RESERVED_BLOCK = 3
+
+def detect_compression(path: str) -> Optional[str]:
+    """Returns GZIP, ZSTD or None (plain text) based on the file's magic bytes."""
+    with open(path, "rb") as f:
+        magic = f.read(4)
+    if magic.startswith(GZIP_MAGIC):
+        return GZIP
+    if magic == ZSTD_MAGIC:
+        return ZSTD
+    return None
+
+def _require_zstd() -> None:
+    if not ZSTD_AVAILABLE:
+        raise RuntimeError("Reading .zst logs requires the 'zstandard' package.")
+
+def open_log(path: str) -> BinaryIO:
+    """Opens a plain, gzip or zstd log as a binary stream of decompressed bytes."""
+    kind = detect_compression(path)
+    if kind == GZIP:
+        return gzip.open(path, "rb")
+    if kind == ZSTD:
+        _require_zstd()
+        return zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), read_across_frames=True)
+    return open(path, "rb")
+
+def _frame_end(f: BinaryIO, pos: int) -> int:
+    """Given the offset just after a zstd frame's magic, returns the frame's end offset."""
+    f.seek(pos)
+    descriptor = f.read(1)
+    if not descriptor:
+        raise ValueError(f"Truncated zstd frame header at offset {pos}")
+    fhd = descriptor[0]
+    single_segment = (fhd >> 5) & 1
+    has_checksum = (fhd >> 2) & 1
+    content_size_size = _CONTENT_SIZE_SIZES[fhd >> 6] or single_segment
+    pos += 1 + (0 if single_segment else 1) + _DICT_ID_SIZES[fhd & 3] + content_size_size
+
+    while True:
+        f.seek(pos)
+        raw = f.read(3)
+        if len(raw) < 3:
+            raise ValueError(f"Truncated zstd block header at offset {pos}")
+        header = int.from_bytes(raw, "little")
+        block_type = (header >> 1) & 3
+        if block_type == _RESERVED_BLOCK:
+            raise ValueError(f"Invalid zstd block type at offset {pos}")
+        pos += 3 + (1 if block_type == _RLE_BLOCK else header >> 3)
+        if header & 1:
+            return pos + (4 if has_checksum else 0)
+
+def zstd_frames(path: str) -> List[Tuple[int, int]]:
+    """
+    Returns the (start, end) byte offsets of every data frame in a zstd file.
+
+    Skippable frames are stepped over and fall inside the neighbouring ranges
+    (the decompressor ignores them).
+
+    Raises:
+        ValueError: If the file is not a sequence of zstd frames.
+    """
+    frames: List[Tuple[int, int]] = []
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        pos = 0
+        while pos < size:
+            f.seek(pos)
+            magic = f.read(4)
+            if magic == ZSTD_MAGIC:
+                end = _frame_end(f, pos + 4)
+                frames.append((pos, end))
+            elif len(magic) == 4 and magic[1:] == _SKIPPABLE_MAGIC_TAIL and magic[0] & 0xF0 == 0x50:
+                (length,) = struct.unpack("<I", f.read(4))
+                end = pos + 8 + length
+            else:
+                raise ValueError(f"{path}: no zstd frame at offset {pos}")
+            if end > size:
+                raise ValueError(f"{path}: truncated zstd frame at offset {pos}")
+            pos = end
+    return frames
+
+def open_zstd_range(path: str, start: int, end: int) -> BinaryIO:
+    """
+    Decompressing stream over the whole frames in [start, end) of a zstd file.
+
+    Only this compressed range is held in memory; output is produced as it is read.
+    """
+    _require_zstd()
+    with open(path, "rb") as f:
+        f.seek(start)
+        compressed = f.read(end - start)
+    return zstandard.ZstdDecompressor().stream_reader(io.BytesIO(compressed), read_across_frames=True)
@@ -0,0 +1,161 @@
+"""
+Incremental (tail-follow) log analysis.
+
+Instead of re-reading a growing access log from byte 0 on every run, LogFollower
+keeps a checkpoint of (device, inode, offset, partial last line) plus the running
+LogStats, and each poll() scans only the bytes appended since the last one.
+
+Rotation (the path now points at a new inode) is handled by first draining the
+old file from its checkpointed offset, if it can still be found under one of the
+`rotated` names, then starting the new file at 0. Truncation in place
+(copytruncate) resets the offset to 0.
+"""
+
+import base64
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Iterator, Optional, Sequence
+
+from devops_toolkit.logs.analyzer import LogStats, _scan_line, _scan_stream
+
+logger = logging.getLogger(__name__)
+
+class Checkpoint:
+    """Where the previous poll stopped in a file."""
+
+    def __init__(self, device: Optional[int] = None, inode: Optional[int] = None,
+                 offset: int = 0, partial: bytes = b""):
+        self.device = device
+        self.inode = inode
+        self.offset = offset
+        self.partial = partial
+
+    def matches(self, st: os.stat_result) -> bool:
+        return (self.device, self.inode) == (st.st_dev, st.st_ino)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "device": self.device,
+            "inode": self.inode,
+            "offset": self.offset,
+            "partial": base64.b64encode(self.partial).decode("ascii"),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Checkpoint":
+        return cls(data.get("device"), data.get("inode"), data.get("offset", 0),
+                   base64.b64decode(data.get("partial", "")))
+
+    def __repr__(self) -> str:
+        return f"Checkpoint(inode={self.inode}, offset={self.offset}, partial={len(self.partial)}B)"
+
+class LogFollower:
+    """
+    Scans only what was appended to a log since the last poll.
+
+    Args:
+        path: The live log file.
+        checkpoint_path: JSON file persisting the checkpoint and running totals
+            between runs (e.g. a cron job every minute). None keeps state in memory.
+        rotated: Names the file may have been rotated to (default: path + ".1").
+
+    Usage:
+        follower = LogFollower("/var/log/nginx/access.log", "/var/lib/scan/access.ckpt")
+        delta = follower.poll()      # stats for the new bytes only
+        follower.stats.top_ips(10)   # running totals
+    """
+
+    def __init__(self, path: str, checkpoint_path: Optional[str] = None,
+                 rotated: Optional[Sequence[str]] = None):
+        self.path = os.fspath(path)
+        self.checkpoint_path = checkpoint_path
+        self.rotated = list(rotated) if rotated is not None else [self.path + ".1"]
+        self.checkpoint = Checkpoint()
+        self.stats = LogStats()
+        if checkpoint_path and os.path.exists(checkpoint_path):
+            self._load()
+
+    def _load(self) -> None:
+        with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        self.checkpoint = Checkpoint.from_dict(state.get("checkpoint", {}))
+        self.stats = LogStats.from_dict(state.get("stats", {}))
+
+    def save(self) -> None:
+        """Writes the checkpoint atomically (write + rename)."""
+        if not self.checkpoint_path:
+            return
+        tmp = f"{self.checkpoint_path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"checkpoint": self.checkpoint.to_dict(), "stats": self.stats.to_dict()}, f)
+        os.replace(tmp, self.checkpoint_path)
+
+    def _read_from(self, path: str, delta: LogStats, final: bool = False) -> None:
+        """Scans path from the checkpoint offset to EOF, carrying the partial line."""
+        with open(path, "rb") as f:
+            f.seek(self.checkpoint.offset)
+            head, tail = _scan_stream(f, delta)
+            self.checkpoint.offset = f.tell()
+
+        if head is None:
+            self.checkpoint.partial += tail
+        else:
+            _scan_line(delta, self.checkpoint.partial + head)
+            self.checkpoint.partial = tail
+        if final and self.checkpoint.partial:
+            # The writer has moved on; the unterminated last line is complete.
+            delta.lines += 1
+            _scan_line(delta, self.checkpoint.partial)
+            self.checkpoint.partial = b""
+
+    def _find_rotated(self) -> Optional[str]:
+        for candidate in self.rotated:
+            try:
+                if self.checkpoint.matches(os.stat(candidate)):
+                    return candidate
+            except FileNotFoundError:
+                continue
+        return None
+
+    def _reset(self, st: Optional[os.stat_result]) -> None:
+        self.checkpoint = Checkpoint(st.st_dev if st else None, st.st_ino if st else None)
+
+    def poll(self) -> LogStats:
+        """Scans newly appended bytes, updates the running totals and saves the checkpoint."""
+        delta = LogStats()
+        start = time.monotonic()
+        try:
+            st: Optional[os.stat_result] = os.stat(self.path)
+        except FileNotFoundError:
+            st = None
+
+        if self.checkpoint.inode is None:
+            self._reset(st)
+        elif st is None or not self.checkpoint.matches(st):
+            rotated = self._find_rotated()
+            if rotated:
+                logger.info(f"{self.path} was rotated; draining {rotated} from offset {self.checkpoint.offset}")
+                self._read_from(rotated, delta, final=True)
+            else:
+                logger.warning(f"{self.path} was replaced and the old file was not found in {self.rotated}; "
+                               f"its unread tail is lost")
+            self._reset(st)
+        elif st.st_size < self.checkpoint.offset:
+            logger.warning(f"{self.path} was truncated ({st.st_size} < {self.checkpoint.offset}); restarting at 0")
+            self._reset(st)
+
+        if st is not None:
+            self._read_from(self.path, delta)
+
+        delta.seconds = time.monotonic() - start
+        self.stats.merge(delta)
+        self.save()
+        return delta
+
+    def follow(self, interval: float = 60.0) -> Iterator[LogStats]:
+        """Polls forever, yielding the stats of each increment."""
+        while True:
+            yield self.poll()
+            time.sleep(interval)
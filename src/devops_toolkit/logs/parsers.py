@@ -0,0 +1,399 @@
+"""
+Pluggable log-format parsers.
+
+parse_logs hardcodes one regex that only accepts `HTTP/1.1` request lines. Here each
+format is a LogParser with:
+- a fast tokenizer built on str.split / str.index (no regex), and
+- a regex fallback for lines the tokenizer can't handle (escaped quotes, odd spacing).
+
+Every parser returns the same LogRecord type, so analyze_logs(log_format=...) and
+other consumers don't care which format produced it.
+
+Built-in formats (see PARSERS):
+- apache_common:   %h %l %u %t "%r" %>s %b
+- nginx_combined:  apache_common + "referer" "user_agent"
+- json_lines:      one JSON object per line (nginx escape=json, app loggers)
+- k8s_cri:         container runtime prefix "<RFC3339Nano> <stream> <F|P> <message>",
+                   optionally handing the message to an inner parser (e.g. ingress-nginx)
+
+Add your own with register_parser().
+"""
+
+import calendar
+import json
+import re
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, Optional, Pattern, Sequence, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_MONTHS = {name: i for i, name in enumerate(calendar.month_abbr) if name}
+
+def parse_clf_minute(minute: str, offset: str) -> int:
+    """'21/Dec/2025:10:00' + '+0000' -> epoch seconds (UTC) of that minute."""
+    day, month, rest = minute.split("/")
+    year, hour, mins = rest.split(":")
+    epoch = calendar.timegm((int(year), _MONTHS[month], int(day), int(hour), int(mins), 0))
+    sign = -1 if offset[0] == "-" else 1
+    return epoch - sign * (int(offset[1:3]) * 3600 + int(offset[3:5]) * 60)
+
+def parse_iso8601(value: str) -> int:
+    """RFC 3339 / ISO 8601 (any fractional precision, 'Z' allowed) -> epoch seconds."""
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    if "." in value:
+        # fromisoformat (before 3.11) takes at most 6 fractional digits; drop them all.
+        head, _, tail = value.partition(".")
+        zone = tail.lstrip("0123456789")
+        value = head + zone
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        return calendar.timegm(parsed.timetuple())
+    return int(parsed.timestamp())
+
+# What tokenizing/converting a malformed line can raise (bad slices, int("x"),
+# unknown month, wrong JSON value types, float overflow).
+_PARSE_ERRORS = (ValueError, IndexError, KeyError, TypeError, AttributeError, OverflowError)
+
+class LogRecord:
+    """One parsed log line. Fields a format doesn't carry are None."""
+    __slots__ = ("ip", "ts", "method", "path", "protocol", "status", "size",
+                 "referer", "user_agent", "latency", "stream", "message")
+
+    def __init__(self, ip: Optional[str] = None, ts: Optional[int] = None, method: Optional[str] = None,
+                 path: Optional[str] = None, protocol: Optional[str] = None, status: Optional[int] = None,
+                 size: Optional[int] = None, referer: Optional[str] = None, user_agent: Optional[str] = None,
+                 latency: Optional[float] = None, stream: Optional[str] = None, message: Optional[str] = None):
+        self.ip = ip
+        self.ts = ts
+        self.method = method
+        self.path = path
+        self.protocol = protocol
+        self.status = status
+        self.size = size
+        self.referer = referer
+        self.user_agent = user_agent
+        self.latency = latency
+        self.stream = stream
+        self.message = message
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, LogRecord) and self.as_dict() == other.as_dict()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{k}={v!r}" for k, v in self.as_dict().items() if v is not None)
+        return f"LogRecord({fields})"
+
+class LogParser:
+    """
+    Base class: parse() tries the fast tokenizer, then the regex fallback.
+
+    Subclasses implement parse_fast() (return None or raise to defer to the
+    fallback) and parse_regex() (return None = no match). Errors in either path are
+    treated as "no record", so one malformed line never aborts a whole scan.
+    """
+
+    name = ""
+
+    def parse_fast(self, line: str) -> Optional[LogRecord]:
+        return None
+
+    def parse_regex(self, line: str) -> Optional[LogRecord]:
+        return None
+
+    def parse(self, line: str) -> Optional[LogRecord]:
+        try:
+            record = self.parse_fast(line)
+        except _PARSE_ERRORS:
+            record = None
+        if record is not None:
+            return record
+        try:
+            return self.parse_regex(line)
+        except _PARSE_ERRORS:
+            return None
+
+    def parse_lines(self, lines: Iterable[str]) -> Iterator[LogRecord]:
+        """Parses many lines, skipping blanks and lines no path can parse."""
+        parse = self.parse
+        for line in lines:
+            line = line.rstrip("\r\n")
+            if line and (record := parse(line)) is not None:
+                yield record
+
+# ---------- Common / combined log format ----------
+
+class ApacheCommonParser(LogParser):
+    """%h %l %u %t "%r" %>s %b, e.g. 10.0.0.5 - - [21/Dec/2025:10:00:03 +0000] "POST /login HTTP/1.1" 200 4096"""
+
+    name = "apache_common"
+    pattern: Pattern[str] = re.compile(
+        r'^(\S+) \S+ \S+ \[(\d{2}/\w{3}/\d{4}:\d{2}:\d{2}):(\d{2}) ([+-]\d{4})\] '
+        r'"((?:[^"\\]|\\.)*)" (\d{3}) (\d+|-)'
+    )
+
+    def __init__(self):
+        self._minutes: Dict[Tuple[str, str], int] = {}
+
+    def _ts(self, minute: str, sec: str, offset: str) -> int:
+        key = (minute, offset)
+        base = self._minutes.get(key)
+        if base is None:
+            if len(self._minutes) > 100_000:
+                self._minutes.clear()
+            base = self._minutes[key] = parse_clf_minute(minute, offset)
+        return base + int(sec)
+
+    @staticmethod
+    def _request(request: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        parts = request.split(" ")
+        if len(parts) == 3:
+            return parts[0], parts[1], parts[2]
+        if len(parts) == 2:
+            # HTTP/0.9 style "GET /path"
+            return parts[0], parts[1], None
+        # "-" or garbage: keep the line, without request fields.
+        return None, None, None
+
+    def _head(self, line: str) -> Tuple[LogRecord, str]:
+        """Tokenizes the common prefix; returns the record and the unparsed remainder."""
+        ip, _, rest = line.partition(" ")
+        open_bracket = rest.index("[")
+        close_bracket = rest.index("]", open_bracket)
+        stamp = rest[open_bracket + 1:close_bracket]  # 21/Dec/2025:10:00:03 +0000
+        quote = close_bracket + 2
+        if rest[quote] != '"':
+            raise ValueError("no request")
+        end_quote = rest.index('"', quote + 1)
+        request = rest[quote + 1:end_quote]
+        if "\\" in request:
+            raise ValueError("escaped request")  # let the regex handle \" inside
+        status, size, remainder = (rest[end_quote + 2:].split(" ", 2) + ["", ""])[:3]
+        method, path, protocol = self._request(request)
+        record = LogRecord(
+            ip=ip, ts=self._ts(stamp[:17], stamp[18:20], stamp[21:26]),
+            method=method, path=path, protocol=protocol,
+            status=int(status), size=0 if size == "-" else int(size)
+        )
+        return record, remainder
+
+    def parse_fast(self, line: str) -> Optional[LogRecord]:
+        return self._head(line)[0]
+
+    def _from_match(self, match) -> LogRecord:
+        ip, minute, sec, offset, request, status, size = match.groups()[:7]
+        method, path, protocol = self._request(request)
+        return LogRecord(ip=ip, ts=self._ts(minute, sec, offset), method=method, path=path,
+                         protocol=protocol, status=int(status), size=0 if size == "-" else int(size))
+
+    def parse_regex(self, line: str) -> Optional[LogRecord]:
+        match = self.pattern.match(line)
+        return self._from_match(match) if match else None
+
+class NginxCombinedParser(ApacheCommonParser):
+    """Common format + "referer" "user_agent" (nginx/Apache 'combined')."""
+
+    name = "nginx_combined"
+    pattern: Pattern[str] = re.compile(
+        ApacheCommonParser.pattern.pattern + r'(?: "((?:[^"\\]|\\.)*)" "((?:[^"\\]|\\.)*)")?'
+    )
+
+    def parse_fast(self, line: str) -> Optional[LogRecord]:
+        record, remainder = self._head(line)
+        if remainder:
+            if remainder[0] != '"' or "\\" in remainder:
+                raise ValueError("unexpected referer")
+            end_referer = remainder.index('"', 1)
+            record.referer = remainder[1:end_referer]
+            start_agent = remainder.index('"', end_referer + 1)
+            record.user_agent = remainder[start_agent + 1:remainder.index('"', start_agent + 1)]
+        return record
+
+    def _from_match(self, match) -> LogRecord:
+        record = super()._from_match(match)
+        record.referer, record.user_agent = match.group(8), match.group(9)
+        return record
+
+# ---------- JSON lines ----------
+
+class JsonLinesParser(LogParser):
+    """
+    One JSON object per line. `fields` maps LogRecord fields to candidate keys
+    (first present key wins); the defaults cover nginx `escape=json` log formats and
+    common app-logger names. orjson is the fast path; the stdlib json module is the
+    fallback (it also accepts NaN/Infinity, which orjson rejects).
+    """
+
+    name = "json_lines"
+    DEFAULT_FIELDS: Dict[str, Sequence[str]] = {
+        "ip": ("remote_addr", "client_ip", "ip"),
+        "ts": ("time", "timestamp", "ts", "time_iso8601", "@timestamp"),
+        "method": ("request_method", "method"),
+        "path": ("request_uri", "uri", "path"),
+        "protocol": ("server_protocol", "protocol"),
+        "status": ("status",),
+        "size": ("body_bytes_sent", "bytes_sent", "bytes", "size"),
+        "referer": ("http_referer", "referer"),
+        "user_agent": ("http_user_agent", "user_agent"),
+        "latency": ("request_time", "latency", "duration"),
+        "message": ("message", "msg", "log"),
+    }
+    _INTS = ("status", "size")
+    _STRINGS = ("ip", "method", "path", "protocol", "referer", "user_agent", "message")
+
+    def __init__(self, fields: Optional[Dict[str, Sequence[str]]] = None):
+        self.fields = dict(self.DEFAULT_FIELDS, **(fields or {}))
+
+    def _record(self, doc: Dict[str, Any]) -> Optional[LogRecord]:
+        if not isinstance(doc, dict):
+            return None
+        record = LogRecord()
+        for field, keys in self.fields.items():
+            for key in keys:
+                value = doc.get(key)
+                if value is not None and value != "":
+                    break
+            else:
+                continue
+            setattr(record, field, self._coerce(field, value))
+        return record
+
+    @classmethod
+    def _coerce(cls, field: str, value: Any) -> Any:
+        """Converts one JSON value to the field's type; a value of the wrong type becomes None."""
+        if isinstance(value, bool):
+            return None
+        try:
+            if field in cls._STRINGS:
+                return value if isinstance(value, str) else None
+            if field in cls._INTS:
+                if value == "-":
+                    return 0
+                return int(value) if isinstance(value, (int, float, str)) else None
+            if field == "latency":
+                return float(value) if isinstance(value, (int, float, str)) else None
+            if field == "ts":
+                if isinstance(value, (int, float)):
+                    return int(value)
+                return parse_iso8601(value) if isinstance(value, str) else None
+        except (ValueError, OverflowError):
+            return None
+        return value
+
+    def parse_fast(self, line: str) -> Optional[LogRecord]:
+        if not ORJSON_AVAILABLE:
+            return None
+        try:
+            doc = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            return None
+        return self._record(doc)
+
+    def parse_regex(self, line: str) -> Optional[LogRecord]:
+        # Not a regex: the stdlib decoder is the tolerant fallback for JSON.
+        try:
+            return self._record(json.loads(line))
+        except (ValueError, TypeError):
+            return None
+
+# ---------- Kubernetes container runtime (CRI) prefix ----------
+
+class K8sCriParser(LogParser):
+    """
+    CRI container log lines as written under /var/log/pods:
+        2025-12-21T10:00:01.123456789Z stdout F <message>
+
+    With `inner` (a parser name or instance), the message is parsed by that parser
+    and the result gets the CRI stream/ts filled in where the inner record has none.
+    """
+
+    name = "k8s_cri"
+    pattern: Pattern[str] = re.compile(r'^(\S+)\s+(stdout|stderr)\s+([FP])\s?(.*)$')
+
+    def __init__(self, inner: Optional[Any] = None):
+        self.inner = get_parser(inner) if isinstance(inner, str) else inner
+        self._minutes: Dict[str, int] = {}
+
+    def _ts(self, stamp: str) -> int:
+        # Fast path for UTC 'YYYY-MM-DDTHH:MM:SS[.frac]Z'; anything else via fromisoformat.
+        if len(stamp) >= 20 and stamp[10] == "T" and stamp.endswith("Z"):
+            minute = stamp[:16]
+            base = self._minutes.get(minute)
+            if base is None:
+                if len(self._minutes) > 100_000:
+                    self._minutes.clear()
+                base = self._minutes[minute] = calendar.timegm((
+                    int(stamp[0:4]), int(stamp[5:7]), int(stamp[8:10]), int(stamp[11:13]), int(stamp[14:16]), 0
+                ))
+            return base + int(stamp[17:19])
+        return parse_iso8601(stamp)
+
+    def _build(self, stamp: str, stream: str, message: str) -> LogRecord:
+        ts = self._ts(stamp)
+        if self.inner is not None and (record := self.inner.parse(message)) is not None:
+            record.stream = stream
+            if record.ts is None:
+                record.ts = ts
+            return record
+        return LogRecord(ts=ts, stream=stream, message=message)
+
+    def parse_fast(self, line: str) -> Optional[LogRecord]:
+        stamp, stream, tag, message = (line.split(" ", 3) + [""])[:4]
+        if stream not in ("stdout", "stderr") or tag not in ("F", "P"):
+            return None
+        return self._build(stamp, stream, message)
+
+    def parse_regex(self, line: str) -> Optional[LogRecord]:
+        match = self.pattern.match(line)
+        if not match:
+            return None
+        try:
+            return self._build(match.group(1), match.group(2), match.group(4))
+        except _PARSE_ERRORS:
+            return None
+
+# ---------- registry ----------
+
+PARSERS: Dict[str, type] = {}
+
+def register_parser(parser_class: type) -> type:
+    """Registers a LogParser subclass under its `name` (usable as a decorator)."""
+    if not parser_class.name:
+        raise ValueError("LogParser subclasses need a non-empty `name`")
+    PARSERS[parser_class.name] = parser_class
+    return parser_class
+
+for _parser in (ApacheCommonParser, NginxCombinedParser, JsonLinesParser, K8sCriParser):
+    register_parser(_parser)
+
+def get_parser(name: str, **options) -> LogParser:
+    """Returns a new parser instance for a registered format name."""
+    try:
+        return PARSERS[name](**options)
+    except KeyError:
+        raise ValueError(f"Unknown log format {name!r}; known: {sorted(PARSERS)}") from None
+
+def detect_format(lines: Iterable[str], candidates: Optional[Sequence[str]] = None) -> Optional[str]:
+    """
+    Picks the registered format that extracts the most from a sample of lines
+    (fields filled across all parsed lines, so nginx_combined beats apache_common
+    on combined logs).
+    """
+    sample = [line.rstrip("\r\n") for line in lines if line.strip()]
+    best, best_score = None, 0
+    for name in candidates or PARSERS:
+        parser = get_parser(name)
+        score = sum(
+            sum(value is not None for value in record.as_dict().values())
+            for record in parser.parse_lines(sample)
+        )
+        if score > best_score:
+            best, best_score = name, score
+    return best
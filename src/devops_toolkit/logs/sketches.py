@@ -0,0 +1,311 @@
+"""
+Bounded-memory sketches for IP analytics.
+
+An exact Counter of client IPs grows with the number of distinct IPs, which during
+a scrape or DDoS can be tens of millions. These sketches use fixed memory and are
+mergeable (chunks -> files -> hosts), as long as both sides use the same parameters.
+
+- HyperLogLog:  distinct count. Relative standard error ~ 1.04 / sqrt(2**precision)
+                (0.81% at the default precision 14, using 16 KiB).
+- CountMinSketch: per-item frequency. Never underestimates; overestimates by at
+                most epsilon * N with probability 1 - delta (N = total count),
+                where epsilon = e / width and delta = exp(-depth).
+- SpaceSaving:  top-k heavy hitters. Every item with frequency > N / k is kept;
+                each reported count overestimates by at most its `error` (<= N / k).
+- DDSketch:     quantiles of positive values (sizes, latencies) with relative
+                error <= relative_accuracy for every quantile.
+
+Items are hashed with blake2b, so sketches built in different processes or on
+different hosts agree (the builtin hash() is salted per process).
+"""
+
+import hashlib
+import heapq
+import math
+import operator
+from array import array
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+
+Item = Union[str, bytes]
+
+def _hash128(item: Item) -> Tuple[int, int]:
+    if isinstance(item, str):
+        item = item.encode()
+    digest = hashlib.blake2b(item, digest_size=16).digest()
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little")
+
+def hll_slot(h: int, precision: int) -> Tuple[int, int]:
+    """(register index, rank) of a 64-bit hash for a HyperLogLog of 2**precision registers."""
+    rest_bits = 64 - precision
+    rest = h & ((1 << rest_bits) - 1)
+    return h >> rest_bits, rest_bits - rest.bit_length() + 1
+
+def hll_estimate(registers) -> int:
+    """Cardinality estimate from a HyperLogLog register array (any bytes-like of length 2**p)."""
+    m = len(registers)
+    alpha = 0.7213 / (1 + 1.079 / m) if m >= 128 else {16: 0.673, 32: 0.697, 64: 0.709}[m]
+    estimate = alpha * m * m / sum(2.0 ** -r for r in registers)
+    zeros = registers.count(0)
+    if estimate <= 2.5 * m and zeros:
+        # Small-range correction: linear counting.
+        estimate = m * math.log(m / zeros)
+    return int(round(estimate))
+
+class HyperLogLog:
+    """Distinct-count estimator with 2**precision one-byte registers."""
+
+    def __init__(self, precision: int = 14):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self.precision = precision
+        self.m = 1 << precision
+        self.registers = bytearray(self.m)
+
+    def _add_hash(self, h: int) -> None:
+        index, rank = hll_slot(h, self.precision)
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def add(self, item: Item) -> None:
+        self._add_hash(_hash128(item)[0])
+
+    def count(self) -> int:
+        return hll_estimate(self.registers)
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLogs with different precision")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        return self
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self.registers)
+
+class CountMinSketch:
+    """
+    Frequency estimator: `depth` rows of `width` 64-bit counters.
+
+    Build it from error targets with CountMinSketch.from_error(epsilon, delta).
+    """
+
+    def __init__(self, width: int = 1 << 14, depth: int = 4):
+        self.width = width
+        self.depth = depth
+        self.rows = [array("Q", bytes(8 * width)) for _ in range(depth)]
+        self.total = 0
+
+    @classmethod
+    def from_error(cls, epsilon: float, delta: float) -> "CountMinSketch":
+        return cls(width=math.ceil(math.e / epsilon), depth=math.ceil(math.log(1 / delta)))
+
+    def _columns(self, h1: int, h2: int):
+        # Kirsch-Mitzenmacher double hashing: depth indexes from one 128-bit hash.
+        h2 |= 1
+        return [(h1 + i * h2) % self.width for i in range(self.depth)]
+
+    def _add_hash(self, h1: int, h2: int, count: int) -> None:
+        for row, column in zip(self.rows, self._columns(h1, h2)):
+            row[column] += count
+        self.total += count
+
+    def add(self, item: Item, count: int = 1) -> None:
+        self._add_hash(*_hash128(item), count)
+
+    def estimate(self, item: Item) -> int:
+        columns = self._columns(*_hash128(item))
+        return min(row[column] for row, column in zip(self.rows, columns))
+
+    def merge(self, other: "CountMinSketch") -> "CountMinSketch":
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError("Cannot merge CountMinSketches with different dimensions")
+        self.rows = [
+            array("Q", map(operator.add, row, other_row)) for row, other_row in zip(self.rows, other.rows)
+        ]
+        self.total += other.total
+        return self
+
+    @property
+    def memory_bytes(self) -> int:
+        return 8 * self.width * self.depth
+
+class SpaceSaving:
+    """
+    Top-k heavy hitters with at most k tracked items (Metwally et al.).
+
+    A new item evicts the current minimum and inherits its count as `error`.
+    """
+
+    def __init__(self, k: int = 100):
+        self.k = k
+        self.counts: Dict[Item, int] = {}
+        self.errors: Dict[Item, int] = {}
+        self.total = 0
+        # Lazy min-heap: stale (count, item) entries are skipped when popped.
+        self._heap: List[Tuple[int, Item]] = []
+
+    def _push(self, item: Item) -> None:
+        heapq.heappush(self._heap, (self.counts[item], item))
+        if len(self._heap) > 4 * self.k:
+            self._rebuild_heap()
+
+    def _rebuild_heap(self) -> None:
+        self._heap = [(count, item) for item, count in self.counts.items()]
+        heapq.heapify(self._heap)
+
+    def _pop_min(self) -> Tuple[int, Item]:
+        while True:
+            count, item = heapq.heappop(self._heap)
+            if self.counts.get(item) == count:
+                return count, item
+
+    def add(self, item: Item, count: int = 1) -> None:
+        self.total += count
+        if item in self.counts:
+            self.counts[item] += count
+        elif len(self.counts) < self.k:
+            self.counts[item] = count
+            self.errors[item] = 0
+        else:
+            floor, victim = self._pop_min()
+            del self.counts[victim], self.errors[victim]
+            self.counts[item] = floor + count
+            self.errors[item] = floor
+        self._push(item)
+
+    def _floor(self) -> int:
+        """Upper bound on the count of any untracked item."""
+        return min(self.counts.values()) if len(self.counts) >= self.k else 0
+
+    def top(self, n: int = 10) -> List[Tuple[Item, int, int]]:
+        """[(item, estimated_count, max_overestimate)] sorted by count."""
+        ranked = sorted(self.counts.items(), key=lambda kv: kv[1], reverse=True)[:n]
+        return [(item, count, self.errors[item]) for item, count in ranked]
+
+    def merge(self, other: "SpaceSaving") -> "SpaceSaving":
+        """Mergeable-summaries merge: untracked items count as the other side's floor."""
+        floor, other_floor = self._floor(), other._floor()
+        merged = {}
+        for item in self.counts.keys() | other.counts.keys():
+            count = self.counts.get(item, floor) + other.counts.get(item, other_floor)
+            error = self.errors.get(item, floor) + other.errors.get(item, other_floor)
+            merged[item] = (count, error)
+        kept = heapq.nlargest(self.k, merged.items(), key=lambda kv: kv[1][0])
+        self.counts = {item: count for item, (count, _) in kept}
+        self.errors = {item: error for item, (_, error) in kept}
+        self.total += other.total
+        self._rebuild_heap()
+        return self
+
+    @property
+    def memory_bytes(self) -> int:
+        # Rough: two dict entries plus one heap tuple per tracked item.
+        return len(self.counts) * 3 * 64
+
+class DDSketch:
+    """
+    Mergeable quantile sketch (Masson et al.) for positive values.
+
+    Values are counted in logarithmic bins of ratio gamma = (1 + a) / (1 - a), so any
+    quantile is returned within relative error a. When more than max_bins bins are
+    in use the lowest ones are collapsed, which only affects the lowest quantiles.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 512):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.max_bins = max_bins
+        self.bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, value: float, count: int = 1) -> None:
+        self.count += count
+        if value <= 0:
+            self.zero_count += count
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self.bins[key] = self.bins.get(key, 0) + count
+        if len(self.bins) > self.max_bins:
+            self._collapse()
+
+    def _collapse(self) -> None:
+        keys = sorted(self.bins)
+        excess = len(keys) - self.max_bins
+        target = keys[excess]
+        for key in keys[:excess]:
+            self.bins[target] += self.bins.pop(key)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Value at quantile q (0..1), or None if the sketch is empty."""
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if seen > rank:
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.bins) / (self.gamma + 1)
+
+    def merge(self, other: "DDSketch") -> "DDSketch":
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge DDSketches with different relative accuracy")
+        for key, count in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        if len(self.bins) > self.max_bins:
+            self._collapse()
+        return self
+
+class IpSketch:
+    """
+    HyperLogLog + Count-Min + Space-Saving over one stream of client IPs.
+
+    Args:
+        precision: HyperLogLog precision (2**precision bytes).
+        cms_width / cms_depth: Count-Min dimensions (8 * width * depth bytes).
+        top_k: Items tracked by Space-Saving. Any IP above N / top_k requests is
+            guaranteed to be reported, so keep it well above the n you query.
+    """
+
+    def __init__(self, precision: int = 14, cms_width: int = 1 << 14, cms_depth: int = 4, top_k: int = 1000):
+        self.hll = HyperLogLog(precision)
+        self.cms = CountMinSketch(cms_width, cms_depth)
+        self.heavy = SpaceSaving(top_k)
+
+    def add(self, ip: Item, count: int = 1) -> None:
+        h1, h2 = _hash128(ip)
+        self.hll._add_hash(h1)
+        self.cms._add_hash(h1, h2, count)
+        self.heavy.add(ip, count)
+
+    def update(self, counts: Mapping[Item, int]) -> None:
+        """Adds pre-aggregated counts (e.g. one chunk's Counter)."""
+        for ip, count in counts.items():
+            self.add(ip, count)
+
+    def distinct(self) -> int:
+        return self.hll.count()
+
+    def estimate(self, ip: Item) -> int:
+        return self.cms.estimate(ip)
+
+    def top(self, n: int = 10) -> List[Tuple[Item, int]]:
+        """Top IPs by Space-Saving, with counts tightened by the Count-Min estimate."""
+        tightened = [(ip, min(count, self.cms.estimate(ip))) for ip, count, _ in self.heavy.top(n)]
+        return sorted(tightened, key=lambda kv: kv[1], reverse=True)
+
+    def merge(self, other: "IpSketch") -> "IpSketch":
+        self.hll.merge(other.hll)
+        self.cms.merge(other.cms)
+        self.heavy.merge(other.heavy)
+        return self
+
+    @property
+    def memory_bytes(self) -> int:
+        return self.hll.memory_bytes + self.cms.memory_bytes + self.heavy.memory_bytes
@@ -1,13 +1,85 @@
+import asyncio
+import io
+import os
+import shlex
 import shutil
 import subprocess
 import logging
-from typing import Optional, List, Union
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Iterator, Optional, List, Sequence, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+class BinaryResolver:
+    """
+    Process-wide cache of `shutil.which` lookups.
+
+    Why:
+    - shutil.which stats every PATH entry on each call; setup scripts check the same
+      binaries over and over.
+    - The cache is dropped whenever PATH changes, and entries can expire after `ttl`
+      seconds (None = never). Negative results are cached too.
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._cache: Dict[str, Tuple[Optional[str], float]] = {}
+        self._path_env: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def resolve(self, cmd: str) -> Optional[str]:
+        """Returns the absolute path of `cmd`, or None if it is not on PATH."""
+        path_env = os.environ.get("PATH", os.defpath)
+        now = time.monotonic()
+        with self._lock:
+            if path_env != self._path_env:
+                self._cache.clear()
+                self._path_env = path_env
+            entry = self._cache.get(cmd)
+            if entry is not None and (self.ttl is None or now - entry[1] < self.ttl):
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        resolved = shutil.which(cmd, path=path_env)
+        with self._lock:
+            if path_env == self._path_env:
+                self._cache[cmd] = (resolved, now)
+        return resolved
+
+    def clear(self) -> None:
+        """Forgets every cached lookup and resets the counters."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Returns hit/miss counters and the number of cached entries."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._cache)}
+
+binary_resolver = BinaryResolver()
+
+def resolve_binary(cmd: str) -> Optional[str]:
+    """Resolves a command name to its absolute path using the process-wide cache."""
+    return binary_resolver.resolve(cmd)
+
+def _resolve_argv(cmd: Union[str, List[str]], shell: bool) -> Union[str, List[str]]:
+    """Swaps argv[0] for its cached absolute path so exec skips the PATH search."""
+    if shell or isinstance(cmd, str) or not cmd or os.sep in cmd[0]:
+        return cmd
+    resolved = resolve_binary(cmd[0])
+    return [resolved, *cmd[1:]] if resolved else cmd
+
 def check_binary_exists(cmd: str) -> bool:
     """
     Verifies that a required binary is installed and available in PATH.
+    Lookups are served from the process-wide BinaryResolver cache.
     
     Args:
         cmd: The name of the command to check (e.g., 'kubectl').
@@ -15,7 +87,7 @@ def check_binary_exists(cmd: str) -> bool:
     Returns:
         True if the command exists, False otherwise.
     """
-    exists = shutil.which(cmd) is not None
+    exists = resolve_binary(cmd) is not None
     if not exists:
         logger.warning(f"Binary '{cmd}' not found in PATH.")
     return exists
@@ -49,7 +121,7 @@ def run_command(
         stderr = subprocess.PIPE if capture_output else None
 
         result = subprocess.run(
-            cmd, 
+            _resolve_argv(cmd, shell), 
             shell=shell, 
             check=check, 
             stdout=stdout, 
@@ -65,3 +137,238 @@ def run_command(
         if check:
             raise
         return e
+
+class _TailBuffer:
+    """Ring buffer that keeps only the last `max_bytes` bytes written to it."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._chunks: Deque[bytes] = deque()
+        self._size = 0
+
+    def write(self, data: bytes) -> None:
+        if self.max_bytes <= 0 or not data:
+            return
+        if len(data) >= self.max_bytes:
+            self._chunks.clear()
+            data = data[-self.max_bytes:]
+            self._size = 0
+        self._chunks.append(data)
+        self._size += len(data)
+        while self._size > self.max_bytes:
+            overflow = self._size - self.max_bytes
+            head = self._chunks[0]
+            if len(head) <= overflow:
+                self._chunks.popleft()
+                self._size -= len(head)
+            else:
+                self._chunks[0] = head[overflow:]
+                self._size -= overflow
+
+    def getvalue(self) -> str:
+        return b"".join(self._chunks).decode(errors="replace")
+
+def _drain_into(stream, tail: _TailBuffer, chunk_size: int) -> None:
+    """Reads a pipe until EOF so the child never blocks on a full stderr buffer."""
+    for chunk in iter(lambda: stream.read1(chunk_size), b""):
+        tail.write(chunk)
+    stream.close()
+
+def stream_command(
+    cmd: Union[str, List[str]],
+    shell: bool = False,
+    check: bool = True,
+    cwd: Optional[str] = None,
+    binary: bool = False,
+    chunk_size: int = 64 * 1024,
+    stderr_tail_kb: int = 64
+) -> Iterator[Union[str, bytes]]:
+    """
+    Runs a command and yields its stdout as the child writes it.
+
+    Unlike run_command(capture_output=True), memory stays bounded regardless of how
+    much the command prints (e.g. `kubectl get pods -A -o json` on a large cluster).
+
+    Args:
+        cmd: The command to run. Can be a string (if shell=True) or a list of strings.
+        shell: Whether to execute the command through the shell.
+        check: Whether to raise a CalledProcessError if the command fails.
+        cwd: Current working directory for the command.
+        binary: Yield raw byte chunks (up to chunk_size) instead of decoded lines.
+        chunk_size: Read size for binary chunks and for draining stderr.
+        stderr_tail_kb: Only the last N KB of stderr are kept, for the error log
+            and CalledProcessError.stderr.
+
+    Yields:
+        Decoded lines (str, newline included) or raw byte chunks.
+    """
+    cmd_str = cmd if isinstance(cmd, str) else " ".join(cmd)
+    logger.debug(f"Streaming command: {cmd_str}")
+
+    proc = subprocess.Popen(
+        _resolve_argv(cmd, shell), shell=shell, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=cwd
+    )
+    tail = _TailBuffer(stderr_tail_kb * 1024)
+    stderr_thread = threading.Thread(
+        target=_drain_into, args=(proc.stderr, tail, chunk_size), daemon=True
+    )
+    stderr_thread.start()
+
+    finished = False
+    try:
+        if binary:
+            yield from iter(lambda: proc.stdout.read1(chunk_size), b"")
+        else:
+            yield from io.TextIOWrapper(proc.stdout, encoding="utf-8", errors="replace")
+        finished = True
+    finally:
+        if not finished and proc.poll() is None:
+            # Consumer stopped early (break/close) or raised: don't leak the child.
+            proc.kill()
+        proc.stdout.close()
+        returncode = proc.wait()
+        stderr_thread.join()
+
+    if returncode != 0 and check:
+        err = tail.getvalue()
+        logger.error(f"Command failed: {cmd_str}")
+        if err:
+            logger.error(f"Stderr (tail): {err.strip()}")
+        raise subprocess.CalledProcessError(returncode, cmd, stderr=err)
+
+# asyncio's default StreamReader limit is 64 KiB per line; kubectl JSON/YAML output
+# can contain longer lines (e.g. embedded certificates), so we raise it.
+_STREAM_LINE_LIMIT = 1024 * 1024
+
+async def _pump_stream(
+    stream: asyncio.StreamReader,
+    callback: Optional[Callable[[str], None]],
+    sink: Optional[List[str]]
+) -> None:
+    """Reads a child stream line by line, forwarding to a callback and/or a sink list."""
+    async for raw_line in stream:
+        line = raw_line.decode(errors="replace")
+        if callback:
+            callback(line)
+        if sink is not None:
+            sink.append(line)
+
+async def run_command_async(
+    cmd: Union[str, List[str]],
+    shell: bool = False,
+    check: bool = True,
+    capture_output: bool = False,
+    cwd: Optional[str] = None,
+    on_stdout: Optional[Callable[[str], None]] = None,
+    on_stderr: Optional[Callable[[str], None]] = None
+) -> subprocess.CompletedProcess:
+    """
+    Asyncio counterpart of run_command.
+
+    Output is read line by line as the child writes it. With capture_output=True the
+    lines are also collected into the result (same shape as run_command). Passing only
+    on_stdout/on_stderr streams the output without keeping it in memory.
+
+    Args:
+        cmd: The command to run. Can be a string (if shell=True) or a list of strings.
+            A string with shell=False is split with shlex.split.
+        shell: Whether to execute the command through the shell.
+        check: Whether to raise a CalledProcessError if the command fails.
+        capture_output: Whether to capture stdout and stderr into the result.
+        cwd: Current working directory for the command.
+        on_stdout: Optional callback invoked with every stdout line.
+        on_stderr: Optional callback invoked with every stderr line.
+
+    Returns:
+        The CompletedProcess instance (stdout/stderr are None unless captured).
+    """
+    cmd_str = cmd if isinstance(cmd, str) else " ".join(cmd)
+    logger.debug(f"Executing command (async): {cmd_str}")
+
+    pipe_stdout = capture_output or on_stdout is not None
+    pipe_stderr = capture_output or on_stderr is not None
+    stdout = asyncio.subprocess.PIPE if pipe_stdout else None
+    stderr = asyncio.subprocess.PIPE if pipe_stderr else None
+
+    if shell:
+        proc = await asyncio.create_subprocess_shell(
+            cmd_str, stdout=stdout, stderr=stderr, cwd=cwd, limit=_STREAM_LINE_LIMIT
+        )
+    else:
+        argv = shlex.split(cmd) if isinstance(cmd, str) else cmd
+        proc = await asyncio.create_subprocess_exec(
+            *_resolve_argv(argv, shell), stdout=stdout, stderr=stderr, cwd=cwd, limit=_STREAM_LINE_LIMIT
+        )
+
+    out_lines: Optional[List[str]] = [] if capture_output else None
+    err_lines: Optional[List[str]] = [] if capture_output else None
+    pumps = []
+    if pipe_stdout:
+        pumps.append(_pump_stream(proc.stdout, on_stdout, out_lines))
+    if pipe_stderr:
+        pumps.append(_pump_stream(proc.stderr, on_stderr, err_lines))
+
+    try:
+        await asyncio.gather(*pumps)
+        returncode = await proc.wait()
+    except BaseException:
+        # Don't leave orphaned children behind when a batch is cancelled or a pump
+        # fails (e.g. a line longer than _STREAM_LINE_LIMIT).
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        raise
+
+    out = "".join(out_lines) if out_lines is not None else None
+    err = "".join(err_lines) if err_lines is not None else None
+
+    if returncode != 0 and check:
+        logger.error(f"Command failed: {cmd_str}")
+        if capture_output and err:
+            logger.error(f"Stderr: {err.strip()}")
+        raise subprocess.CalledProcessError(returncode, cmd, output=out, stderr=err)
+
+    return subprocess.CompletedProcess(cmd, returncode, stdout=out, stderr=err)
+
+async def run_many_async(
+    commands: Sequence[Union[str, List[str]]],
+    concurrency: int = 4,
+    **kwargs
+) -> List[subprocess.CompletedProcess]:
+    """
+    Runs many commands concurrently, with at most `concurrency` children alive at once.
+
+    Keyword arguments are forwarded to run_command_async. Results are returned in the
+    same order as `commands`. With check=True the first failure is raised and the
+    remaining commands are cancelled (their processes are killed).
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _bounded(cmd: Union[str, List[str]]) -> subprocess.CompletedProcess:
+        async with semaphore:
+            return await run_command_async(cmd, **kwargs)
+
+    tasks = [asyncio.ensure_future(_bounded(cmd)) for cmd in commands]
+    try:
+        return list(await asyncio.gather(*tasks))
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+def run_many(
+    commands: Sequence[Union[str, List[str]]],
+    concurrency: int = 4,
+    **kwargs
+) -> List[subprocess.CompletedProcess]:
+    """
+    Blocking wrapper around run_many_async for synchronous scripts.
+
+    Example:
+        results = run_many([["kubectl", "get", "ns", ns] for ns in namespaces],
+                           concurrency=8, capture_output=True, check=False)
+    """
+    return asyncio.run(run_many_async(commands, concurrency=concurrency, **kwargs))
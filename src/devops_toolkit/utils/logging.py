@@ -1,23 +1,286 @@
+import atexit
+import json
 import logging
+import queue
 import sys
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, List, Optional, Tuple
 
-def setup_logger(name: str, level=logging.INFO) -> logging.Logger:
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+OVERFLOW_POLICIES = ("block", "drop_oldest", "sample")
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    QueueHandler with a bounded queue and an explicit policy for when it is full.
+
+    Policies:
+    - block:       wait for space (lossless, but a stalled sink eventually blocks callers).
+    - drop_oldest: evict the oldest queued record to make room for the new one.
+    - sample:      while full, keep 1 of every `sample_every` records (evicting the
+                   oldest queued record to make room) and drop the rest.
+
+    Only "block" ever waits; the other policies never block the logging thread.
+
+    Records are queued as-is; message formatting happens on the listener thread.
+    (Avoid mutating objects passed as log args after the call.)
+    """
+
+    def __init__(self, log_queue: queue.Queue, overflow: str = "block", sample_every: int = 10):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}, got {overflow!r}")
+        super().__init__(log_queue)
+        self.overflow = overflow
+        self.sample_every = sample_every
+        self.dropped = 0
+        self._overflowed = 0
+        self._drop_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Same-process queue: no need to pre-format/pickle-proof the record on the hot path.
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.overflow == "block":
+            self.queue.put(record)
+            return
+
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+
+        with self._drop_lock:
+            if self.overflow == "drop_oldest":
+                while True:
+                    try:
+                        self.queue.get_nowait()
+                        self.dropped += 1
+                    except queue.Empty:
+                        pass
+                    try:
+                        self.queue.put_nowait(record)
+                        return
+                    except queue.Full:
+                        continue
+
+            # sample
+            self._overflowed += 1
+            if self._overflowed % self.sample_every:
+                self.dropped += 1
+                return
+            try:
+                self.queue.get_nowait()
+                self.dropped += 1
+            except queue.Empty:
+                pass
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                self.dropped += 1
+
+# Attributes every LogRecord has; anything else on a record came from `extra=`.
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per line: ts, level, logger, msg, plus every `extra=` field as a
+    top-level key. Serialized with orjson when installed, else the stdlib.
+
+    Usage:
+        logger.warning("High restarts", extra={"pod": name, "restart_count": n})
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        doc: Dict[str, Any] = {
+            "ts": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                doc[key] = value
+        if record.exc_info:
+            doc["exc_info"] = self.formatException(record.exc_info)
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(doc, default=str).decode()
+        return json.dumps(doc, default=str, separators=(",", ":"))
+
+class SamplingFilter(logging.Filter):
+    """
+    Rate-limits repeated identical events: per (level, message template, args), lets
+    the first `burst` records through in each `window` seconds and drops the rest.
+    Records sharing a template but not its args (one warning per pod) are different
+    events and are never collapsed into each other.
+
+    Attach it to the logger (not a handler) so dropped records are discarded before
+    their message is ever formatted (only records with unhashable args are keyed on
+    the rendered message). The next record let through for an event carries
+    `sampled_dropped=<count>` so the loss stays visible downstream; counts still
+    pending at exit are logged by report_sampled_drops().
+
+    Memory stays bounded with high-cardinality messages: once per window, expired
+    events with nothing to report are swept, and at most `max_keys` events are
+    tracked (the oldest windows are evicted first).
+    """
+
+    def __init__(self, burst: int = 10, window: float = 1.0, max_keys: int = 10000):
+        super().__init__()
+        self.burst = burst
+        self.window = window
+        self.max_keys = max_keys
+        # Insertion order == window start order (entries are re-inserted on rollover).
+        self._counters: Dict[Tuple[Any, ...], List[float]] = {}
+        self._last_sweep = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _sweep(self, now: float, force: bool = False) -> None:
+        """Drops expired windows; with force, also those with an unreported drop count."""
+        expired = [
+            key for key, (start, _, dropped) in self._counters.items()
+            if now - start >= self.window and (force or not dropped)
+        ]
+        for key in expired:
+            del self._counters[key]
+        self._last_sweep = now
+
+    def pop_dropped(self) -> List[Tuple[Tuple[Any, ...], int]]:
+        """Returns (key, count) for every drop not yet reported, and resets the counts."""
+        with self._lock:
+            pending = [(key, int(state[2])) for key, state in self._counters.items() if state[2]]
+            for key, _ in pending:
+                self._counters[key][2] = 0
+        return pending
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key: Tuple[Any, ...] = (record.levelno, record.msg, record.args)
+        try:
+            hash(key)
+        except TypeError:
+            key = (record.levelno, record.getMessage())
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_sweep >= self.window:
+                self._sweep(now)
+            # [window_start, passed, dropped]
+            state = self._counters.get(key)
+            if state is None or now - state[0] >= self.window:
+                dropped = self._counters.pop(key)[2] if state is not None else 0
+                if len(self._counters) >= self.max_keys:
+                    self._sweep(now, force=True)
+                    while len(self._counters) >= self.max_keys:
+                        del self._counters[next(iter(self._counters))]
+                state = self._counters[key] = [now, 0, 0]
+                if dropped:
+                    record.sampled_dropped = int(dropped)
+            if state[1] >= self.burst:
+                state[2] += 1
+                return False
+            state[1] += 1
+            return True
+
+class _BoundedQueueListener(QueueListener):
+    """QueueListener whose stop() waits for room for the sentinel in a full bounded queue."""
+
+    def enqueue_sentinel(self) -> None:
+        # The base class uses put_nowait, which raises queue.Full (at exit, leaving
+        # the thread unjoined) when callers filled the queue; the listener thread is
+        # still draining, so a blocking put always gets a slot.
+        self.queue.put(self._sentinel)
+
+_listeners: List[QueueListener] = []
+_listeners_lock = threading.Lock()
+_samplers: List[Tuple[logging.Logger, SamplingFilter]] = []
+
+def report_sampled_drops() -> None:
+    """
+    Logs one summary record per event whose dropped count was never carried by a
+    later record (e.g. a one-shot scan ends inside the window). Runs at exit.
+    """
+    for logger, sampler in list(_samplers):
+        for key, count in sampler.pop_dropped():
+            level, msg = key[0], key[1]
+            if len(key) == 3 and key[2]:
+                try:
+                    msg = msg % key[2]
+                except (TypeError, ValueError):
+                    pass
+            record = logger.makeRecord(
+                logger.name, level, __file__, 0, "Sampling dropped %d more record(s) like: %s",
+                (count, msg), None, extra={"sampled_dropped": count}
+            )
+            # Straight to the handlers: the summary must not be sampled itself.
+            logger.callHandlers(record)
+
+def stop_queue_listeners() -> None:
+    """Flushes and stops every QueueListener started by setup_logger (runs at exit)."""
+    with _listeners_lock:
+        while _listeners:
+            _listeners.pop().stop()
+
+@atexit.register
+def _shutdown() -> None:
+    # Drop summaries go through the queue, so report them before stopping listeners.
+    report_sampled_drops()
+    stop_queue_listeners()
+
+def setup_logger(
+    name: str,
+    level=logging.INFO,
+    queued: bool = False,
+    queue_size: int = 10000,
+    overflow: str = "block",
+    json_format: bool = False,
+    sample_burst: Optional[int] = None,
+    sample_window: float = 1.0
+) -> logging.Logger:
     """
     Configures a standardized logger for the application.
-    
-    Why: 
+
+    Why:
     - Consistent formatting across all scripts.
     - Single point of change for log drivers (e.g., switching to JSON for Splunk).
     - Prevents duplicate handlers if called multiple times.
+
+    queued=True takes terminal/pipe I/O off the caller's thread: records go into a
+    bounded queue (see BoundedQueueHandler for `overflow` policies) and a background
+    QueueListener writes them out. Listeners are flushed at interpreter exit.
+
+    json_format=True emits JsonFormatter lines; sample_burst=N adds a SamplingFilter
+    allowing N identical events per `sample_window` seconds (see report_sampled_drops).
     """
     logger = logging.getLogger(name)
-    
+
     # Avoid adding multiple handlers if setup_logger is called repeatedly
     if not logger.handlers:
         handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter('%(asctime)s - %(levelname)s - [%(name)s] - %(message)s')
+        if json_format:
+            formatter = JsonFormatter()
+        else:
+            formatter = logging.Formatter('%(asctime)s - %(levelname)s - [%(name)s] - %(message)s')
         handler.setFormatter(formatter)
+
+        if queued:
+            log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+            listener = _BoundedQueueListener(log_queue, handler, respect_handler_level=True)
+            listener.start()
+            with _listeners_lock:
+                _listeners.append(listener)
+            handler = BoundedQueueHandler(log_queue, overflow=overflow)
+
         logger.addHandler(handler)
         logger.setLevel(level)
-        
+        if sample_burst is not None:
+            sampler = SamplingFilter(burst=sample_burst, window=sample_window)
+            logger.addFilter(sampler)
+            _samplers.append((logger, sampler))
+
     return logger
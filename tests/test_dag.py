@@ -0,0 +1,101 @@
+import threading
+import time
+import unittest
+from devops_toolkit.dag import Task, run_dag, SUCCESS, FAILED, TIMEOUT, SKIPPED
+
+class TestRunDag(unittest.TestCase):
+
+    def test_independent_tasks_run_concurrently(self):
+        tasks = [
+            Task("cluster", lambda: time.sleep(0.1)),
+            Task("argocd", lambda: time.sleep(0.3), deps=["cluster"]),
+            Task("flux", lambda: time.sleep(0.3), deps=["cluster"]),
+        ]
+        start = time.monotonic()
+        result = run_dag(tasks, max_workers=4)
+        elapsed = time.monotonic() - start
+
+        self.assertTrue(result.ok)
+        # Serial would be ~0.7s; parallel branches finish in ~0.4s.
+        self.assertLess(elapsed, 0.6)
+        self.assertEqual(result.critical_path[0], "cluster")
+        self.assertIn(result.critical_path[1], ("argocd", "flux"))
+
+    def test_dependencies_are_respected(self):
+        order = []
+        lock = threading.Lock()
+
+        def record(name):
+            def _run():
+                with lock:
+                    order.append(name)
+            return _run
+
+        run_dag([
+            Task("c", record("c"), deps=["b"]),
+            Task("b", record("b"), deps=["a"]),
+            Task("a", record("a")),
+        ])
+        self.assertEqual(order, ["a", "b", "c"])
+
+    def test_failure_skips_dependents_only(self):
+        def boom():
+            raise RuntimeError("install failed")
+
+        result = run_dag([
+            Task("base", lambda: None),
+            Task("broken", boom, deps=["base"]),
+            Task("child", lambda: None, deps=["broken"]),
+            Task("grandchild", lambda: None, deps=["child"]),
+            Task("sibling", lambda: "ok", deps=["base"]),
+        ])
+
+        self.assertFalse(result.ok)
+        self.assertEqual(result.results["broken"].status, FAILED)
+        self.assertEqual(result.results["child"].status, SKIPPED)
+        self.assertEqual(result.results["grandchild"].status, SKIPPED)
+        self.assertEqual(result.results["sibling"].status, SUCCESS)
+        self.assertEqual(result.results["sibling"].result, "ok")
+
+    def test_timeout(self):
+        release = threading.Event()
+        result = run_dag([
+            Task("slow", lambda: release.wait(5), timeout=0.1),
+            Task("after", lambda: None, deps=["slow"]),
+        ])
+        release.set()
+
+        self.assertEqual(result.results["slow"].status, TIMEOUT)
+        self.assertEqual(result.results["after"].status, SKIPPED)
+
+    def test_timeout_counts_from_start_not_queueing(self):
+        # One worker: "quick" waits ~0.3s for "busy" before it can start.
+        result = run_dag([
+            Task("busy", lambda: time.sleep(0.3)),
+            Task("quick", lambda: time.sleep(0.05), timeout=0.2),
+        ], max_workers=1)
+
+        quick = result.results["quick"]
+        self.assertEqual(quick.status, SUCCESS)
+        self.assertLess(quick.end - quick.start, 0.2)
+        self.assertGreaterEqual(quick.start, result.results["busy"].end - 0.01)
+
+    def test_queued_task_times_out_after_it_starts(self):
+        release = threading.Event()
+        result = run_dag([
+            Task("busy", lambda: time.sleep(0.2)),
+            Task("stuck", lambda: release.wait(5), timeout=0.1),
+        ], max_workers=1)
+        release.set()
+
+        self.assertEqual(result.results["stuck"].status, TIMEOUT)
+        self.assertLess(result.wall_seconds, 1)
+
+    def test_invalid_graphs(self):
+        with self.assertRaises(ValueError):
+            run_dag([Task("a", lambda: None, deps=["missing"])])
+        with self.assertRaises(ValueError):
+            run_dag([Task("a", lambda: None, deps=["b"]), Task("b", lambda: None, deps=["a"])])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import gzip
+import os
+import tempfile
+import unittest
+from devops_toolkit.logs.export import PYARROW_AVAILABLE, export_logs, int_to_ip, ip_to_int
+
+LOG_CONTENT = """
+192.168.1.1 - - [21/Dec/2025:10:00:01 +0000] "GET /home HTTP/1.1" 200 1024
+192.168.1.2 - - [21/Dec/2025:10:00:02 +0000] "GET /app HTTP/1.1" 500 512
+10.0.0.5 - - [21/Dec/2025:10:00:03 +0000] "POST /login HTTP/1.1" 200 4096
+192.168.1.1 - - [21/Dec/2025:10:00:04 +0000] "GET /dashboard HTTP/1.1" 200 2048
+192.168.1.2 - - [21/Dec/2025:10:00:05 +0000] "GET /app HTTP/1.1" 500 512
+10.0.0.5 - - [21/Dec/2025:10:00:06 +0000] "POST /upload HTTP/1.1" 201 8192
+192.168.1.2 - - [21/Dec/2025:10:00:07 +0000] "GET /app HTTP/1.1" 500 512
+192.168.1.100 - - [21/Dec/2025:10:00:08 +0000] "GET /config HTTP/1.1" 404 -
+""".lstrip()
+
+class TestIpConversion(unittest.TestCase):
+
+    def test_round_trip(self):
+        self.assertEqual(ip_to_int("10.0.0.5"), 167772165)
+        self.assertEqual(int_to_ip(ip_to_int("192.168.1.100")), "192.168.1.100")
+
+@unittest.skipUnless(PYARROW_AVAILABLE, "pyarrow not installed")
+class TestExportLogs(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.log = os.path.join(self.dir.name, "access.log")
+        with open(self.log, "w") as f:
+            f.write(LOG_CONTENT * 10)
+        self.out = os.path.join(self.dir.name, "out")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_parquet_dataset_answers_queries(self):
+        import pyarrow.dataset as ds
+
+        result = export_logs(self.log, self.out, workers=2, chunk_size=1000, batch_size=7)
+        self.assertEqual(result["rows"], 80)
+        self.assertGreater(len(result["files"]), 1)
+
+        dataset = ds.dataset(self.out, format="parquet")
+        table = dataset.to_table(filter=(ds.field("ip") == ip_to_int("192.168.1.2")) & (ds.field("status") == 500))
+        self.assertEqual(table.num_rows, 30)
+        self.assertEqual(set(table.column("path").to_pylist()), {"/app"})
+        self.assertEqual(str(dataset.schema.field("method").type), "dictionary<values=string, indices=int32, ordered=0>")
+
+    def test_field_values(self):
+        export_logs(self.log, self.out, workers=1)
+        import pyarrow.dataset as ds
+
+        rows = ds.dataset(self.out, format="parquet").to_table().slice(0, 8).to_pylist()
+        self.assertEqual(int_to_ip(rows[0]["ip"]), "192.168.1.1")
+        self.assertEqual(int(rows[0]["ts"].timestamp()), 1766311201)
+        self.assertEqual(rows[2]["method"], "POST")
+        self.assertEqual(rows[7]["bytes"], 0)
+
+    def test_arrow_ipc_from_gzip(self):
+        import pyarrow as pa
+
+        gz = self.log + ".gz"
+        with open(self.log, "rb") as src, gzip.open(gz, "wb") as dst:
+            dst.write(src.read())
+        result = export_logs(gz, self.out, fmt="arrow", batch_size=16)
+
+        with pa.OSFile(result["files"][0], "rb") as f:
+            table = pa.ipc.open_stream(f).read_all()
+        self.assertEqual(table.num_rows, 80)
+        self.assertEqual(table.column("status").type, pa.uint16())
+
+    def test_rerun_replaces_stale_parts(self):
+        import pyarrow.dataset as ds
+
+        first = export_logs(self.log, self.out, workers=1, chunk_size=1000)
+        self.assertGreater(len(first["files"]), 1)
+        notes = os.path.join(self.out, "README.txt")
+        with open(notes, "w") as f:
+            f.write("kept")
+
+        second = export_logs(self.log, self.out, workers=1)
+        self.assertEqual(len(second["files"]), 1)
+        self.assertEqual(ds.dataset(self.out, format="parquet", exclude_invalid_files=True).count_rows(), 80)
+        self.assertEqual(sorted(os.listdir(self.out)), ["README.txt", "part-00000.parquet"])
+
+    def test_unknown_format_raises(self):
+        with self.assertRaises(ValueError):
+            export_logs(self.log, self.out, fmt="csv")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,12 +13,16 @@ import pytest
 from collections import deque
 import sys
 import os
+import threading
 
 # Ensure scripts folder is importable
-sys.path.append(os.path.join(os.path.dirname(__file__), '../scripts'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../scripts/algorithms'))
 
 from faang_interview_challenges import (
     RateLimiter, 
+    TokenBucket,
+    GCRA,
+    SlidingWindowCounter,
     validate_config_brackets, 
     top_k_ips,
     Codec, 
@@ -44,6 +48,72 @@ def test_rate_limiter_logic(rate_limiter):
     # Time 1.1: Allowed (First request at 100.0 expired)
     assert rate_limiter.allow_request(timestamp=101.1) is True
 
+ENGINES = [RateLimiter, TokenBucket, GCRA, SlidingWindowCounter]
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_engines_share_interface(engine):
+    limiter = engine(limit=2, window_seconds=1.0)
+    assert [limiter.allow_request(timestamp=t) for t in (100.0, 100.1, 100.2, 101.1)] == [True, True, False, True]
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_engines_cap_sustained_rate(engine):
+    # 10 req/s offered at 100 req/s for 10s: roughly 10 * 10 admitted (+ initial burst).
+    limiter = engine(limit=10, window_seconds=1.0)
+    admitted = sum(limiter.allow_request(timestamp=i / 100) for i in range(1000))
+    assert 100 <= admitted <= 115
+
+EPOCH = 1766311200.123456
+
+@pytest.mark.parametrize("engine", [TokenBucket, GCRA])
+@pytest.mark.parametrize("window", [0.7, 0.3, 1.0, 2.9])
+@pytest.mark.parametrize("start", [100.0, EPOCH])
+def test_engines_exact_rate_with_inexact_windows(engine, window, start):
+    # limit=1 paced exactly one window apart: every request fits.
+    limiter = engine(limit=1, window_seconds=window)
+    assert all(limiter.allow_request(timestamp=start + i * window) for i in range(100))
+
+@pytest.mark.parametrize("engine", [TokenBucket, GCRA])
+@pytest.mark.parametrize("limit,window", [(5, 1.0), (3, 0.7), (7, 0.3), (10, 0.1), (1, 0.7)])
+def test_engines_full_burst_at_epoch(engine, limit, window):
+    limiter = engine(limit=limit, window_seconds=window)
+    assert sum(limiter.allow_request(timestamp=EPOCH) for _ in range(limit + 3)) == limit
+    # A second apart (more than a window) a limit=1 limiter always has room again.
+    single = engine(limit=1, window_seconds=0.7)
+    assert [single.allow_request(timestamp=EPOCH + i) for i in range(5)] == [True] * 5
+
+def test_sliding_window_counter_weights_previous_window():
+    limiter = SlidingWindowCounter(limit=10, window_seconds=10.0)
+    for _ in range(10):
+        assert limiter.allow_request(timestamp=5.0) is True
+    # t=15: 50% of the previous window still overlaps -> estimate 5, room for 5 more.
+    assert sum(limiter.allow_request(timestamp=15.0) for _ in range(10)) == 5
+    # Two windows later nothing of the burst is left.
+    assert limiter.allow_request(timestamp=31.0) is True
+
+def test_gcra_spaces_requests_after_burst():
+    limiter = GCRA(limit=4, window_seconds=1.0)
+    assert all(limiter.allow_request(timestamp=0.0) for _ in range(4))
+    assert limiter.allow_request(timestamp=0.1) is False
+    # One emission interval (0.25s) later exactly one more fits.
+    assert limiter.allow_request(timestamp=0.25) is True
+    assert limiter.allow_request(timestamp=0.25) is False
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_engines_thread_safe(engine):
+    # A frozen clock isolates the race: exactly `limit` admits across threads.
+    limiter = engine(limit=500, window_seconds=60.0)
+    admitted = []
+
+    def worker():
+        admitted.append(sum(limiter.allow_request(timestamp=1000.0) for _ in range(200)))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sum(admitted) == 500
+
 # ==========================================
 # 2. TEST BRACKET VALIDATOR (Parametrized)
 # ==========================================
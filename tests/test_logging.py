@@ -0,0 +1,181 @@
+import io
+import json
+import logging
+import queue
+import threading
+import time
+import unittest
+from unittest.mock import patch
+from devops_toolkit.utils.logging import (
+    BoundedQueueHandler, JsonFormatter, SamplingFilter, report_sampled_drops, setup_logger,
+    stop_queue_listeners
+)
+
+def make_record(msg, args=None):
+    return logging.LogRecord("test", logging.INFO, __file__, 1, msg, args, None)
+
+class TestBoundedQueueHandler(unittest.TestCase):
+
+    def test_drop_oldest_keeps_newest_records(self):
+        q = queue.Queue(maxsize=2)
+        handler = BoundedQueueHandler(q, overflow="drop_oldest")
+        for i in range(5):
+            handler.emit(make_record(f"msg {i}"))
+
+        self.assertEqual([q.get_nowait().msg for _ in range(2)], ["msg 3", "msg 4"])
+        self.assertEqual(handler.dropped, 3)
+
+    def test_sample_keeps_one_in_n_on_overflow(self):
+        q = queue.Queue(maxsize=1)
+        handler = BoundedQueueHandler(q, overflow="sample", sample_every=3)
+        handler.emit(make_record("first"))
+        for i in range(2):
+            handler.emit(make_record(f"overflow {i}"))
+
+        self.assertEqual(handler.dropped, 2)
+        self.assertEqual(q.get_nowait().msg, "first")
+
+    def test_sample_never_blocks_on_full_queue(self):
+        # No listener drains the queue: every emit past the first two hits a full queue.
+        q = queue.Queue(maxsize=2)
+        handler = BoundedQueueHandler(q, overflow="sample", sample_every=2)
+        worker = threading.Thread(target=lambda: [handler.emit(make_record(f"msg {i}")) for i in range(10)])
+        worker.start()
+        worker.join(timeout=2)
+
+        self.assertFalse(worker.is_alive(), "emit blocked on a full queue")
+        self.assertEqual(handler.dropped, 8)
+        self.assertEqual([q.get_nowait().msg for _ in range(2)], ["msg 7", "msg 9"])
+
+    def test_rejects_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            BoundedQueueHandler(queue.Queue(), overflow="explode")
+
+class TestQueuedLogger(unittest.TestCase):
+
+    def test_listener_flushes_on_stop(self):
+        out = io.StringIO()
+        with patch("sys.stdout", out):
+            logger = setup_logger("test_queued_logger", queued=True, queue_size=100)
+        self.assertIsInstance(logger.handlers[0], BoundedQueueHandler)
+
+        logger.info("pod %s restarted", "web-1")
+        stop_queue_listeners()
+
+        self.assertIn("pod web-1 restarted", out.getvalue())
+        self.assertTrue(logger.handlers[0].queue.empty())
+
+    def test_stop_with_full_queue(self):
+        release = threading.Event()
+
+        class SlowSink(io.StringIO):
+            def write(self, s):
+                release.wait(5)
+                return super().write(s)
+
+        out = SlowSink()
+        with patch("sys.stdout", out):
+            logger = setup_logger("test_full_queue_logger", queued=True, queue_size=10, overflow="drop_oldest")
+        for i in range(50):
+            logger.info("record %d", i)
+        self.assertTrue(logger.handlers[0].queue.full())
+
+        errors = []
+        def stop():
+            try:
+                stop_queue_listeners()
+            except Exception as exc:  # queue.Full before the fix
+                errors.append(exc)
+        stopper = threading.Thread(target=stop)
+        stopper.start()
+        time.sleep(0.05)
+        release.set()
+        stopper.join(5)
+
+        self.assertFalse(stopper.is_alive())
+        self.assertEqual(errors, [])
+        self.assertIn("record 49", out.getvalue())
+        self.assertTrue(logger.handlers[0].queue.empty())
+
+class TestJsonFormatter(unittest.TestCase):
+
+    def test_extra_fields_become_keys(self):
+        record = logging.LogRecord("scan", logging.WARNING, __file__, 1, "pod %s restarted", ("web-1",), None)
+        record.pod = "web-1"
+        record.restart_count = 7
+
+        doc = json.loads(JsonFormatter().format(record))
+
+        self.assertEqual(doc["msg"], "pod web-1 restarted")
+        self.assertEqual(doc["level"], "WARNING")
+        self.assertEqual(doc["pod"], "web-1")
+        self.assertEqual(doc["restart_count"], 7)
+        self.assertNotIn("args", doc)
+
+class TestSamplingFilter(unittest.TestCase):
+
+    def test_limits_identical_events_per_window(self):
+        sampler = SamplingFilter(burst=2, window=60)
+        passed = [sampler.filter(make_record("same")) for _ in range(5)]
+        self.assertEqual(passed, [True, True, False, False, False])
+        # A different template has its own budget.
+        self.assertTrue(sampler.filter(make_record("other")))
+
+    def test_reports_dropped_count_in_next_window(self):
+        sampler = SamplingFilter(burst=1, window=0.05)
+        for _ in range(4):
+            sampler.filter(make_record("same"))
+        time.sleep(0.06)
+        record = make_record("same")
+
+        self.assertTrue(sampler.filter(record))
+        self.assertEqual(record.sampled_dropped, 3)
+
+    def test_expired_templates_are_swept(self):
+        sampler = SamplingFilter(burst=1, window=0.05)
+        for i in range(1000):
+            sampler.filter(make_record(f"request {i} failed"))
+        time.sleep(0.06)
+        sampler.filter(make_record("request 1000 failed"))
+
+        self.assertEqual(len(sampler._counters), 1)
+
+    def test_tracked_templates_are_capped(self):
+        sampler = SamplingFilter(burst=1, window=60, max_keys=100)
+        for i in range(1000):
+            sampler.filter(make_record(f"request {i} failed"))
+
+        self.assertEqual(len(sampler._counters), 100)
+        # The newest templates are the ones kept.
+        self.assertIn((logging.INFO, "request 999 failed", None), sampler._counters)
+
+    def test_same_template_different_args_are_distinct_events(self):
+        sampler = SamplingFilter(burst=1, window=60)
+        template = "High Restarts: Pod %s (Container: %s) has restarted %d times."
+        passed = [sampler.filter(make_record(template, (f"web-{i}", "app", 7))) for i in range(300)]
+        self.assertTrue(all(passed))
+        self.assertFalse(sampler.filter(make_record(template, ("web-0", "app", 7))))
+
+    def test_unhashable_args_key_on_rendered_message(self):
+        sampler = SamplingFilter(burst=1, window=60)
+        self.assertTrue(sampler.filter(make_record("pods %s", (["web-1"],))))
+        self.assertTrue(sampler.filter(make_record("pods %s", (["web-2"],))))
+        self.assertFalse(sampler.filter(make_record("pods %s", (["web-1"],))))
+
+    def test_unreported_drops_are_logged_at_shutdown(self):
+        out = io.StringIO()
+        with patch("sys.stdout", out):
+            logger = setup_logger("test_sampled_drops_logger", sample_burst=1, sample_window=60)
+        for _ in range(4):
+            logger.warning("disk %s full", "/var")
+        report_sampled_drops()
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertIn("Sampling dropped 3 more record(s) like: disk /var full", lines[1])
+        # Reported once only.
+        report_sampled_drops()
+        self.assertEqual(len(out.getvalue().splitlines()), 2)
+
+if __name__ == '__main__':
+    unittest.main()
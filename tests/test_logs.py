@@ -0,0 +1,248 @@
+import gzip
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from devops_toolkit.logs.analyzer import LogStats, analyze_logs, chunk_ranges, parse_range, scan_range_mmap
+from devops_toolkit.logs.compression import ZSTD_AVAILABLE, detect_compression, open_log, zstd_frames
+from devops_toolkit.logs.follow import LogFollower
+
+LOG_CONTENT = """
+192.168.1.1 - - [21/Dec/2025:10:00:01 +0000] "GET /home HTTP/1.1" 200 1024
+192.168.1.2 - - [21/Dec/2025:10:00:02 +0000] "GET /app HTTP/1.1" 500 512
+10.0.0.5 - - [21/Dec/2025:10:00:03 +0000] "POST /login HTTP/1.1" 200 4096
+192.168.1.1 - - [21/Dec/2025:10:00:04 +0000] "GET /dashboard HTTP/1.1" 200 2048
+192.168.1.2 - - [21/Dec/2025:10:00:05 +0000] "GET /app HTTP/1.1" 500 512
+10.0.0.5 - - [21/Dec/2025:10:00:06 +0000] "POST /upload HTTP/1.1" 201 8192
+192.168.1.2 - - [21/Dec/2025:10:00:07 +0000] "GET /app HTTP/1.1" 500 512
+192.168.1.100 - - [21/Dec/2025:10:00:08 +0000] "GET /config HTTP/1.1" 404 128
+garbage line
+""".lstrip()
+
+class LogFileTestCase(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".log")
+        with os.fdopen(fd, "w") as f:
+            f.write(LOG_CONTENT * 50)
+
+    def tearDown(self):
+        os.unlink(self.path)
+
+class TestChunking(LogFileTestCase):
+
+    def test_ranges_cover_file_on_line_boundaries(self):
+        ranges = chunk_ranges(self.path, chunk_size=1000)
+        self.assertGreater(len(ranges), 1)
+        self.assertEqual(ranges[0][1], 0)
+        self.assertEqual(ranges[-1][2], os.path.getsize(self.path))
+
+        with open(self.path, "rb") as f:
+            data = f.read()
+        for (_, start, end), (_, next_start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(end, next_start)
+            self.assertEqual(data[end - 1:end], b"\n")
+
+    def test_chunked_parse_matches_single_pass(self):
+        whole = parse_range(self.path, 0, os.path.getsize(self.path))
+        merged = LogStats()
+        for chunk in chunk_ranges(self.path, chunk_size=777):
+            merged.merge(parse_range(*chunk))
+
+        self.assertEqual(merged.ip_counts, whole.ip_counts)
+        self.assertEqual(merged.lines, whole.lines)
+
+class TestAnalyzeLogs(LogFileTestCase):
+
+    def test_counts_match_parse_logs(self):
+        stats = analyze_logs(self.path, workers=1)
+        self.assertEqual(stats.server_errors, 150)
+        self.assertEqual(stats.ip_counts["192.168.1.2"], 150)
+        self.assertEqual(stats.top_ips(1), [("192.168.1.2", 150)])
+        self.assertEqual(stats.unmatched, 50)
+
+    def test_process_pool_gives_same_result(self):
+        serial = analyze_logs(self.path, workers=1)
+        parallel = analyze_logs([self.path, self.path], workers=2, chunk_size=2048)
+
+        self.assertEqual(parallel.lines, serial.lines * 2)
+        self.assertEqual(parallel.status_counts["404"], serial.status_counts["404"] * 2)
+        self.assertEqual(parallel.bytes, os.path.getsize(self.path) * 2)
+
+    def test_mmap_mode_matches_text_mode(self):
+        text = analyze_logs(self.path, workers=1)
+        mapped = analyze_logs(self.path, workers=2, chunk_size=1500, mode="mmap")
+
+        self.assertEqual(mapped.ip_counts, text.ip_counts)
+        self.assertEqual(mapped.status_counts, text.status_counts)
+        self.assertEqual(mapped.lines, text.lines)
+
+    def test_mmap_small_windows_match_single_window(self):
+        size = os.path.getsize(self.path)
+        whole = scan_range_mmap(self.path, 0, size)
+        with patch("devops_toolkit.logs.analyzer._WINDOW", 100):
+            windowed = scan_range_mmap(self.path, 0, size)
+
+        self.assertEqual(windowed.ip_counts, whole.ip_counts)
+        self.assertEqual(windowed.matched, whole.matched)
+
+    def test_mmap_counts_unterminated_last_line(self):
+        with open(self.path, "ab") as f:
+            f.write(b'10.0.0.9 - - [21/Dec/2025:10:00:09 +0000] "GET / HTTP/1.1" 503 1')
+        stats = scan_range_mmap(self.path, 0, os.path.getsize(self.path))
+
+        self.assertEqual(stats.status_counts["503"], 1)
+        self.assertEqual(stats.lines, 451)
+
+    def test_unknown_mode_raises(self):
+        with self.assertRaises(ValueError):
+            analyze_logs(self.path, mode="gpu")
+
+    def test_sketch_mode_bounds_ip_tracking(self):
+        exact = analyze_logs(self.path, workers=1)
+        sketched = analyze_logs(self.path, workers=2, chunk_size=1500, mode="mmap", sketch=True,
+                                sketch_options={"precision": 10, "top_k": 10})
+
+        self.assertEqual(len(sketched.ip_counts), 0)
+        self.assertEqual(sketched.distinct_ips, exact.distinct_ips)
+        self.assertEqual(sketched.top_ips(1), exact.top_ips(1))
+        self.assertEqual(sketched.server_errors, exact.server_errors)
+
+    def test_missing_file_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            analyze_logs("/nonexistent/access.log")
+
+class TestCompressedInput(LogFileTestCase):
+
+    def setUp(self):
+        super().setUp()
+        with open(self.path, "rb") as f:
+            self.data = f.read()
+        self.expected = analyze_logs(self.path, workers=1, mode="mmap")
+        self.compressed = self.path + ".z"
+
+    def tearDown(self):
+        super().tearDown()
+        if os.path.exists(self.compressed):
+            os.unlink(self.compressed)
+
+    def write_zstd_frames(self, piece_size):
+        import zstandard
+        cctx = zstandard.ZstdCompressor(write_checksum=True)
+        # Frame boundaries deliberately fall in the middle of lines.
+        pieces = [self.data[i:i + piece_size] for i in range(0, len(self.data), piece_size)]
+        with open(self.compressed, "wb") as f:
+            for piece in pieces:
+                f.write(cctx.compress(piece))
+        return len(pieces)
+
+    def assert_matches_plain(self, stats):
+        self.assertEqual(stats.ip_counts, self.expected.ip_counts)
+        self.assertEqual(stats.status_counts, self.expected.status_counts)
+        self.assertEqual(stats.lines, self.expected.lines)
+        self.assertEqual(stats.bytes, len(self.data))
+
+    def test_gzip_detected_by_magic(self):
+        with gzip.open(self.compressed, "wb") as f:
+            f.write(self.data)
+
+        self.assertEqual(detect_compression(self.compressed), "gzip")
+        self.assertIsNone(detect_compression(self.path))
+        self.assert_matches_plain(analyze_logs(self.compressed, workers=1))
+
+    @unittest.skipUnless(ZSTD_AVAILABLE, "zstandard not installed")
+    def test_zstd_frame_walk_finds_every_frame(self):
+        count = self.write_zstd_frames(piece_size=997)
+        frames = zstd_frames(self.compressed)
+
+        self.assertEqual(len(frames), count)
+        self.assertEqual(frames[-1][1], os.path.getsize(self.compressed))
+        with open_log(self.compressed) as stream:
+            self.assertEqual(stream.read(), self.data)
+
+    @unittest.skipUnless(ZSTD_AVAILABLE, "zstandard not installed")
+    def test_zstd_frames_decompressed_in_parallel(self):
+        self.write_zstd_frames(piece_size=997)
+        # Tiny chunk_size: several frame groups, split lines stitched in the parent.
+        self.assert_matches_plain(analyze_logs(self.compressed, workers=2, chunk_size=4000))
+        self.assert_matches_plain(analyze_logs(self.compressed, workers=1))
+
+    @unittest.skipUnless(ZSTD_AVAILABLE, "zstandard not installed")
+    def test_corrupt_zstd_raises(self):
+        self.write_zstd_frames(piece_size=997)
+        with open(self.compressed, "ab") as f:
+            f.write(b"not a frame")
+        with self.assertRaises(ValueError):
+            zstd_frames(self.compressed)
+
+LINE_500 = b'10.0.0.7 - - [21/Dec/2025:10:00:01 +0000] "GET /app HTTP/1.1" 500 512\n'
+LINE_200 = b'10.0.0.8 - - [21/Dec/2025:10:00:02 +0000] "GET /home HTTP/1.1" 200 64\n'
+
+class TestLogFollower(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.log = os.path.join(self.dir.name, "access.log")
+        self.ckpt = os.path.join(self.dir.name, "access.ckpt")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def append(self, data, path=None):
+        with open(path or self.log, "ab") as f:
+            f.write(data)
+
+    def test_only_new_bytes_are_scanned(self):
+        self.append(LINE_500 * 3)
+        self.assertEqual(LogFollower(self.log, self.ckpt).poll().matched, 3)
+
+        self.append(LINE_200 * 2)
+        # A fresh follower (next cron run) resumes from the saved checkpoint.
+        follower = LogFollower(self.log, self.ckpt)
+        delta = follower.poll()
+
+        self.assertEqual(delta.matched, 2)
+        self.assertEqual(delta.bytes, len(LINE_200) * 2)
+        self.assertEqual(follower.stats.server_errors, 3)
+        self.assertEqual(follower.stats.status_counts["200"], 2)
+
+    def test_partial_line_is_carried_to_next_poll(self):
+        follower = LogFollower(self.log, self.ckpt)
+        self.append(LINE_500 + LINE_200[:20])
+        self.assertEqual(follower.poll().matched, 1)
+
+        self.append(LINE_200[20:])
+        delta = LogFollower(self.log, self.ckpt).poll()
+        self.assertEqual(delta.status_counts["200"], 1)
+        self.assertEqual(delta.lines, 1)
+
+    def test_rotation_drains_old_file_then_reads_new(self):
+        follower = LogFollower(self.log, self.ckpt)
+        self.append(LINE_500)
+        follower.poll()
+
+        self.append(LINE_500 + LINE_200[:30])
+        os.rename(self.log, self.log + ".1")
+        self.append(LINE_200)
+        delta = follower.poll()
+
+        # One more 500 from the old file, its unterminated tail, and the new file.
+        self.assertEqual(delta.server_errors, 1)
+        self.assertEqual(delta.lines, 3)
+        self.assertEqual(follower.stats.server_errors, 2)
+        self.assertEqual(follower.checkpoint.offset, len(LINE_200))
+
+    def test_truncation_restarts_at_zero(self):
+        follower = LogFollower(self.log)
+        self.append(LINE_500 * 5)
+        follower.poll()
+
+        with open(self.log, "wb") as f:
+            f.write(LINE_200)
+        delta = follower.poll()
+
+        self.assertEqual(delta.matched, 1)
+        self.assertEqual(delta.status_counts["200"], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,181 @@
+import json
+import os
+import tempfile
+import unittest
+from devops_toolkit.logs.analyzer import analyze_logs
+from devops_toolkit.logs.compression import ZSTD_AVAILABLE
+from devops_toolkit.logs.parsers import (
+    PARSERS, JsonLinesParser, K8sCriParser, LogParser, LogRecord, detect_format, get_parser,
+    parse_iso8601, register_parser
+)
+
+COMMON = '10.0.0.5 - frank [21/Dec/2025:10:00:03 +0000] "POST /login HTTP/1.1" 200 4096'
+COMBINED = ('192.168.1.2 - - [21/Dec/2025:12:00:02 +0200] "GET /app?q=1 HTTP/2.0" 500 - '
+            '"https://example.com/" "Mozilla/5.0 (X11; Linux x86_64)"')
+EPOCH = 1766311200  # 21/Dec/2025:10:00:00 UTC
+
+class TestClfParsers(unittest.TestCase):
+
+    def test_apache_common(self):
+        record = get_parser("apache_common").parse(COMMON)
+        self.assertEqual(record, LogRecord(ip="10.0.0.5", ts=EPOCH + 3, method="POST", path="/login",
+                                           protocol="HTTP/1.1", status=200, size=4096))
+
+    def test_nginx_combined_http2(self):
+        record = get_parser("nginx_combined").parse(COMBINED)
+        self.assertEqual(record.ts, EPOCH + 2)
+        self.assertEqual((record.method, record.path, record.protocol), ("GET", "/app?q=1", "HTTP/2.0"))
+        self.assertEqual((record.status, record.size), (500, 0))
+        self.assertEqual(record.referer, "https://example.com/")
+        self.assertEqual(record.user_agent, "Mozilla/5.0 (X11; Linux x86_64)")
+
+    def test_fast_path_matches_regex(self):
+        for name, line in (("apache_common", COMMON), ("nginx_combined", COMBINED),
+                           ("nginx_combined", COMMON)):
+            parser = get_parser(name)
+            self.assertEqual(parser.parse_fast(line), parser.parse_regex(line), line)
+
+    def test_escaped_quote_falls_back_to_regex(self):
+        line = '10.0.0.5 - - [21/Dec/2025:10:00:03 +0000] "GET /a\\"b HTTP/1.1" 404 12 "-" "curl/8"'
+        parser = get_parser("nginx_combined")
+        with self.assertRaises(ValueError):
+            parser.parse_fast(line)
+        record = parser.parse(line)
+        self.assertEqual((record.path, record.status, record.user_agent), ('/a\\"b', 404, "curl/8"))
+
+    def test_malformed_request_and_garbage(self):
+        parser = get_parser("nginx_combined")
+        record = parser.parse('10.0.0.9 - - [21/Dec/2025:10:00:03 +0000] "-" 400 0 "-" "-"')
+        self.assertEqual((record.method, record.status), (None, 400))
+        self.assertIsNone(parser.parse("garbage line"))
+
+class TestJsonLinesParser(unittest.TestCase):
+
+    def test_default_field_names(self):
+        line = json.dumps({"remote_addr": "10.0.0.5", "time_iso8601": "2025-12-21T12:00:03+02:00",
+                           "request_method": "GET", "request_uri": "/", "status": "503",
+                           "body_bytes_sent": "17", "request_time": "0.250"})
+        record = get_parser("json_lines").parse(line)
+        self.assertEqual((record.ip, record.ts, record.status, record.size), ("10.0.0.5", EPOCH + 3, 503, 17))
+        self.assertEqual(record.latency, 0.25)
+
+    def test_custom_fields_and_stdlib_fallback(self):
+        parser = JsonLinesParser(fields={"ip": ("peer",)})
+        record = parser.parse('{"peer": "10.1.1.1", "status": 200, "ts": 1766311200, "latency": NaN}')
+        self.assertEqual((record.ip, record.ts, record.status), ("10.1.1.1", EPOCH, 200))
+        self.assertIsNone(parser.parse("not json"))
+        self.assertIsNone(parser.parse("[1, 2]"))
+
+class TestK8sCriParser(unittest.TestCase):
+
+    def test_prefix(self):
+        record = get_parser("k8s_cri").parse("2025-12-21T10:00:01.123456789Z stderr F panic: boom")
+        self.assertEqual((record.ts, record.stream, record.message), (EPOCH + 1, "stderr", "panic: boom"))
+
+    def test_inner_parser(self):
+        parser = K8sCriParser(inner="nginx_combined")
+        record = parser.parse("2025-12-21T10:00:09.5+00:00 stdout F " + COMBINED)
+        self.assertEqual((record.ip, record.ts, record.stream), ("192.168.1.2", EPOCH + 2, "stdout"))
+        record = parser.parse("2025-12-21T10:00:09Z stdout P starting worker")
+        self.assertEqual((record.ts, record.message), (EPOCH + 9, "starting worker"))
+
+    def test_iso8601(self):
+        self.assertEqual(parse_iso8601("2025-12-21T04:30:00.000000001-05:30"), EPOCH)
+        self.assertEqual(parse_iso8601("2025-12-21T10:00:00"), EPOCH)
+
+class TestMalformedInput(unittest.TestCase):
+
+    MALFORMED = [
+        "", "x", "xZ stdout F hi", "-", '"', "[", "]", "{", "{}", "null", "[1, 2]",
+        '10.0.0.1 - - [', '10.0.0.1 - - [21/Foo/2025:10:00:03 +0000] "GET / HTTP/1.1" 200 1',
+        '10.0.0.1 - - [21/Dec/2025:10:00:03 +0000] "GET / HTTP/1.1" abc 1',
+        '10.0.0.1 - - [21/Dec/2025:10:00:03 +0000] "GET / HTTP/1.1" 200 1 "ref',
+        '{"status": {"a": 1}, "ts": ["x"], "remote_addr": 7, "request_time": "fast"}',
+        '{"ts": "yesterday", "size": 1e999, "status": true}',
+        "2025-13-45T99:99:99Z stdout F hi", "2025-12-21T10:00:01 stdout F no zone",
+        "2025 stderr P x",
+    ]
+
+    def test_every_format_survives_malformed_lines(self):
+        for name in PARSERS:
+            for options in ({}, {"inner": "json_lines"}) if name == "k8s_cri" else ({},):
+                parser = get_parser(name, **options)
+                for line in self.MALFORMED:
+                    record = parser.parse(line)
+                    self.assertTrue(record is None or isinstance(record, LogRecord), (name, line))
+
+    def test_json_bad_field_only_nulls_that_field(self):
+        record = get_parser("json_lines").parse(
+            '{"status": {"a": 1}, "ts": ["x"], "remote_addr": "10.0.0.5", "size": "12", "request_time": "fast"}'
+        )
+        self.assertEqual((record.ip, record.size), ("10.0.0.5", 12))
+        self.assertIsNone(record.status)
+        self.assertIsNone(record.ts)
+        self.assertIsNone(record.latency)
+
+    def test_short_cri_stamp(self):
+        record = get_parser("k8s_cri").parse("xZ stdout F hi")
+        self.assertIsNone(record)
+
+class TestRegistry(unittest.TestCase):
+
+    def test_builtins_and_unknown(self):
+        self.assertTrue({"apache_common", "nginx_combined", "json_lines", "k8s_cri"} <= set(PARSERS))
+        with self.assertRaises(ValueError):
+            get_parser("syslog")
+
+    def test_register_custom_parser(self):
+        @register_parser
+        class CsvParser(LogParser):
+            name = "test_csv"
+
+            def parse_fast(self, line):
+                ip, status = line.split(",")
+                return LogRecord(ip=ip, status=int(status))
+
+        try:
+            self.assertEqual(get_parser("test_csv").parse("10.0.0.1,204").status, 204)
+        finally:
+            del PARSERS["test_csv"]
+
+    def test_detect_format(self):
+        self.assertEqual(detect_format([COMBINED, COMMON]), "nginx_combined")
+        self.assertEqual(detect_format([COMMON]), "apache_common")
+        self.assertEqual(detect_format(['{"status": 200}']), "json_lines")
+        self.assertEqual(detect_format(["2025-12-21T10:00:01Z stdout F hi"]), "k8s_cri")
+        self.assertIsNone(detect_format([]))
+
+class TestAnalyzeWithFormat(unittest.TestCase):
+
+    def test_http2_lines_counted(self):
+        fd, path = tempfile.mkstemp(suffix=".log")
+        with os.fdopen(fd, "w") as f:
+            f.write((COMBINED + "\n" + COMMON + "\ngarbage\n") * 20)
+        try:
+            for stats in (analyze_logs(path, workers=1), analyze_logs(path, workers=2, chunk_size=512),
+                          analyze_logs(path, workers=1, log_format="nginx_combined")):
+                self.assertEqual((stats.lines, stats.matched), (60, 40))
+                self.assertEqual(stats.status_counts["500"], 20)
+            with self.assertRaises(ValueError):
+                analyze_logs(path, log_format="nope")
+        finally:
+            os.unlink(path)
+
+    @unittest.skipUnless(ZSTD_AVAILABLE, "zstandard not installed")
+    def test_zstd_with_log_format(self):
+        import zstandard
+        data = ((COMBINED + "\n" + COMMON + "\ngarbage\n") * 2000).encode()
+        fd, path = tempfile.mkstemp(suffix=".log.zst")
+        with os.fdopen(fd, "wb") as f:
+            cctx = zstandard.ZstdCompressor()
+            for i in range(0, len(data), 997):
+                f.write(cctx.compress(data[i:i + 997]))
+        try:
+            stats = analyze_logs(path, workers=4, chunk_size=80000, log_format="nginx_combined")
+            self.assertEqual((stats.lines, stats.matched, stats.bytes), (6000, 4000, len(data)))
+            self.assertEqual(stats.status_counts["500"], 2000)
+        finally:
+            os.unlink(path)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+import gzip
+import os
+import tempfile
+import unittest
+from devops_toolkit.logs.rollups import RollupSeries, build_rollups, parse_clf_minute
+from devops_toolkit.logs.sketches import DDSketch
+
+def line(ip, minute, sec, status, size):
+    return f'{ip} - - [21/Dec/2025:10:{minute:02d}:{sec:02d} +0000] "GET /app HTTP/1.1" {status} {size}\n'
+
+class TestParseClfMinute(unittest.TestCase):
+
+    def test_utc_offsets(self):
+        self.assertEqual(parse_clf_minute("21/Dec/2025:10:00", "+0000"), 1766311200)
+        self.assertEqual(parse_clf_minute("21/Dec/2025:12:00", "+0200"), 1766311200)
+        self.assertEqual(parse_clf_minute("21/Dec/2025:04:30", "-0530"), 1766311200)
+
+class TestDDSketch(unittest.TestCase):
+
+    def test_quantiles_within_relative_accuracy(self):
+        sketch = DDSketch(relative_accuracy=0.01)
+        for value in range(1, 10001):
+            sketch.add(value)
+        for q, expected in ((0.5, 5000), (0.95, 9500), (0.99, 9900)):
+            self.assertAlmostEqual(sketch.quantile(q), expected, delta=expected * 0.011)
+
+    def test_merge_matches_single_sketch(self):
+        single, left, right = DDSketch(), DDSketch(), DDSketch()
+        for value in range(1, 2001):
+            single.add(value)
+            (left if value % 2 else right).add(value)
+        self.assertEqual(left.merge(right).quantile(0.9), single.quantile(0.9))
+
+class TestRollupSeries(unittest.TestCase):
+
+    def test_add_out_of_order_grows_both_ends(self):
+        series = RollupSeries(bucket_seconds=60)
+        series.add(1766311260, "10.0.0.1", 200, 100)
+        series.add(1766311200, "10.0.0.2", 500, 50)
+        series.add(1766311330, "10.0.0.1", 404, 10)
+
+        self.assertEqual(series.origin, 1766311200)
+        self.assertEqual(list(series.requests), [1, 1, 1])
+        self.assertEqual(series.status[4][0], 1)
+        self.assertEqual(series.timestamp(2), 1766311320)
+
+    def test_merge_aligns_buckets(self):
+        a, b = RollupSeries(), RollupSeries()
+        a.add(1766311200, "10.0.0.1", 200, 10)
+        b.add(1766311320, "10.0.0.2", 200, 20)
+        b.add(1766311200, "10.0.0.3", 200, 30)
+        a.merge(b)
+
+        self.assertEqual(list(a.requests), [2, 0, 1])
+        self.assertEqual(list(a.bytes), [40, 0, 20])
+        self.assertEqual(a.distinct_ips(0), 2)
+
+    def test_merge_rejects_other_bucket_size(self):
+        with self.assertRaises(ValueError):
+            RollupSeries(60).merge(RollupSeries(300))
+
+class TestBuildRollups(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".log")
+        lines = []
+        for minute in range(3):
+            for sec in range(0, 60, 2):
+                lines.append(line(f"10.0.{minute}.{sec % 7}", minute, sec, 500 if sec % 10 == 0 else 200, 1000))
+        with os.fdopen(fd, "w") as f:
+            f.write("".join(lines))
+        self.gz = self.path + ".gz"
+
+    def tearDown(self):
+        os.unlink(self.path)
+        if os.path.exists(self.gz):
+            os.unlink(self.gz)
+
+    def test_per_minute_rollup(self):
+        series = build_rollups(self.path, workers=2, chunk_size=500, quantiles=True)
+        rows = list(series.rows())
+
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0]["timestamp"], 1766311200)
+        self.assertEqual(rows[0]["requests"], 30)
+        self.assertEqual(rows[0]["5xx"], 6)
+        self.assertEqual(rows[0]["2xx"], 24)
+        self.assertEqual(rows[0]["bytes"], 30000)
+        self.assertEqual(rows[0]["distinct_ips"], 7)
+        self.assertAlmostEqual(rows[0]["size_p99"], 1000, delta=10)
+
+    def test_sub_minute_buckets(self):
+        series = build_rollups(self.path, bucket_seconds=20, workers=1)
+        self.assertEqual(len(series), 9)
+        self.assertEqual(series.requests[0], 10)
+
+    def test_compressed_input(self):
+        with open(self.path, "rb") as src, gzip.open(self.gz, "wb") as dst:
+            dst.write(src.read())
+        plain = build_rollups(self.path, workers=1)
+        packed = build_rollups(self.gz, workers=1)
+
+        self.assertEqual(list(packed.requests), list(plain.requests))
+        self.assertEqual(list(packed.status[4]), list(plain.status[4]))
+
+class TestOutOfOrderLines(unittest.TestCase):
+
+    def test_older_line_keeps_distinct_ips_in_their_buckets(self):
+        # Apache logs requests at completion with their start time: minutes interleave.
+        fd, path = tempfile.mkstemp(suffix=".log")
+        with os.fdopen(fd, "w") as f:
+            f.write(line("10.0.0.1", 1, 10, 200, 1) + line("10.0.0.2", 1, 11, 200, 1)
+                    + line("10.0.0.3", 0, 59, 200, 1))
+        try:
+            for bucket_seconds in (60, 20):
+                rows = list(build_rollups(path, bucket_seconds=bucket_seconds, workers=1).rows())
+                counts = [(row["requests"], row["distinct_ips"]) for row in rows if row["requests"]]
+                self.assertEqual(counts, [(1, 1), (2, 2)])
+        finally:
+            os.unlink(path)
+
+    def test_worker_split_does_not_change_distinct_counts(self):
+        fd, path = tempfile.mkstemp(suffix=".log")
+        lines = []
+        for i in range(2000):
+            minute = (i // 40) % 30 - (i % 3)  # drifts back up to two minutes
+            lines.append(line(f"10.0.{i % 13}.{i % 11}", max(minute, 0), i % 60, 200, 10))
+        with os.fdopen(fd, "w") as f:
+            f.write("".join(lines))
+        try:
+            single = build_rollups(path, workers=1)
+            split = build_rollups(path, workers=4, chunk_size=30000)
+            self.assertEqual(list(single.requests), list(split.requests))
+            self.assertEqual([single.distinct_ips(i) for i in range(len(single))],
+                             [split.distinct_ips(i) for i in range(len(split))])
+        finally:
+            os.unlink(path)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import random
+import unittest
+from collections import Counter
+from devops_toolkit.logs.sketches import CountMinSketch, HyperLogLog, IpSketch, SpaceSaving
+
+def ip(i):
+    return f"10.{(i >> 16) & 255}.{(i >> 8) & 255}.{i & 255}"
+
+def skewed_stream(n, distinct, seed=1):
+    """A few heavy hitters on top of a long tail of distinct IPs."""
+    rng = random.Random(seed)
+    heavy = [ip(i) for i in range(5)]
+    stream = []
+    for _ in range(n):
+        if rng.random() < 0.3:
+            stream.append(heavy[rng.randrange(5)])
+        else:
+            stream.append(ip(5 + rng.randrange(distinct)))
+    return stream
+
+class TestHyperLogLog(unittest.TestCase):
+
+    def test_estimate_within_error_bound(self):
+        hll = HyperLogLog(precision=12)
+        for i in range(50_000):
+            hll.add(ip(i))
+        # Standard error at p=12 is ~1.6%; allow 3 sigma.
+        self.assertAlmostEqual(hll.count(), 50_000, delta=50_000 * 0.05)
+
+    def test_small_cardinality_is_near_exact(self):
+        hll = HyperLogLog()
+        for i in range(100):
+            hll.add(ip(i % 20))
+        self.assertEqual(hll.count(), 20)
+
+    def test_merge_equals_union(self):
+        left, right, union = HyperLogLog(10), HyperLogLog(10), HyperLogLog(10)
+        for i in range(3000):
+            (left if i % 2 else right).add(ip(i))
+            union.add(ip(i))
+        self.assertEqual(left.merge(right).registers, union.registers)
+
+    def test_merge_rejects_other_precision(self):
+        with self.assertRaises(ValueError):
+            HyperLogLog(10).merge(HyperLogLog(11))
+
+class TestCountMinSketch(unittest.TestCase):
+
+    def test_never_underestimates_and_bounded_overestimate(self):
+        stream = skewed_stream(20_000, 5_000)
+        exact = Counter(stream)
+        cms = CountMinSketch.from_error(epsilon=0.001, delta=0.01)
+        for item in stream:
+            cms.add(item)
+
+        for item, count in list(exact.items())[:500]:
+            estimate = cms.estimate(item)
+            self.assertGreaterEqual(estimate, count)
+            self.assertLessEqual(estimate, count + 0.001 * len(stream) * 3)
+
+    def test_merge_adds_counts(self):
+        a, b = CountMinSketch(256, 3), CountMinSketch(256, 3)
+        a.add("10.0.0.1", 5)
+        b.add("10.0.0.1", 7)
+        self.assertEqual(a.merge(b).estimate("10.0.0.1"), 12)
+        self.assertEqual(a.total, 12)
+
+class TestSpaceSaving(unittest.TestCase):
+
+    def test_finds_heavy_hitters(self):
+        stream = skewed_stream(20_000, 5_000)
+        exact = Counter(stream)
+        ss = SpaceSaving(k=50)
+        for item in stream:
+            ss.add(item)
+
+        top = ss.top(5)
+        self.assertEqual({item for item, _, _ in top}, {item for item, _ in exact.most_common(5)})
+        for item, count, error in top:
+            self.assertGreaterEqual(count, exact[item])
+            self.assertLessEqual(count - error, exact[item])
+
+    def test_merge_keeps_heavy_hitters_across_halves(self):
+        stream = skewed_stream(20_000, 5_000)
+        left, right = SpaceSaving(k=50), SpaceSaving(k=50)
+        for i, item in enumerate(stream):
+            (left if i % 2 else right).add(item)
+        merged = left.merge(right)
+
+        expected = {item for item, _ in Counter(stream).most_common(5)}
+        self.assertEqual({item for item, _, _ in merged.top(5)}, expected)
+        self.assertEqual(merged.total, len(stream))
+        self.assertLessEqual(len(merged.counts), 50)
+
+class TestIpSketch(unittest.TestCase):
+
+    def test_update_from_chunk_counters_and_merge(self):
+        stream = skewed_stream(30_000, 8_000)
+        exact = Counter(stream)
+        chunks = [Counter(stream[i:i + 10_000]) for i in range(0, len(stream), 10_000)]
+
+        total = IpSketch(precision=12, cms_width=2048, top_k=50)
+        for chunk in chunks:
+            part = IpSketch(precision=12, cms_width=2048, top_k=50)
+            part.update(chunk)
+            total.merge(part)
+
+        self.assertAlmostEqual(total.distinct(), len(exact), delta=len(exact) * 0.05)
+        self.assertEqual([item for item, _ in total.top(5)], [item for item, _ in exact.most_common(5)])
+        self.assertGreaterEqual(total.estimate(ip(0)), exact[ip(0)])
+        self.assertLess(total.memory_bytes, 200_000)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,19 @@
+import asyncio
 import subprocess
+import sys
+import time
 import unittest
 from unittest.mock import patch, MagicMock
-from devops_toolkit.system import run_command, check_binary_exists
+from devops_toolkit.system import (
+    run_command, check_binary_exists, run_command_async, run_many, stream_command,
+    binary_resolver, BinaryResolver
+)
 
 class TestSystemOperations(unittest.TestCase):
 
+    def setUp(self):
+        binary_resolver.clear()
+
     @patch("devops_toolkit.system.shutil.which")
     def test_check_binary_exists(self, mock_which):
         mock_which.return_value = "/usr/bin/kubectl"
@@ -50,5 +59,134 @@ class TestSystemOperations(unittest.TestCase):
         result = run_command("ls -z", shell=True, check=False)
         self.assertIsInstance(result, subprocess.CalledProcessError)
 
+    @patch("devops_toolkit.system.shutil.which")
+    def test_check_binary_exists_is_cached(self, mock_which):
+        mock_which.return_value = "/usr/bin/kubectl"
+        for _ in range(5):
+            self.assertTrue(check_binary_exists("kubectl"))
+
+        mock_which.assert_called_once()
+        self.assertEqual(binary_resolver.stats()["hits"], 4)
+        self.assertEqual(binary_resolver.stats()["misses"], 1)
+
+    @patch("devops_toolkit.system.subprocess.run")
+    @patch("devops_toolkit.system.shutil.which")
+    def test_run_command_uses_resolved_path(self, mock_which, mock_run):
+        mock_which.return_value = "/opt/bin/kubectl"
+        run_command(["kubectl", "version"])
+        self.assertEqual(mock_run.call_args[0][0], ["/opt/bin/kubectl", "version"])
+
+class TestBinaryResolver(unittest.TestCase):
+
+    @patch("devops_toolkit.system.shutil.which", return_value="/usr/bin/ls")
+    def test_invalidated_on_path_change(self, mock_which):
+        resolver = BinaryResolver()
+        with patch.dict("os.environ", {"PATH": "/usr/bin"}):
+            resolver.resolve("ls")
+            resolver.resolve("ls")
+        with patch.dict("os.environ", {"PATH": "/usr/local/bin:/usr/bin"}):
+            resolver.resolve("ls")
+
+        self.assertEqual(mock_which.call_count, 2)
+        self.assertEqual(resolver.stats(), {"hits": 1, "misses": 2, "size": 1})
+
+    @patch("devops_toolkit.system.time.monotonic")
+    @patch("devops_toolkit.system.shutil.which", return_value="/usr/bin/ls")
+    def test_ttl_expiry(self, mock_which, mock_clock):
+        resolver = BinaryResolver(ttl=10)
+        mock_clock.return_value = 100.0
+        resolver.resolve("ls")
+        mock_clock.return_value = 105.0
+        resolver.resolve("ls")
+        mock_clock.return_value = 111.0
+        resolver.resolve("ls")
+
+        self.assertEqual(mock_which.call_count, 2)
+
+class TestAsyncCommands(unittest.TestCase):
+
+    def test_run_command_async_capture(self):
+        result = asyncio.run(run_command_async(
+            [sys.executable, "-c", "print('a'); print('b')"], capture_output=True
+        ))
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(result.stdout.splitlines(), ["a", "b"])
+
+    def test_run_command_async_streams_without_capture(self):
+        seen = []
+        result = asyncio.run(run_command_async(
+            [sys.executable, "-c", "print('x')"], on_stdout=seen.append
+        ))
+        self.assertEqual(seen, ["x\n"])
+        self.assertIsNone(result.stdout)
+
+    def test_run_command_async_failure(self):
+        cmd = [sys.executable, "-c", "import sys; sys.stderr.write('boom'); sys.exit(3)"]
+        with self.assertRaises(subprocess.CalledProcessError) as ctx:
+            asyncio.run(run_command_async(cmd, capture_output=True))
+        self.assertEqual(ctx.exception.returncode, 3)
+        self.assertEqual(ctx.exception.stderr, "boom")
+
+        result = asyncio.run(run_command_async(cmd, capture_output=True, check=False))
+        self.assertEqual(result.returncode, 3)
+
+    def test_run_command_async_splits_string_without_shell(self):
+        result = asyncio.run(run_command_async(f"{sys.executable} -c 'print(42)'", capture_output=True))
+        self.assertEqual(result.stdout, "42\n")
+
+    def test_run_command_async_kills_child_on_overlong_line(self):
+        created = []
+        real_exec = asyncio.create_subprocess_exec
+
+        async def spy(*args, **kwargs):
+            proc = await real_exec(*args, **kwargs)
+            created.append(proc)
+            return proc
+
+        script = "import sys, time; sys.stdout.write('x' * (2 << 20) + '\\n'); sys.stdout.flush(); time.sleep(30)"
+        start = time.monotonic()
+        with patch("asyncio.create_subprocess_exec", spy):
+            with self.assertRaises((ValueError, asyncio.LimitOverrunError)):
+                asyncio.run(run_command_async([sys.executable, "-c", script], capture_output=True))
+        self.assertIsNotNone(created[0].returncode)
+        self.assertLess(time.monotonic() - start, 10)
+
+    def test_run_many_is_concurrent_and_ordered(self):
+        commands = [[sys.executable, "-c", f"import time; time.sleep(0.5); print({i})"] for i in range(4)]
+        start = time.monotonic()
+        results = run_many(commands, concurrency=4, capture_output=True)
+        elapsed = time.monotonic() - start
+
+        self.assertEqual([r.stdout.strip() for r in results], ["0", "1", "2", "3"])
+        # Serial execution would take >= 2s.
+        self.assertLess(elapsed, 1.8)
+
+class TestStreamCommand(unittest.TestCase):
+
+    def test_stream_lines(self):
+        lines = list(stream_command([sys.executable, "-c", "for i in range(3): print(i)"]))
+        self.assertEqual(lines, ["0\n", "1\n", "2\n"])
+
+    def test_stream_binary_chunks(self):
+        chunks = list(stream_command(
+            [sys.executable, "-c", "import sys; sys.stdout.write('x' * 10000)"],
+            binary=True, chunk_size=1024
+        ))
+        self.assertTrue(all(isinstance(c, bytes) and len(c) <= 1024 for c in chunks))
+        self.assertEqual(b"".join(chunks), b"x" * 10000)
+
+    def test_stream_failure_keeps_stderr_tail(self):
+        script = "import sys; sys.stderr.write('a' * 5000 + 'END'); sys.exit(2)"
+        with self.assertRaises(subprocess.CalledProcessError) as ctx:
+            list(stream_command([sys.executable, "-c", script], stderr_tail_kb=1))
+        self.assertEqual(ctx.exception.returncode, 2)
+        self.assertEqual(len(ctx.exception.stderr), 1024)
+        self.assertTrue(ctx.exception.stderr.endswith("END"))
+
+    def test_stream_early_close_kills_child(self):
+        gen = stream_command([sys.executable, "-c", "import time\nwhile True: print(1, flush=True); time.sleep(0.01)"])
+        self.assertEqual(next(gen), "1\n")
+        gen.close()  # Must return promptly instead of hanging on the infinite loop.
+
 if __name__ == "__main__":
     unittest.main()